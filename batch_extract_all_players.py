@@ -7,23 +7,54 @@ Uses the safe margin white removal algorithm for consistent results.
 
 import os
 import sys
+import io
 import glob
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 from scipy import ndimage
 import time
+from integral_image import subject_mask
+from photo_cache import PhotoCache, cache_key, file_digest, pdf_page_digest
+from stage_timer import StageTimer
+from pyramid_bounds import coarse_to_fine_mask, mask_bbox
+from component_stats import ComponentStats, largest_component_mask
+from image_writer import ImageEncoder, ImageWriter
+
+def _extract_page_task(processor, page_path, output_path):
+    """Run extract_player_from_page in a worker and capture what it prints and its stage timings."""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        success = processor.extract_player_from_page(page_path, output_path)
+    return success, log.getvalue(), processor.timer.take_events()
 
 class BatchPlayerExtractor:
     """
     Batch processor for extracting all player photos from PDF pages.
     """
     
-    def __init__(self, white_threshold=225, blue_threshold=50, safety_margin=2):
+    # Cache algorithm name; bump when the extraction logic changes
+    ALGORITHM = "batch_safe_margin_v1"
+    
+    def __init__(self, white_threshold=225, blue_threshold=50, safety_margin=2, timer=None,
+                 pyramid_scale=None, encoder=None, encode_threads=2, encode_queue=4):
         self.white_threshold = white_threshold
         self.blue_threshold = blue_threshold
         self.safety_margin = safety_margin
+        # Split the content into components at 1/pyramid_scale first (e.g. 4 or 8); None for full resolution only
+        self.pyramid_scale = pyramid_scale
+        self.timer = timer or StageTimer()
+        # Output format; serial and streaming runs encode on encode_threads background threads
+        # (0 to save on the main thread), with at most encode_queue photos in flight
+        self.encoder = encoder or ImageEncoder()
+        self.encode_threads = encode_threads
+        self.encode_queue = encode_queue
+        self.writer = None
         self.processed_count = 0
         self.error_count = 0
+        self.cached_count = 0
         self.start_time = time.time()
         
     def is_white_pixel(self, rgb):
@@ -79,89 +110,149 @@ class BatchPlayerExtractor:
         # Everything else is subject
         return True
     
+    def subject_mask(self, img_array):
+        """Vectorized is_subject_pixel over the whole image."""
+        return subject_mask(img_array, self.white_threshold, self.blue_threshold,
+                            window=5, min_count=4)
+    
     def detect_content_with_safety_margin(self, img_array):
         """Detect content and apply safety margin."""
-        height, width = img_array.shape[:2]
+        if self.pyramid_scale:
+            return self.detect_content_coarse_to_fine(img_array)
         
         # Create content mask
-        content_mask = np.zeros((height, width), dtype=bool)
+        with self.timer.stage('mask'):
+            content_mask = self.subject_mask(img_array)
         
-        # Scan every pixel
-        for y in range(height):
-            for x in range(width):
-                if self.is_subject_pixel(img_array[y, x], (y, x), img_array):
-                    content_mask[y, x] = True
+        return self.refine_content_mask(content_mask)
+    
+    def detect_content_bounds(self, img_array):
+        """
+        Bounding box (y_min, y_max, x_min, x_max) of the subject, or None.
+        Same box as the mask from detect_content_with_safety_margin, but read straight
+        from the component statistics instead of building the largest-component mask.
+        """
+        if self.pyramid_scale:
+            content_mask = self.detect_content_coarse_to_fine(img_array)
+            with self.timer.stage('bounds'):
+                return mask_bbox(content_mask)
         
-        # Apply morphological operations
-        content_mask = ndimage.binary_fill_holes(content_mask)
-        content_mask = ndimage.binary_erosion(content_mask, iterations=1)
-        content_mask = ndimage.binary_dilation(content_mask, iterations=1)
+        # Create content mask
+        with self.timer.stage('mask'):
+            content_mask = self.subject_mask(img_array)
+        
+        content_mask = self.clean_content_mask(content_mask)
+        
+        # Bounding box of the largest connected component
+        with self.timer.stage('labelling'):
+            return ComponentStats(content_mask).largest_bbox()
+    
+    def detect_content_coarse_to_fine(self, img_array):
+        """
+        Same mask as detect_content_with_safety_margin, but the content is split into
+        components at 1/pyramid_scale first and the morphology and labelling only run
+        around the components that can hold the subject.
+        """
+        with self.timer.stage('mask'):
+            content_mask = self.subject_mask(img_array)
+        
+        with self.timer.stage('coarse'):
+            return coarse_to_fine_mask(content_mask, self.pyramid_scale, self.clean_content_mask)
+    
+    def clean_content_mask(self, content_mask):
+        """Fill holes, then erode and dilate once."""
+        with self.timer.stage('morphology'):
+            content_mask = ndimage.binary_fill_holes(content_mask)
+            content_mask = ndimage.binary_erosion(content_mask, iterations=1)
+            content_mask = ndimage.binary_dilation(content_mask, iterations=1)
+        return content_mask
+    
+    def refine_content_mask(self, content_mask):
+        """Morphological clean-up and largest connected component of a raw subject mask."""
+        content_mask = self.clean_content_mask(content_mask)
         
         # Find largest connected component
-        labeled_array, num_features = ndimage.label(content_mask)
-        if num_features > 0:
-            component_sizes = ndimage.sum(content_mask, labeled_array, range(1, num_features + 1))
-            largest_component = np.argmax(component_sizes) + 1
-            content_mask = (labeled_array == largest_component)
+        with self.timer.stage('labelling'):
+            content_mask = largest_component_mask(content_mask)
         
         return content_mask
     
     def find_content_bounds_with_safety_margin(self, mask):
         """Find content bounds and apply 2px safety margin from all sides."""
-        rows = np.any(mask, axis=1)
-        cols = np.any(mask, axis=0)
+        return self.apply_safety_margin(mask_bbox(mask), mask.shape)
+    
+    def apply_safety_margin(self, bbox, shape):
+        """
+        Shrink a (y_min, y_max, x_min, x_max) content box by the safety margin on all sides.
         
-        if not np.any(rows) or not np.any(cols):
+        Returns:
+            tuple: ((x_min, y_min), (x_max, y_max)), or None when bbox is None
+        """
+        if bbox is None:
             return None
         
-        y_min, y_max = np.where(rows)[0][[0, -1]]
-        x_min, x_max = np.where(cols)[0][[0, -1]]
+        y_min, y_max, x_min, x_max = bbox
         
         # Apply safety margin - remove 2px from all sides
-        height, width = mask.shape
+        height, width = shape
         
         # Add safety margin
-        x_min = max(0, x_min + self.safety_margin)
-        y_min = max(0, y_min + self.safety_margin)
-        x_max = min(width, x_max - self.safety_margin)
-        y_max = min(height, y_max - self.safety_margin)
+        safe_x_min = max(0, x_min + self.safety_margin)
+        safe_y_min = max(0, y_min + self.safety_margin)
+        safe_x_max = min(width, x_max - self.safety_margin)
+        safe_y_max = min(height, y_max - self.safety_margin)
         
         # Ensure we don't have negative dimensions
-        if x_max <= x_min or y_max <= y_min:
-            rows = np.any(mask, axis=1)
-            cols = np.any(mask, axis=0)
-            y_min, y_max = np.where(rows)[0][[0, -1]]
-            x_min, x_max = np.where(cols)[0][[0, -1]]
+        if safe_x_max <= safe_x_min or safe_y_max <= safe_y_min:
+            return (x_min, y_min), (x_max, y_max)
         
-        return (x_min, y_min), (x_max, y_max)
+        return (safe_x_min, safe_y_min), (safe_x_max, safe_y_max)
     
     def extract_player_from_page(self, page_path, output_path):
         """Extract player photo from a single page."""
         try:
+            self.timer.page = os.path.basename(page_path)
+            
             # Load image
-            img = Image.open(page_path)
+            with self.timer.stage('load'):
+                img = Image.open(page_path)
+                img.load()
             
             # Convert to RGB
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
+            with self.timer.stage('convert'):
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                page_array = np.asarray(img)
             
-            # Get image dimensions
-            width, height = img.size
+            return self.extract_player_from_array(page_array, output_path,
+                                                  os.path.basename(page_path))
+            
+        except Exception as e:
+            print(f"  ❌ Error processing {os.path.basename(page_path)}: {e}")
+            return False
+    
+    def extract_player_from_array(self, page_array, output_path, page_name, left_half=True):
+        """
+        Extract player photo from an RGB page array (e.g. a rendered pixmap).
+        Pass left_half=False when the array is already just the photo panel.
+        """
+        try:
+            self.timer.page = page_name
             
-            # Crop the left half (where the player photo is)
-            crop_width = width // 2
-            left_crop = img.crop((0, 0, crop_width, height))
+            # Get image dimensions
+            height, width = page_array.shape[:2]
             
-            # Convert to numpy array
-            img_array = np.array(left_crop)
+            # Crop the left half (where the player photo is) - a view, no copy
+            crop_width = width // 2 if left_half else width
+            img_array = page_array[:, :crop_width, :3]
             
             # Detect content
-            content_mask = self.detect_content_with_safety_margin(img_array)
+            bbox = self.detect_content_bounds(img_array)
             
-            # Find content bounds with safety margin
-            bounds = self.find_content_bounds_with_safety_margin(content_mask)
+            # Content bounds with safety margin
+            bounds = self.apply_safety_margin(bbox, img_array.shape[:2])
             if bounds is None:
-                print(f"  ⚠️  No content found in {os.path.basename(page_path)}")
+                print(f"  ⚠️  No content found in {page_name}")
                 return False
             
             (x_min, y_min), (x_max, y_max) = bounds
@@ -173,27 +264,206 @@ class BatchPlayerExtractor:
             y_max = min(height, y_max)
             
             # Final crop
-            final_img = left_crop.crop((x_min, y_min, x_max, y_max))
+            with self.timer.stage('crop'):
+                final_img = Image.fromarray(np.ascontiguousarray(img_array[y_min:y_max, x_min:x_max]), 'RGB')
             
-            # Save result
-            final_img.save(output_path, 'PNG', quality=95)
+            # Save result (queued on the writer threads when they are running)
+            with self.timer.stage('save'):
+                if self.writer:
+                    self.writer.submit(final_img, output_path, page=page_name)
+                else:
+                    self.encoder.save(final_img, output_path)
             
             return True
             
         except Exception as e:
-            print(f"  ❌ Error processing {os.path.basename(page_path)}: {e}")
+            print(f"  ❌ Error processing {page_name}: {e}")
             return False
     
-    def process_all_pages(self, screenshots_dir, players_dir):
-        """Process all pages in the screenshots directory."""
+    def cache_params(self):
+        """Parameters that change the extracted photo; part of the cache key."""
+        return {
+            'white_threshold': self.white_threshold,
+            'blue_threshold': self.blue_threshold,
+            'safety_margin': self.safety_margin,
+        }
+    
+    def _start_writer(self):
+        """Start the background writer threads, if enabled."""
+        if self.encode_threads > 0:
+            self.writer = ImageWriter(self.encoder, threads=self.encode_threads,
+                                      queue_depth=self.encode_queue, timer=self.timer)
+    
+    def _finish_writer(self, cache):
+        """Wait for queued photos; failed writes count as errors and are dropped from the cache."""
+        if self.writer is None:
+            return
+        failures = self.writer.close()
+        self.writer = None
+        for output_path, e in failures:
+            print(f"  ❌ Error writing {os.path.basename(output_path)}: {e}")
+            self.processed_count -= 1
+            self.error_count += 1
+            cache.forget(output_path)
+    
+    def _report_page(self, i, total_pages, success, cached=False):
+        """Print the result for one page and update the counts."""
+        if cached:
+            self.processed_count += 1
+            self.cached_count += 1
+            print("✅ (unchanged, cached)")
+        elif success:
+            self.processed_count += 1
+            print("✅")
+        else:
+            self.error_count += 1
+            print("❌")
+        
+        # Show progress every 10 pages
+        if i % 10 == 0:
+            elapsed = time.time() - self.start_time
+            avg_time = elapsed / i
+            remaining = (total_pages - i) * avg_time
+            print(f"    Progress: {i}/{total_pages} ({i/total_pages*100:.1f}%) - ETA: {remaining/60:.1f}min")
+    
+    def _process_pages_serial(self, page_files, output_paths, fresh, on_success):
+        """Process pages one at a time on the current process."""
+        total_pages = len(page_files)
+        for i, (page_path, output_path) in enumerate(zip(page_files, output_paths), 1):
+            print(f"[{i:3d}/{total_pages}] Processing {os.path.basename(page_path)}...", end=" ")
+            
+            if fresh[i - 1]:
+                self._report_page(i, total_pages, True, cached=True)
+                continue
+            
+            # Extract player photo
+            success = self.extract_player_from_page(page_path, output_path)
+            if success:
+                on_success(i - 1)
+            self._report_page(i, total_pages, success)
+    
+    def _process_pages_parallel(self, page_files, output_paths, fresh, on_success, workers):
+        """Distribute pages across a process pool, reporting in page order."""
+        total_pages = len(page_files)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [None if is_fresh else executor.submit(_extract_page_task, self, page_path, output_path)
+                       for page_path, output_path, is_fresh in zip(page_files, output_paths, fresh)]
+            
+            for i, (page_path, future) in enumerate(zip(page_files, futures), 1):
+                print(f"[{i:3d}/{total_pages}] Processing {os.path.basename(page_path)}...", end=" ")
+                
+                if future is None:
+                    self._report_page(i, total_pages, True, cached=True)
+                    continue
+                
+                # A crashed worker only fails its own page
+                try:
+                    success, log, events = future.result()
+                    self.timer.extend(events)
+                except Exception as e:
+                    success, log = False, f"  ❌ Error processing {os.path.basename(page_path)}: {e}\n"
+                
+                print(log, end="")
+                if success:
+                    on_success(i - 1)
+                self._report_page(i, total_pages, success)
+    
+    def process_pdf_stream(self, pdf_path, players_dir, screenshots_dir=None, dpi=300, regions=None,
+                           force=False):
+        """
+        Render each PDF page in memory and extract the player straight from the pixmap.
+        Skips the PNG encode/write/decode round trip through screenshots/; pass
+        screenshots_dir to still keep the intermediate page images.
+        With regions (see extract_pdf_pages.PLAYER_SLIDE_REGIONS), only the 'photo'
+        clip is rasterized, at its own DPI, instead of the full page.
+        Pages whose content and parameters are unchanged are not rendered unless force is set.
+        """
+        print("BATCH EXTRACT ALL PLAYERS (STREAMING)")
+        print("="*60)
+        print(f"PDF: {pdf_path}")
+        print(f"Players directory: {players_dir}")
+        print(f"Screenshots directory: {screenshots_dir or 'not saved'}")
+        print("-" * 60)
+        
+        import fitz  # PyMuPDF, only needed for streaming mode
+        from extract_pdf_pages import iter_page_arrays, iter_page_regions
+        
+        with fitz.open(pdf_path) as doc:
+            total_pages = len(doc)
+            print(f"Found {total_pages} pages to process")
+            print("-" * 60)
+            
+            # Cache keys cover the render settings as well as the extraction parameters
+            params = dict(self.cache_params(), dpi=dpi,
+                          regions={name: list(region) for name, region in (regions or {}).items()})
+            cache = PhotoCache(players_dir)
+            output_paths = [os.path.join(players_dir, f"player_{page_number:03d}{self.encoder.extension}")
+                            for page_number in range(1, total_pages + 1)]
+            keys = [cache_key(pdf_page_digest(doc, page_number), self.ALGORITHM, params)
+                    for page_number in range(1, total_pages + 1)]
+            fresh = [not force and cache.is_fresh(output_path, key)
+                     for output_path, key in zip(output_paths, keys)]
+            
+            def render(page_number):
+                """(page_array, left_half, pix) of one page; page_array is a view of pix."""
+                if regions:
+                    _, region_arrays = next(iter_page_regions(
+                        doc, regions, screenshots_dir=screenshots_dir, page_numbers=[page_number],
+                        timer=self.timer))
+                    page_array, pix = region_arrays['photo']
+                    return page_array, False, pix
+                _, page_array, pix = next(iter_page_arrays(
+                    doc, dpi=dpi, screenshots_dir=screenshots_dir, page_numbers=[page_number],
+                    timer=self.timer))
+                return page_array, True, pix
+            
+            self._start_writer()
+            try:
+                for i, page_number in enumerate(range(1, total_pages + 1), 1):
+                    page_name = f"page_{page_number:03d}.png"
+                    output_path = output_paths[page_number - 1]
+                    
+                    print(f"[{i:3d}/{total_pages}] Processing {page_name}...", end=" ")
+                    
+                    if fresh[page_number - 1]:
+                        self._report_page(i, total_pages, True, cached=True)
+                        continue
+                    
+                    # A page that fails to render only fails itself, as in screenshot mode.
+                    # page_array is a view of pix, which stays alive until the next page
+                    try:
+                        page_array, left_half, pix = render(page_number)
+                    except Exception as e:
+                        print(f"  ❌ Error rendering {page_name}: {e}")
+                        self._report_page(i, total_pages, False)
+                        continue
+                    
+                    success = self.extract_player_from_array(page_array, output_path, page_name,
+                                                             left_half=left_half)
+                    if success:
+                        cache.record(output_path, keys[page_number - 1], f"{pdf_path}#{page_number}",
+                                     self.ALGORITHM, params)
+                    self._report_page(i, total_pages, success)
+            finally:
+                self._finish_writer(cache)
+                cache.save()
+        
+        self.print_summary(total_pages)
+    
+    def process_all_pages(self, screenshots_dir, players_dir, workers=1, force=False):
+        """
+        Process all pages in the screenshots directory.
+        Pages whose image and parameters are unchanged are skipped unless force is set.
+        """
         print("BATCH EXTRACT ALL PLAYERS")
         print("="*60)
         print(f"Screenshots directory: {screenshots_dir}")
         print(f"Players directory: {players_dir}")
+        print(f"Workers: {workers}")
         print("-" * 60)
         
         # Get all page files
-        page_files = sorted(glob.glob(os.path.join(screenshots_dir, "page_*.png")))
+        page_files = sorted(glob.glob(os.path.join(screenshots_dir, "page_[0-9][0-9][0-9].png")))
         
         if not page_files:
             print("❌ No page files found in screenshots directory!")
@@ -203,41 +473,46 @@ class BatchPlayerExtractor:
         print(f"Found {total_pages} pages to process")
         print("-" * 60)
         
-        # Process each page
-        for i, page_path in enumerate(page_files, 1):
-            page_name = os.path.basename(page_path)
-            page_number = page_name.replace("page_", "").replace(".png", "")
-            
-            # Create output filename
-            output_filename = f"player_{page_number.zfill(3)}.png"
-            output_path = os.path.join(players_dir, output_filename)
-            
-            print(f"[{i:3d}/{total_pages}] Processing {page_name}...", end=" ")
-            
-            # Extract player photo
-            success = self.extract_player_from_page(page_path, output_path)
-            
-            if success:
-                self.processed_count += 1
-                print("✅")
+        # Create output filenames
+        output_paths = []
+        for page_path in page_files:
+            page_number = os.path.basename(page_path).replace("page_", "").replace(".png", "")
+            output_filename = f"player_{page_number.zfill(3)}{self.encoder.extension}"
+            output_paths.append(os.path.join(players_dir, output_filename))
+        
+        # Skip pages whose cache key is unchanged
+        params = self.cache_params()
+        cache = PhotoCache(players_dir)
+        keys = [cache_key(file_digest(page_path), self.ALGORITHM, params) for page_path in page_files]
+        fresh = [not force and cache.is_fresh(output_path, key)
+                 for output_path, key in zip(output_paths, keys)]
+        
+        def on_success(index):
+            cache.record(output_paths[index], keys[index], page_files[index], self.ALGORITHM, params)
+        
+        try:
+            if workers > 1:
+                self._process_pages_parallel(page_files, output_paths, fresh, on_success, workers)
             else:
-                self.error_count += 1
-                print("❌")
-            
-            # Show progress every 10 pages
-            if i % 10 == 0:
-                elapsed = time.time() - self.start_time
-                avg_time = elapsed / i
-                remaining = (total_pages - i) * avg_time
-                print(f"    Progress: {i}/{total_pages} ({i/total_pages*100:.1f}%) - ETA: {remaining/60:.1f}min")
-        
-        # Final summary
+                self._start_writer()
+                try:
+                    self._process_pages_serial(page_files, output_paths, fresh, on_success)
+                finally:
+                    self._finish_writer(cache)
+        finally:
+            cache.save()
+        
+        self.print_summary(total_pages)
+    
+    def print_summary(self, total_pages):
+        """Print the final batch summary."""
         elapsed = time.time() - self.start_time
         print("\n" + "="*60)
         print("BATCH PROCESSING COMPLETE")
         print("="*60)
         print(f"Total pages processed: {total_pages}")
         print(f"Successfully extracted: {self.processed_count}")
+        print(f"Unchanged (cached): {self.cached_count}")
         print(f"Errors: {self.error_count}")
         print(f"Success rate: {self.processed_count/total_pages*100:.1f}%")
         print(f"Total time: {elapsed/60:.1f} minutes")
@@ -251,12 +526,46 @@ class BatchPlayerExtractor:
 
 def main():
     """Main function for batch processing."""
+    parser = argparse.ArgumentParser(description="Extract player photos from all screenshot pages.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes for screenshots/ (default: 1, serial; not with --pdf)")
+    parser.add_argument("--pdf",
+                        help="render this PDF in memory instead of reading screenshots/")
+    parser.add_argument("--save-screenshots", action="store_true",
+                        help="with --pdf, also write the page images to screenshots/ (screenshots/regions/ with --regions)")
+    parser.add_argument("--force", action="store_true",
+                        help="reprocess every page, even if the players/ cache manifest says it is unchanged")
+    parser.add_argument("--regions", action="store_true",
+                        help="with --pdf, render only the photo panel instead of the full page")
+    parser.add_argument("--pyramid", type=int, choices=[4, 8],
+                        help="locate the subject at 1/4 or 1/8 scale first, then refine at full resolution")
+    parser.add_argument("--format", choices=["png", "webp", "jpeg"], default="png",
+                        help="output format: PNG, lossless WebP or JPEG (default: png)")
+    parser.add_argument("--compress-level", type=int, choices=range(10), metavar="0-9",
+                        help="PNG zlib compress level (default: 6, or 1 with --fast-encode)")
+    parser.add_argument("--fast-encode", action="store_true",
+                        help="favour encode speed over file size, for iteration runs")
+    parser.add_argument("--encode-threads", type=int, default=2,
+                        help="background encoder threads, 0 to save on the main thread (default: 2)")
+    parser.add_argument("--encode-queue", type=int, default=4,
+                        help="photos in flight on the encoder threads before extraction waits (default: 4)")
+    parser.add_argument("--trace",
+                        help="write per-page stage timings here (.jsonl for JSON Lines, else Chrome trace)")
+    args = parser.parse_args()
+    if args.pdf and args.workers > 1:
+        # Streaming mode renders and extracts on one process; don't silently drop the workers
+        parser.error("--workers is not supported with --pdf (streaming runs serially)")
+    
     # Directory paths
     screenshots_dir = "screenshots"
     players_dir = "players"
     
-    # Check if screenshots directory exists
-    if not os.path.exists(screenshots_dir):
+    # Check if the input exists
+    if args.pdf:
+        if not os.path.exists(args.pdf):
+            print(f"❌ PDF file not found: {args.pdf}")
+            return
+    elif not os.path.exists(screenshots_dir):
         print(f"❌ Screenshots directory not found: {screenshots_dir}")
         return
     
@@ -267,11 +576,32 @@ def main():
     processor = BatchPlayerExtractor(
         white_threshold=225,
         blue_threshold=50,
-        safety_margin=2
+        safety_margin=2,
+        timer=StageTimer(enabled=bool(args.trace)),
+        pyramid_scale=args.pyramid,
+        encoder=ImageEncoder(args.format, compress_level=args.compress_level, fast=args.fast_encode),
+        encode_threads=args.encode_threads,
+        encode_queue=args.encode_queue
     )
     
     # Process all pages
-    processor.process_all_pages(screenshots_dir, players_dir)
+    if args.pdf:
+        regions = None
+        if args.regions:
+            from extract_pdf_pages import PLAYER_SLIDE_REGIONS, REGIONS_SUBDIR
+            regions = PLAYER_SLIDE_REGIONS
+            screenshots_dir = os.path.join(screenshots_dir, REGIONS_SUBDIR)
+        processor.process_pdf_stream(args.pdf, players_dir,
+                                     screenshots_dir=screenshots_dir if args.save_screenshots else None,
+                                     regions=regions, force=args.force)
+    else:
+        processor.process_all_pages(screenshots_dir, players_dir, workers=args.workers,
+                                    force=args.force)
+    
+    if args.trace:
+        processor.timer.print_summary()
+        processor.timer.write_trace(args.trace)
+        print(f"Stage trace written to: {args.trace}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK EXTRACTORS
+Benchmark every crop/white-removal strategy on a synthetic player page.
+Reports throughput and peak memory per strategy and fails when a strategy regresses
+against the tracked baseline (benchmark_baseline.json).
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+import importlib
+import tracemalloc
+from PIL import Image, ImageDraw
+import numpy as np
+
+DATA_EXTRACTION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "data", "data_extraction")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+MIN_SECONDS_DELTA = 0.005
+MIN_PEAK_MB_DELTA = 1.0
+
+# A4 portrait, like the exported player deck (2480x3508 at 300 DPI)
+PAGE_SIZE_INCHES = (8.27, 11.69)
+
+def make_synthetic_page(dpi=72, seed=0):
+    """
+    Draw a player-like slide: white background, a subject on the left half
+    (hair, face, white collar, coloured shirt) and blue text on the right half.
+
+    Args:
+        dpi (int): Resolution of the page
+        seed (int): Seed for the shirt texture
+
+    Returns:
+        PIL.Image: RGB page
+    """
+    width = int(PAGE_SIZE_INCHES[0] * dpi)
+    height = int(PAGE_SIZE_INCHES[1] * dpi)
+    page = Image.new('RGB', (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(page)
+
+    def box(x0, y0, x1, y1):
+        return (int(x0 * width), int(y0 * height), int(x1 * width), int(y1 * height))
+
+    # Subject on the left half
+    draw.rectangle(box(0.06, 0.30, 0.44, 0.62), fill=(30, 80, 160))      # shirt
+    draw.rectangle(box(0.19, 0.28, 0.31, 0.34), fill=(250, 250, 250))    # white collar
+    draw.ellipse(box(0.16, 0.10, 0.34, 0.29), fill=(205, 150, 115))      # face
+    draw.ellipse(box(0.16, 0.08, 0.34, 0.16), fill=(35, 25, 20))         # hair
+    draw.rectangle(box(0.20, 0.18, 0.24, 0.19), fill=(20, 20, 20))       # eyes
+    draw.rectangle(box(0.26, 0.18, 0.30, 0.19), fill=(20, 20, 20))
+
+    # Shirt texture, so edge/variance detectors have something to find
+    rng = np.random.default_rng(seed)
+    page_array = np.array(page)
+    x0, y0, x1, y1 = box(0.06, 0.36, 0.44, 0.62)
+    noise = rng.integers(-25, 26, size=(y1 - y0, x1 - x0, 3))
+    page_array[y0:y1, x0:x1] = np.clip(page_array[y0:y1, x0:x1].astype(int) + noise, 0, 255)
+    page = Image.fromarray(page_array.astype(np.uint8))
+    draw = ImageDraw.Draw(page)
+
+    # Blue text on the right half
+    line_height = max(12, height // 40)
+    for i, line in enumerate(["Name: Synthetic Player", "Age: 27", "Category: All Rounder",
+                              "Mobile: 9000000000", "Icon Player: No"]):
+        draw.text((int(0.55 * width), int(0.20 * height) + i * 2 * line_height), line, fill=(20, 40, 200))
+
+    return page
+
+def _left_half(page):
+    width, height = page.size
+    return page.crop((0, 0, width // 2, height))
+
+def _page_strategy(module_name, func_name):
+    """Strategy for the extract_player_photo_* functions (input_path, output_path)."""
+    def run(page_path, page, output_path):
+        getattr(importlib.import_module(module_name), func_name)(page_path, output_path)
+    return run
+
+def _remover_strategy(module_name, class_name):
+    """Strategy for the *WhiteRemover classes (process_image on the left half)."""
+    def run(page_path, page, output_path):
+        remover = getattr(importlib.import_module(module_name), class_name)()
+        left_path = output_path + ".left.png"
+        _left_half(page).save(left_path)
+        remover.process_image(left_path, output_path)
+    return run
+
+def _image_strategy(module_name, func_name, *extra_args):
+    """Strategy for the in-memory crop heuristics (image, ...) -> image."""
+    def run(page_path, page, output_path):
+        func = getattr(importlib.import_module(module_name), func_name)
+        func(_left_half(page), *extra_args)
+    return run
+
+def _batch_strategy(page_path, page, output_path):
+    from batch_extract_all_players import BatchPlayerExtractor
+    BatchPlayerExtractor().extract_player_from_page(page_path, output_path)
+
+STRATEGIES = {
+    'batch_extract_all_players': _batch_strategy,
+    'safe_margin_white_removal': _remover_strategy('safe_margin_white_removal', 'SafeMarginWhiteRemover'),
+    'final_single_pixel_removal': _remover_strategy('final_single_pixel_removal', 'FinalSinglePixelRemover'),
+    'ultra_aggressive_white_removal': _remover_strategy('ultra_aggressive_white_removal', 'UltraAggressiveWhiteRemover'),
+    'pixel_perfect_white_removal': _remover_strategy('pixel_perfect_white_removal', 'PixelPerfectWhiteRemover'),
+    'extract_player_photo': _page_strategy('extract_player_photo', 'extract_player_photo'),
+    'extract_player_photo_aggressive': _page_strategy('extract_player_photo_aggressive', 'extract_player_photo_aggressive'),
+    'extract_player_photo_improved': _page_strategy('extract_player_photo_improved', 'extract_player_photo_improved'),
+    'extract_player_photo_systematic': _page_strategy('extract_player_photo_systematic', 'extract_subject_with_precise_bounds'),
+    'extract_player_photo_ultra_precise': _page_strategy('extract_player_photo_ultra_precise', 'extract_player_photo_ultra_precise'),
+    'face_focused_extraction': _image_strategy('face_focused_extraction', 'face_focused_crop', 0),
+    'advanced_marker_detection': _image_strategy('advanced_marker_detection', 'detect_and_crop_visual_markers', 0, 0),
+    'improved_photo_extraction': _image_strategy('improved_photo_extraction', 'intelligent_crop_player_photo', 0),
+    'simple_photo_extraction': _image_strategy('simple_photo_extraction', 'smart_crop_for_player'),
+}
+
+def benchmark_strategy(name, run, page_path, page, work_dir, repeat=3):
+    """
+    Time a strategy and measure its peak traced memory.
+
+    Returns:
+        dict: seconds_per_page, pages_per_second, megapixels_per_second, peak_mb;
+              skipped when a dependency is not installed here, error when the strategy fails
+    """
+    output_path = os.path.join(work_dir, f"{name}.png")
+    megapixels = page.size[0] * page.size[1] / 1e6
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            # Warm-up run also pays for the module import
+            run(page_path, page, output_path)
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run(page_path, page, output_path)
+                timings.append(time.perf_counter() - start)
+
+            # Separate run for memory, tracemalloc slows Python loops down
+            tracemalloc.start()
+            try:
+                run(page_path, page, output_path)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    except ImportError as e:
+        return {'skipped': f"missing dependency: {e.name}"}
+    except Exception as e:
+        return {'error': str(e)}
+
+    seconds = min(timings)
+    return {
+        'seconds_per_page': seconds,
+        'pages_per_second': 1 / seconds if seconds > 0 else float('inf'),
+        'megapixels_per_second': megapixels / seconds if seconds > 0 else float('inf'),
+        'peak_mb': peak / 1e6,
+    }
+
+def _is_measured(result):
+    return result is not None and 'pages_per_second' in result
+
+def find_regressions(results, baseline, tolerance):
+    """
+    Compare results against the baseline; returns a list of messages.
+    A strategy that fails where the baseline has timings for it is a regression too.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not _is_measured(base):
+            continue
+        if 'error' in result:
+            regressions.append(f"{name}: failed ({result['error']}), "
+                               f"baseline {base['pages_per_second']:.2f} pages/s")
+            continue
+        if not _is_measured(result):
+            continue
+        # Absolute floors keep timer and allocator noise on tiny numbers from failing the run
+        if (result['pages_per_second'] < base['pages_per_second'] * (1 - tolerance) and
+                result['seconds_per_page'] - base['seconds_per_page'] > MIN_SECONDS_DELTA):
+            regressions.append(f"{name}: {result['pages_per_second']:.2f} pages/s "
+                               f"(baseline {base['pages_per_second']:.2f})")
+        if (result['peak_mb'] > base['peak_mb'] * (1 + tolerance) and
+                result['peak_mb'] - base['peak_mb'] > MIN_PEAK_MB_DELTA):
+            regressions.append(f"{name}: {result['peak_mb']:.1f} MB peak "
+                               f"(baseline {base['peak_mb']:.1f})")
+    return regressions
+
+def main():
+    """Main function for the extractor benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the player photo extraction strategies.")
+    parser.add_argument("--dpi", type=int, default=72, help="synthetic page resolution (default: 72)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per strategy (default: 3)")
+    parser.add_argument("--strategies", nargs="+", choices=sorted(STRATEGIES),
+                        help="only run these strategies")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write the results as the new baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown / memory growth before failing (default: 0.25)")
+    parser.add_argument("--allow-missing-baseline", action="store_true",
+                        help="pass when the baseline has no entry for this DPI instead of failing")
+    args = parser.parse_args()
+
+    sys.path.insert(0, DATA_EXTRACTION_DIR)
+    names = args.strategies or list(STRATEGIES)
+
+    page = make_synthetic_page(dpi=args.dpi)
+    print("BENCHMARK EXTRACTORS")
+    print("="*60)
+    print(f"Synthetic page: {page.size[0]}x{page.size[1]} at {args.dpi} DPI")
+    print("-" * 60)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        page_path = os.path.join(work_dir, "page_001.png")
+        page.save(page_path)
+
+        print(f"{'Strategy':36s} {'s/page':>9s} {'pages/s':>9s} {'MP/s':>8s} {'peak MB':>8s}")
+        for name in names:
+            result = benchmark_strategy(name, STRATEGIES[name], page_path, page, work_dir, args.repeat)
+            results[name] = result
+            if 'skipped' in result:
+                print(f"{name:36s} skipped ({result['skipped']})")
+            elif 'error' in result:
+                print(f"{name:36s} failed ({result['error']})")
+            else:
+                print(f"{name:36s} {result['seconds_per_page']:9.3f} {result['pages_per_second']:9.2f} "
+                      f"{result['megapixels_per_second']:8.2f} {result['peak_mb']:8.1f}")
+
+    print("="*60)
+
+    # Baselines are per DPI, since throughput depends on page size
+    dpi_key = str(args.dpi)
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baselines = json.load(f)
+
+    # A strategy that raises is a failure, whatever the baseline says
+    failures = [f"{name}: {result['error']}" for name, result in results.items() if 'error' in result]
+    if failures:
+        print("❌ Failed strategies:")
+        for message in failures:
+            print(f"  - {message}")
+
+    if args.update_baseline:
+        if failures:
+            print(f"Baseline not written to {args.baseline}; fix the failed strategies first.")
+            return 1
+        # Only measured strategies; skipped ones have nothing to compare against
+        baselines.setdefault(dpi_key, {}).update(
+            {name: result for name, result in results.items() if _is_measured(result)})
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if dpi_key not in baselines:
+        print(f"No baseline for {args.dpi} DPI in {args.baseline}; run with --update-baseline to create one.")
+        return 1 if failures or not args.allow_missing_baseline else 0
+
+    regressions = find_regressions(results, baselines[dpi_key], args.tolerance)
+    if regressions:
+        print("❌ Performance regressions:")
+        for message in regressions:
+            print(f"  - {message}")
+    if failures or regressions:
+        return 1
+
+    print("✅ No regressions against the baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+COMPONENT STATS
+Connected-component analysis of a binary mask in one labelling pass.
+Returns area, bounding box and centroid for every component, so callers can take the
+bounding box of the largest component without building intermediate masks.
+Uses cv2.connectedComponentsWithStats when OpenCV is installed, scipy otherwise.
+"""
+
+from functools import cached_property
+
+import numpy as np
+from scipy import ndimage
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+class ComponentStats:
+    """
+    Per-component statistics of a binary mask. Component i has label i + 1 in labels.
+
+    Attributes:
+        labels: int32 label image (0 is background)
+        count: number of components
+        area: pixel count per component
+        bbox: (y_min, y_max, x_min, x_max) per component, inclusive (same order as pyramid_bounds.mask_bbox)
+    """
+
+    def __init__(self, mask, connectivity=4):
+        if cv2 is not None:
+            count, self.labels, stats, centroids = cv2.connectedComponentsWithStats(
+                mask.astype(np.uint8), connectivity=connectivity)
+            self.count = count - 1
+            stats = stats[1:]
+            self.area = stats[:, cv2.CC_STAT_AREA].astype(np.int64)
+            top, left = stats[:, cv2.CC_STAT_TOP], stats[:, cv2.CC_STAT_LEFT]
+            self.bbox = np.column_stack([top, top + stats[:, cv2.CC_STAT_HEIGHT] - 1,
+                                         left, left + stats[:, cv2.CC_STAT_WIDTH] - 1])
+            # OpenCV gives (x, y); store (y, x) like the scipy path
+            self.__dict__['centroid'] = centroids[1:, ::-1]
+        else:
+            # Default structure is 4-connectivity, same as ndimage.label's default
+            structure = np.ones((3, 3), dtype=bool) if connectivity == 8 else None
+            self.labels, self.count = ndimage.label(mask, structure=structure)
+            self.area = np.bincount(self.labels.ravel(), minlength=self.count + 1)[1:]
+            self.bbox = np.array([(rows.start, rows.stop - 1, cols.start, cols.stop - 1)
+                                  for rows, cols in ndimage.find_objects(self.labels)],
+                                 dtype=np.int64).reshape(-1, 4)
+
+    @cached_property
+    def centroid(self):
+        """(y, x) centroid per component."""
+        height, width = self.labels.shape
+        flat = self.labels.ravel()
+        area = np.maximum(self.area, 1)
+        ys = np.bincount(flat, weights=np.repeat(np.arange(height, dtype=np.float64), width),
+                         minlength=self.count + 1)[1:]
+        xs = np.bincount(flat, weights=np.tile(np.arange(width, dtype=np.float64), height),
+                         minlength=self.count + 1)[1:]
+        return np.column_stack([ys / area, xs / area])
+
+    def largest(self):
+        """Index of the largest component (first one on ties), or None if the mask is empty."""
+        if self.count == 0:
+            return None
+        return int(np.argmax(self.area))
+
+    def largest_bbox(self):
+        """Bounding box of the largest component as (y_min, y_max, x_min, x_max), or None."""
+        index = self.largest()
+        if index is None:
+            return None
+        return tuple(int(v) for v in self.bbox[index])
+
+    def component_mask(self, index):
+        """Boolean mask of one component."""
+        return self.labels == index + 1
+
+def largest_component_mask(mask):
+    """
+    Keep only the largest connected component of a mask.
+    An empty mask is returned unchanged.
+    """
+    stats = ComponentStats(mask)
+    index = stats.largest()
+    if index is None:
+        return mask
+    return stats.component_mask(index)
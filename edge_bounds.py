@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+EDGE-INWARD BOUNDS SCANNER
+Finds the subject bounding box by walking inward from each edge in vectorized row/column strips
+and stopping at the first strip that contains a subject pixel.
+Cost scales with the margin width instead of the image area.
+"""
+
+import numpy as np
+
+def subject_pixel_mask(block, white_threshold=240, blue_threshold=50):
+    """
+    Vectorized is_subject_pixel: not white background and not blue text.
+    Uses uint8 arithmetic, same as the per-pixel checks on image arrays.
+    """
+    r, g, b = block[..., 0], block[..., 1], block[..., 2]
+    white = (r >= white_threshold) & (g >= white_threshold) & (b >= white_threshold)
+    blue_text = (b > (r + blue_threshold)) & (b > (g + blue_threshold)) & (b > 100)
+    return ~white & ~blue_text
+
+def _first_hit(length, strip, get_mask, reverse=False):
+    """Index of the first row/column (from the start, or the end if reverse) whose mask has a hit."""
+    starts = range(length, 0, -strip) if reverse else range(0, length, strip)
+    for start in starts:
+        lo, hi = (max(0, start - strip), start) if reverse else (start, min(length, start + strip))
+        hits = np.flatnonzero(get_mask(lo, hi))
+        if hits.size:
+            return lo + (hits[-1] if reverse else hits[0])
+    return None
+
+def scan_bounds_from_edges(img_array, white_threshold=240, blue_threshold=50, strip=16):
+    """
+    Subject bounding box found by scanning inward from the four edges.
+
+    Args:
+        img_array: numpy array of the image (height, width, 3+)
+        white_threshold: threshold for white background detection
+        blue_threshold: threshold for blue text detection
+        strip: rows/columns examined per vectorized step
+
+    Returns:
+        tuple: ((x0, y0), (x1, y1)) inclusive bounds, or None if there is no subject pixel
+    """
+    height, width = img_array.shape[:2]
+
+    def mask(rows, cols):
+        return subject_pixel_mask(img_array[rows, cols], white_threshold, blue_threshold)
+
+    # Top and bottom: any subject pixel in each row of the strip
+    y0 = _first_hit(height, strip, lambda lo, hi: mask(slice(lo, hi), slice(None)).any(axis=1))
+    if y0 is None:
+        return None
+    y1 = _first_hit(height, strip, lambda lo, hi: mask(slice(lo, hi), slice(None)).any(axis=1), reverse=True)
+
+    # Left and right only need the rows between y0 and y1
+    rows = slice(y0, y1 + 1)
+    x0 = _first_hit(width, strip, lambda lo, hi: mask(rows, slice(lo, hi)).any(axis=0))
+    x1 = _first_hit(width, strip, lambda lo, hi: mask(rows, slice(lo, hi)).any(axis=0), reverse=True)
+
+    return (x0, y0), (x1, y1)
+
+def count_subject_pixels(img_array, white_threshold=240, blue_threshold=50):
+    """Full-image subject and white pixel counts (optional, costs a full pass)."""
+    subject = subject_pixel_mask(img_array, white_threshold, blue_threshold)
+    r, g, b = img_array[..., 0], img_array[..., 1], img_array[..., 2]
+    white = (r >= white_threshold) & (g >= white_threshold) & (b >= white_threshold)
+    return int(np.count_nonzero(subject)), int(np.count_nonzero(white))
@@ -5,9 +5,158 @@ Extract each page from the 2025-BCL-Players.pdf as images and save them to scree
 
 import fitz  # PyMuPDF
 import os
+import sys
+import argparse
 from pathlib import Path
+from stage_timer import StageTimer
 
-def extract_pdf_pages_as_images(pdf_path, output_dir, image_format='PNG', dpi=300):
+# pixmap_to_array is shared with the PDF image extractors in src/data/data_extraction
+DATA_EXTRACTION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "data", "data_extraction")
+if DATA_EXTRACTION_DIR not in sys.path:
+    sys.path.append(DATA_EXTRACTION_DIR)
+from pixmap_images import pixmap_to_array
+
+# Named clip rectangles as page fractions (x0, y0, x1, y1) with the DPI to render them at.
+# The player photo sits in the left half of every slide; a DPI of None skips the region.
+PLAYER_SLIDE_REGIONS = {
+    'photo': ((0.0, 0.0, 0.5, 1.0), 300),
+    'text': ((0.5, 0.0, 1.0, 1.0), None),
+}
+
+# Region images go in their own subdirectory so they are never mistaken for full pages
+REGIONS_SUBDIR = 'regions'
+
+def iter_page_arrays(doc, dpi=300, screenshots_dir=None, image_format='PNG', page_numbers=None, timer=None):
+    """
+    Render each page of an open PDF and yield it as an in-memory RGB array.
+    
+    Args:
+        doc: open fitz.Document
+        dpi (int): Resolution for the rendering
+        screenshots_dir (str): If given, also save each page here as page_NNN.<format>
+        image_format (str): Image format for the optional screenshots
+        page_numbers (list): 1-based pages to render (default: all)
+        timer (StageTimer): Records 'render' and 'save' stages if given
+    
+    Yields:
+        tuple: (page_number, page_array, pix) - page_array is a view of pix
+    """
+    timer = timer or StageTimer(enabled=False)
+    if screenshots_dir:
+        Path(screenshots_dir).mkdir(parents=True, exist_ok=True)
+    
+    # 72 is the default DPI
+    mat = fitz.Matrix(dpi/72, dpi/72)
+    
+    if page_numbers is None:
+        page_numbers = range(1, len(doc) + 1)
+    
+    for page_num in (number - 1 for number in page_numbers):
+        timer.page = f"page_{page_num + 1:03d}.png"
+        with timer.stage('render'):
+            pix = doc[page_num].get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+        
+        if screenshots_dir:
+            filename = f"page_{page_num + 1:03d}.{image_format.lower()}"
+            with timer.stage('save'):
+                pix.save(os.path.join(screenshots_dir, filename))
+        
+        yield page_num + 1, pixmap_to_array(pix), pix
+
+def region_rect(page, fractions):
+    """Convert (x0, y0, x1, y1) page fractions to a clip rectangle in page coordinates."""
+    x0, y0, x1, y1 = fractions
+    rect = page.rect
+    return fitz.Rect(rect.x0 + x0 * rect.width, rect.y0 + y0 * rect.height,
+                     rect.x0 + x1 * rect.width, rect.y0 + y1 * rect.height)
+
+def render_page_regions(page, regions=PLAYER_SLIDE_REGIONS, timer=None):
+    """
+    Render only the named regions of a page, each at its own DPI.
+    
+    Args:
+        page: fitz.Page
+        regions (dict): name -> ((x0, y0, x1, y1) page fractions, dpi or None)
+        timer (StageTimer): Records a 'render' stage per region if given
+    
+    Returns:
+        dict: name -> Pixmap for every region with a DPI
+    """
+    timer = timer or StageTimer(enabled=False)
+    pixmaps = {}
+    for name, (fractions, dpi) in regions.items():
+        if dpi is None:
+            continue
+        mat = fitz.Matrix(dpi/72, dpi/72)
+        with timer.stage('render'):
+            pixmaps[name] = page.get_pixmap(matrix=mat, clip=region_rect(page, fractions),
+                                            colorspace=fitz.csRGB, alpha=False)
+    return pixmaps
+
+def iter_page_regions(doc, regions=PLAYER_SLIDE_REGIONS, screenshots_dir=None, image_format='PNG',
+                      page_numbers=None, timer=None):
+    """
+    Render the named regions of each page and yield them as in-memory RGB arrays.
+    
+    Args:
+        doc: open fitz.Document
+        regions (dict): name -> ((x0, y0, x1, y1) page fractions, dpi or None)
+        screenshots_dir (str): If given, also save each region here as page_NNN_<name>.<format>
+        image_format (str): Image format for the optional screenshots
+        page_numbers (list): 1-based pages to render (default: all)
+        timer (StageTimer): Records 'render' and 'save' stages if given
+    
+    Yields:
+        tuple: (page_number, {name: (region_array, pix)}) - each array is a view of its pix
+    """
+    timer = timer or StageTimer(enabled=False)
+    if screenshots_dir:
+        Path(screenshots_dir).mkdir(parents=True, exist_ok=True)
+    
+    if page_numbers is None:
+        page_numbers = range(1, len(doc) + 1)
+    
+    for page_num in (number - 1 for number in page_numbers):
+        timer.page = f"page_{page_num + 1:03d}.png"
+        pixmaps = render_page_regions(doc[page_num], regions, timer)
+        
+        if screenshots_dir:
+            for name, pix in pixmaps.items():
+                filename = f"page_{page_num + 1:03d}_{name}.{image_format.lower()}"
+                with timer.stage('save'):
+                    pix.save(os.path.join(screenshots_dir, filename))
+        
+        yield page_num + 1, {name: (pixmap_to_array(pix), pix) for name, pix in pixmaps.items()}
+
+def extract_pdf_regions_as_images(pdf_path, output_dir, regions=PLAYER_SLIDE_REGIONS, image_format='PNG',
+                                  timer=None):
+    """
+    Extract the named regions of each PDF page as images, each at its own DPI.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_dir (str): Directory to save the images
+        regions (dict): name -> ((x0, y0, x1, y1) page fractions, dpi or None)
+        image_format (str): Image format (PNG, JPEG, etc.)
+        timer (StageTimer): Records per-page render/save stages if given
+    """
+    try:
+        with fitz.open(pdf_path) as doc:
+            print(f"PDF opened successfully. Total pages: {len(doc)}")
+            
+            for page_number, region_arrays in iter_page_regions(doc, regions, output_dir, image_format,
+                                                                timer=timer):
+                print(f"Extracted page {page_number}/{len(doc)}: {', '.join(region_arrays)}")
+            
+            print(f"\nExtraction completed! {len(doc)} pages saved to {output_dir}")
+        
+    except Exception as e:
+        print(f"Error processing PDF: {e}")
+        return False
+    
+    return True
+
+def extract_pdf_pages_as_images(pdf_path, output_dir, image_format='PNG', dpi=300, timer=None):
     """
     Extract each page from a PDF as images and save them to the output directory.
     
@@ -16,7 +165,10 @@ def extract_pdf_pages_as_images(pdf_path, output_dir, image_format='PNG', dpi=30
         output_dir (str): Directory to save the images
         image_format (str): Image format (PNG, JPEG, etc.)
         dpi (int): Resolution for the images
+        timer (StageTimer): Records per-page render/save stages if given
     """
+    timer = timer or StageTimer(enabled=False)
+    
     # Create output directory if it doesn't exist
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
@@ -32,15 +184,18 @@ def extract_pdf_pages_as_images(pdf_path, output_dir, image_format='PNG', dpi=30
             # Create a matrix for scaling (higher DPI = better quality)
             mat = fitz.Matrix(dpi/72, dpi/72)  # 72 is the default DPI
             
-            # Render page to pixmap
-            pix = page.get_pixmap(matrix=mat)
-            
             # Generate filename
             filename = f"page_{page_num + 1:03d}.{image_format.lower()}"
             filepath = os.path.join(output_dir, filename)
+            timer.page = filename
+            
+            # Render page to pixmap
+            with timer.stage('render'):
+                pix = page.get_pixmap(matrix=mat)
             
             # Save the image
-            pix.save(filepath)
+            with timer.stage('save'):
+                pix.save(filepath)
             
             print(f"Extracted page {page_num + 1}/{len(doc)}: {filename}")
         
@@ -54,9 +209,19 @@ def extract_pdf_pages_as_images(pdf_path, output_dir, image_format='PNG', dpi=30
     return True
 
 def main():
+    parser = argparse.ArgumentParser(description="Extract PDF pages as images.")
+    parser.add_argument("--regions", action="store_true",
+                        help="render only the named slide regions (photo panel at 300 DPI)")
+    parser.add_argument("--trace",
+                        help="write per-page stage timings here (.jsonl for JSON Lines, else Chrome trace)")
+    args = parser.parse_args()
+    timer = StageTimer(enabled=bool(args.trace))
+    
     # File paths
     pdf_path = "src/data/2025-BCL-Players.pdf"
     output_dir = "screenshots"
+    if args.regions:
+        output_dir = os.path.join(output_dir, REGIONS_SUBDIR)
     
     # Check if PDF exists
     if not os.path.exists(pdf_path):
@@ -66,11 +231,24 @@ def main():
     print(f"Extracting pages from: {pdf_path}")
     print(f"Saving images to: {output_dir}")
     print(f"Image format: PNG")
-    print(f"DPI: 300")
+    if args.regions:
+        for name, (fractions, dpi) in PLAYER_SLIDE_REGIONS.items():
+            print(f"Region {name}: {fractions} at {dpi or 'skipped'} DPI")
+    else:
+        print(f"DPI: 300")
     print("-" * 50)
     
     # Extract pages
-    success = extract_pdf_pages_as_images(pdf_path, output_dir, image_format='PNG', dpi=300)
+    if args.regions:
+        success = extract_pdf_regions_as_images(pdf_path, output_dir, PLAYER_SLIDE_REGIONS, image_format='PNG',
+                                                timer=timer)
+    else:
+        success = extract_pdf_pages_as_images(pdf_path, output_dir, image_format='PNG', dpi=300, timer=timer)
+    
+    if args.trace:
+        timer.print_summary()
+        timer.write_trace(args.trace)
+        print(f"Stage trace written to: {args.trace}")
     
     if success:
         print("\n✅ PDF page extraction completed successfully!")
@@ -8,6 +8,7 @@ import os
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 from scipy import ndimage
+from component_stats import largest_component_mask
 
 def detect_player_content(img, face_region_boost=True):
     """
@@ -74,11 +75,7 @@ def detect_player_content(img, face_region_boost=True):
     content_mask = binary_dilation(content_mask, iterations=2)
     
     # Find the largest connected component
-    labeled_array, num_features = ndimage.label(content_mask)
-    if num_features > 0:
-        component_sizes = ndimage.sum(content_mask, labeled_array, range(1, num_features + 1))
-        largest_component = np.argmax(component_sizes) + 1
-        content_mask = (labeled_array == largest_component)
+    content_mask = largest_component_mask(content_mask)
     
     return content_mask
 
@@ -8,6 +8,7 @@ import os
 from PIL import Image, ImageOps, ImageFilter
 import numpy as np
 from scipy import ndimage
+from component_stats import largest_component_mask
 
 def remove_white_background_advanced(img, white_threshold=200, blur_radius=2):
     """
@@ -52,13 +53,7 @@ def remove_white_background_advanced(img, white_threshold=200, blur_radius=2):
     content_mask = binary_dilation(content_mask, iterations=3)
     
     # Find the largest connected component (the main content)
-    labeled_array, num_features = ndimage.label(content_mask)
-    if num_features > 0:
-        # Get sizes of each component
-        component_sizes = ndimage.sum(content_mask, labeled_array, range(1, num_features + 1))
-        # Keep only the largest component
-        largest_component = np.argmax(component_sizes) + 1
-        content_mask = (labeled_array == largest_component)
+    content_mask = largest_component_mask(content_mask)
     
     # Create a new image with transparent background
     result = img.convert('RGBA')
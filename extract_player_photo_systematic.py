@@ -8,6 +8,8 @@ import os
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 
+from edge_bounds import scan_bounds_from_edges, count_subject_pixels
+
 def is_white_pixel(rgb, threshold=240):
     """
     Check if a pixel is considered white background.
@@ -30,14 +32,16 @@ def is_subject_pixel(rgb, white_threshold=240, blue_threshold=50):
     """
     return not is_white_pixel(rgb, white_threshold) and not is_blue_text_pixel(rgb, blue_threshold)
 
-def scan_image_for_subject_bounds(img_array, white_threshold=240, blue_threshold=50):
+def scan_image_for_subject_bounds(img_array, white_threshold=240, blue_threshold=50, count_pixels=False):
     """
-    Scan image pixel by pixel to find subject bounding box.
+    Find the subject bounding box by scanning inward from each edge,
+    stopping at the first row/column strip that contains subject pixels.
     
     Args:
         img_array: numpy array of the image
         white_threshold: threshold for white background detection
         blue_threshold: threshold for blue text detection
+        count_pixels: also count subject pixels (needs a full pass over the image)
     
     Returns:
         tuple: ((x0, y0), (x1, y1)) - bounding box coordinates
@@ -46,31 +50,15 @@ def scan_image_for_subject_bounds(img_array, white_threshold=240, blue_threshold
     
     print(f"Scanning image of size {width}x{height} pixels...")
     
-    # Initialize bounding box coordinates
-    x0, y0 = width, height  # Start with max values
-    x1, y1 = 0, 0           # Start with min values
-    
-    subject_pixels_found = 0
-    
-    # Scan pixel by pixel
-    for y in range(height):
-        for x in range(width):
-            rgb = img_array[y, x]
-            
-            if is_subject_pixel(rgb, white_threshold, blue_threshold):
-                subject_pixels_found += 1
-                
-                # Update bounding box
-                if x < x0:
-                    x0 = x
-                if x > x1:
-                    x1 = x
-                if y < y0:
-                    y0 = y
-                if y > y1:
-                    y1 = y
+    bounds = scan_bounds_from_edges(img_array, white_threshold, blue_threshold)
+    if bounds is None:
+        # Same empty box as the pixel scan, so callers' validation rejects it
+        bounds = (width, height), (0, 0)
+    (x0, y0), (x1, y1) = bounds
     
-    print(f"Found {subject_pixels_found} subject pixels")
+    if count_pixels:
+        subject_pixels_found, _ = count_subject_pixels(img_array, white_threshold, blue_threshold)
+        print(f"Found {subject_pixels_found} subject pixels")
     print(f"Bounding box: x({x0}, {x1}), y({y0}, {y1})")
     
     return (x0, y0), (x1, y1)
@@ -101,7 +89,7 @@ def extract_subject_with_precise_bounds(input_path, output_path, player_name="af
         img_array = np.array(left_crop)
         
         # Scan for subject bounds
-        print("Performing pixel-by-pixel scan...")
+        print("Performing edge-inward scan...")
         (x0, y0), (x1, y1) = scan_image_for_subject_bounds(
             img_array, 
             white_threshold=240, 
@@ -8,6 +8,8 @@ import os
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 from scipy import ndimage
+from feature_planes import FeaturePlanes
+from component_stats import largest_component_mask
 
 def remove_white_halo_advanced(img, white_threshold=220, edge_sensitivity=0.3):
     """
@@ -20,39 +22,30 @@ def remove_white_halo_advanced(img, white_threshold=220, edge_sensitivity=0.3):
     # Create alpha channel for transparency
     alpha = np.ones((height, width), dtype=np.uint8) * 255
     
+    # Shared feature planes, each computed once
+    planes = FeaturePlanes(img_array)
+    
     # Method 1: Detect white/light areas more precisely
     # White areas have high RGB values and low color variance
-    rgb_mean = np.mean(img_array, axis=2)
-    rgb_std = np.std(img_array, axis=2)
+    rgb_mean = planes.mean
+    rgb_std = planes.std
     
     # White detection: high mean RGB and low standard deviation
     white_mask = (rgb_mean > white_threshold) & (rgb_std < 25)
     
-    # Method 2: Edge detection to find content boundaries
-    gray = np.mean(img_array, axis=2)
-    
-    # Use multiple edge detection methods
-    sobel_x = ndimage.sobel(gray, axis=1)
-    sobel_y = ndimage.sobel(gray, axis=0)
-    sobel_magnitude = np.sqrt(sobel_x**2 + sobel_y**2)
-    
-    # Laplacian for additional edge detection
-    laplacian = ndimage.laplace(gray)
-    
-    # Combine edge detection methods
-    edge_threshold = np.percentile(sobel_magnitude, 85)
-    edge_mask = (sobel_magnitude > edge_threshold) | (np.abs(laplacian) > np.percentile(np.abs(laplacian), 80))
+    # Method 2: Edge detection to find content boundaries (Sobel + Laplacian)
+    sobel_magnitude = planes.sobel_magnitude
+    edge_threshold = planes.percentile('sobel_magnitude', 85)
+    edge_mask = (sobel_magnitude > edge_threshold) | (planes.abs_laplacian > planes.percentile('abs_laplacian', 80))
     
     # Method 3: Color gradient analysis
     # Look for areas where color changes significantly (content vs background)
-    color_gradient = np.sqrt(sobel_x**2 + sobel_y**2)
-    gradient_mask = color_gradient > np.percentile(color_gradient, 70)
+    gradient_mask = sobel_magnitude > planes.percentile('sobel_magnitude', 70)
     
     # Method 4: Local color variance (content has more color variation)
     kernel_size = 15
-    local_variance = ndimage.generic_filter(gray, np.var, size=kernel_size)
-    variance_threshold = np.percentile(local_variance, 40)
-    variance_mask = local_variance > variance_threshold
+    variance_threshold = planes.percentile(f'local_variance:{kernel_size}', 40)
+    variance_mask = planes.local_variance(kernel_size) > variance_threshold
     
     # Method 5: Skin tone and hair detection
     r, g, b = img_array[:,:,0], img_array[:,:,1], img_array[:,:,2]
@@ -71,14 +64,14 @@ def remove_white_halo_advanced(img, white_threshold=220, edge_sensitivity=0.3):
     hair_mask = (
         (rgb_mean < 100) &  # Dark
         (rgb_std > 10) &    # Some texture
-        (sobel_magnitude > np.percentile(sobel_magnitude, 60))  # Has edges
+        (sobel_magnitude > planes.percentile('sobel_magnitude', 60))  # Has edges
     )
     
     # Method 6: Clothing detection (non-white clothing)
     clothing_mask = (
         (rgb_mean < 200) &  # Not too bright
         (rgb_std > 20) &    # Has color variation
-        (sobel_magnitude > np.percentile(sobel_magnitude, 50))  # Has texture
+        (sobel_magnitude > planes.percentile('sobel_magnitude', 50))  # Has texture
     )
     
     # Combine all content detection methods
@@ -100,11 +93,7 @@ def remove_white_halo_advanced(img, white_threshold=220, edge_sensitivity=0.3):
     content_mask = binary_dilation(content_mask, iterations=2)
     
     # Find the largest connected component
-    labeled_array, num_features = ndimage.label(content_mask)
-    if num_features > 0:
-        component_sizes = ndimage.sum(content_mask, labeled_array, range(1, num_features + 1))
-        largest_component = np.argmax(component_sizes) + 1
-        content_mask = (labeled_array == largest_component)
+    content_mask = largest_component_mask(content_mask)
     
     # Create alpha channel based on content mask
     # Use a soft edge for better blending
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+FEATURE PLANES
+Per-image feature planes shared by the content-mask detectors.
+Each plane (gray, std, Sobel, Laplacian, ...) and each percentile of it is computed once, on first use.
+"""
+
+from functools import cached_property
+
+import numpy as np
+from scipy import ndimage
+
+from local_moments import local_variance
+
+class FeaturePlanes:
+    """
+    Lazily computed, memoized feature planes of one RGB image.
+    """
+
+    def __init__(self, img_array):
+        self.img_array = img_array
+        self._percentiles = {}
+        self._local_variances = {}
+
+    @cached_property
+    def gray(self):
+        """Mean of the RGB channels (same as np.mean(img_array, axis=2))."""
+        return np.mean(self.img_array, axis=2)
+
+    @property
+    def mean(self):
+        """Alias of gray, for detectors that call it rgb_mean."""
+        return self.gray
+
+    @cached_property
+    def std(self):
+        """Standard deviation across the RGB channels."""
+        return np.std(self.img_array, axis=2)
+
+    @cached_property
+    def sobel_x(self):
+        """Horizontal Sobel response of gray (ndimage.sobel's default axis)."""
+        return ndimage.sobel(self.gray, axis=1)
+
+    @cached_property
+    def sobel_y(self):
+        """Vertical Sobel response of gray."""
+        return ndimage.sobel(self.gray, axis=0)
+
+    @cached_property
+    def sobel_magnitude(self):
+        """Sobel gradient magnitude of gray."""
+        return np.sqrt(self.sobel_x**2 + self.sobel_y**2)
+
+    @cached_property
+    def laplacian(self):
+        """Laplacian of gray."""
+        return ndimage.laplace(self.gray)
+
+    @cached_property
+    def abs_laplacian(self):
+        """Absolute Laplacian of gray."""
+        return np.abs(self.laplacian)
+
+    @cached_property
+    def prewitt_magnitude(self):
+        """Prewitt gradient magnitude of gray."""
+        prewitt_x = ndimage.prewitt(self.gray, axis=1)
+        prewitt_y = ndimage.prewitt(self.gray, axis=0)
+        return np.sqrt(prewitt_x**2 + prewitt_y**2)
+
+    def local_variance(self, size=15):
+        """Local variance of gray over a size x size window."""
+        if size not in self._local_variances:
+            self._local_variances[size] = local_variance(self.gray, size=size)
+        return self._local_variances[size]
+
+    def percentile(self, name, q):
+        """
+        np.percentile of a plane, memoized per (plane, q).
+
+        Args:
+            name: plane attribute name ('sobel_magnitude', 'abs_laplacian', ...)
+                  or 'local_variance:<size>'
+            q: percentile
+        """
+        key = (name, q)
+        if key not in self._percentiles:
+            if name.startswith('local_variance:'):
+                plane = self.local_variance(int(name.split(':', 1)[1]))
+            else:
+                plane = getattr(self, name)
+            self._percentiles[key] = np.percentile(plane, q)
+        return self._percentiles[key]
@@ -10,6 +10,8 @@ import sys
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 from scipy import ndimage
+from integral_image import subject_mask
+from component_stats import largest_component_mask
 
 class FinalSinglePixelRemover:
     """
@@ -73,6 +75,11 @@ class FinalSinglePixelRemover:
         # Everything else is subject
         return True
     
+    def subject_mask(self, img_array):
+        """Vectorized is_subject_pixel over the whole image."""
+        return subject_mask(img_array, self.white_threshold, self.blue_threshold,
+                            window=5, min_count=4)
+    
     def trim_single_pixel_edges(self, img_array, content_mask):
         """Trim single pixels of white space from all edges."""
         height, width = img_array.shape[:2]
@@ -134,13 +141,7 @@ class FinalSinglePixelRemover:
         print("  - Detecting and removing edge white pixels...")
         
         # Create content mask
-        content_mask = np.zeros((height, width), dtype=bool)
-        
-        # Scan every pixel
-        for y in range(height):
-            for x in range(width):
-                if self.is_subject_pixel(img_array[y, x], (y, x), img_array):
-                    content_mask[y, x] = True
+        content_mask = self.subject_mask(img_array)
         
         # Apply morphological operations
         content_mask = ndimage.binary_fill_holes(content_mask)
@@ -148,11 +149,7 @@ class FinalSinglePixelRemover:
         content_mask = ndimage.binary_dilation(content_mask, iterations=1)
         
         # Find largest connected component
-        labeled_array, num_features = ndimage.label(content_mask)
-        if num_features > 0:
-            component_sizes = ndimage.sum(content_mask, labeled_array, range(1, num_features + 1))
-            largest_component = np.argmax(component_sizes) + 1
-            content_mask = (labeled_array == largest_component)
+        content_mask = largest_component_mask(content_mask)
         
         # Trim single pixel edges
         content_mask = self.trim_single_pixel_edges(img_array, content_mask)
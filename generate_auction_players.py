@@ -4,15 +4,57 @@ GENERATE AUCTION PLAYERS DATA
 Generate TypeScript auction players data from the extracted player JSON data.
 """
 
+import os
 import json
 import re
 
+# Written by responsive_assets.py; optional, photos fall back to the full-size PNG
+RESPONSIVE_MANIFEST = 'src/assets/players/responsive/manifest.json'
+RESPONSIVE_URL = '/src/assets/players/responsive'
+
 def clean_name_for_filename(name):
     """Clean player name to be safe for filename."""
     cleaned = re.sub(r'[^\w\s-]', '', name)
     cleaned = re.sub(r'[-\s]+', '-', cleaned)
     return cleaned.strip('-')
 
+def load_responsive_manifest(path=RESPONSIVE_MANIFEST):
+    """Load the size ladder manifest, or an empty one if it has not been generated."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('players', {})
+
+def photo_sizes_for(entry):
+    """
+    URLs and dimensions of a player's responsive photos, per ladder rung.
+    WebP is used for every rung; AVIF is added where it was generated.
+    """
+    sizes = {}
+    for rung, variant in entry['sizes'].items():
+        if 'webp' not in variant:
+            continue
+        sizes[rung] = {
+            'src': f"{RESPONSIVE_URL}/{variant['webp']}",
+            'width': variant['width'],
+            'height': variant['height'],
+        }
+        if 'avif' in variant:
+            sizes[rung]['avif'] = f"{RESPONSIVE_URL}/{variant['avif']}"
+    return sizes
+
+def format_photo_sizes(sizes):
+    """TypeScript object literal for a player's photoSizes."""
+    rungs = []
+    for rung, size in sizes.items():
+        fields = [f"src: '{size['src']}'"]
+        if 'avif' in size:
+            fields.append(f"avif: '{size['avif']}'")
+        fields.append(f"width: {size['width']}")
+        fields.append(f"height: {size['height']}")
+        rungs.append(f"{rung}: {{ {', '.join(fields)} }}")
+    return "{\n      " + ",\n      ".join(rungs) + "\n    }"
+
 def generate_auction_players():
     """Generate auction players data from JSON."""
     
@@ -21,6 +63,10 @@ def generate_auction_players():
         players_data = json.load(f)
     
     print(f"Loaded {len(players_data)} player records")
+
+    responsive = load_responsive_manifest()
+    if responsive:
+        print(f"Loaded responsive photos for {len(responsive)} players from {RESPONSIVE_MANIFEST}")
     
     # Generate TypeScript code
     ts_code = """// Generated auction players data from PDF extraction
@@ -40,6 +86,14 @@ export const auctionPlayers: AuctionPlayer[] = [
         # Clean name for photo path
         clean_name = clean_name_for_filename(name)
         photo_path = f"/src/assets/players/{mobile}-{clean_name}.png"
+
+        # Prefer the list-size WebP from the size ladder when it exists
+        photo_sizes = {}
+        if f"{mobile}-{clean_name}" in responsive:
+            photo_sizes = photo_sizes_for(responsive[f"{mobile}-{clean_name}"])
+            if 'list' in photo_sizes:
+                photo_path = photo_sizes['list']['src']
+        photo_sizes_line = f"\n    photoSizes: {format_photo_sizes(photo_sizes)}," if photo_sizes else ""
         
         # Generate base price based on category and icon status
         base_price = 50000  # Default base price
@@ -65,7 +119,7 @@ export const auctionPlayers: AuctionPlayer[] = [
     basePrice: {base_price},
     currentBid: {base_price},
     status: 'available' as const,
-    photo: '{photo_path}',
+    photo: '{photo_path}',{photo_sizes_line}
     iconPlayer: '{icon_player}',
     soldTo: undefined,
     soldPrice: undefined,
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+IMAGE WRITER
+Output stage for the extraction pipeline.
+Encodes player photos as PNG (chosen zlib compress level), lossless WebP or JPEG on a
+small thread pool with a bounded queue, so encoding overlaps with the next page's mask work.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Pillow format name and file extension per output format
+OUTPUT_FORMATS = {
+    'png': ('PNG', '.png'),
+    'webp': ('WEBP', '.webp'),
+    'jpeg': ('JPEG', '.jpg'),
+}
+
+class ImageEncoder:
+    """
+    Format and encoder settings for the extracted photos.
+    """
+
+    def __init__(self, output_format='png', compress_level=None, quality=95, fast=False):
+        """
+        Args:
+            output_format (str): 'png', 'webp' (lossless) or 'jpeg'
+            compress_level (int): PNG zlib level 0-9 (default 6, Pillow's default; 1 with fast)
+            quality (int): JPEG quality
+            fast (bool): Favour encode speed over file size (iteration runs)
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format {output_format!r}, expected one of {sorted(OUTPUT_FORMATS)}")
+        self.output_format = output_format
+        self.pil_format, self.extension = OUTPUT_FORMATS[output_format]
+        self.compress_level = compress_level if compress_level is not None else (1 if fast else 6)
+        self.quality = quality
+        self.fast = fast
+
+    def save_options(self):
+        """Keyword arguments for PIL.Image.save."""
+        if self.output_format == 'png':
+            return {'compress_level': self.compress_level}
+        if self.output_format == 'webp':
+            # method trades speed for size (0 fastest, 6 smallest); lossless either way
+            return {'lossless': True, 'method': 0 if self.fast else 4}
+        return {'quality': self.quality}
+
+    def output_path(self, path):
+        """path with this format's extension."""
+        return os.path.splitext(path)[0] + self.extension
+
+    def save(self, image, path):
+        """Encode and write one image on the calling thread."""
+        image.save(path, self.pil_format, **self.save_options())
+
+class ImageWriter:
+    """
+    Writes images on a thread pool; submit() blocks while queue_depth images are in flight.
+    Failed writes are collected and returned by close().
+    """
+
+    def __init__(self, encoder=None, threads=2, queue_depth=4, timer=None):
+        """
+        Args:
+            encoder (ImageEncoder): Output format and settings (default: PNG)
+            threads (int): Encoder threads
+            queue_depth (int): Images allowed in flight before submit() waits
+            timer (StageTimer): Records an 'encode' stage per image if given
+        """
+        self.encoder = encoder or ImageEncoder()
+        self.timer = timer
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="image-writer")
+        self.slots = threading.BoundedSemaphore(queue_depth)
+        self.lock = threading.Lock()
+        self.failures = []
+
+    def _write(self, image, path, page):
+        try:
+            if self.timer:
+                with self.timer.stage('encode', page=page):
+                    self.encoder.save(image, path)
+            else:
+                self.encoder.save(image, path)
+        except Exception as e:
+            with self.lock:
+                self.failures.append((path, e))
+        finally:
+            self.slots.release()
+
+    def submit(self, image, path, page=None):
+        """Queue an image for writing; waits while the queue is full."""
+        self.slots.acquire()
+        try:
+            self.executor.submit(self._write, image, path, page)
+        except Exception:
+            self.slots.release()
+            raise
+
+    def close(self):
+        """
+        Wait for every queued image to be written.
+
+        Returns:
+            list: (path, exception) for each write that failed
+        """
+        self.executor.shutdown(wait=True)
+        return list(self.failures)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+INTEGRAL IMAGE NEIGHBOURHOOD COUNTS
+Summed-area table shared by the white removers.
+Builds the table once per image and answers any window-size count for every pixel in O(1).
+"""
+
+import numpy as np
+
+def integral_image(plane):
+    """
+    Build a zero-padded summed-area table of a 2D plane.
+
+    Args:
+        plane: 2D numpy array (bool or integer)
+
+    Returns:
+        numpy array of shape (height+1, width+1) where [y, x] is the sum of plane[:y, :x]
+    """
+    height, width = plane.shape
+    table = np.zeros((height + 1, width + 1), dtype=np.int64)
+    np.cumsum(plane, axis=0, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+    return table
+
+def window_sums(table, size):
+    """
+    Sum of the plane over a size x size window centred on every pixel.
+
+    Windows are clipped at the image border, so out-of-image neighbours add nothing.
+
+    Args:
+        table: summed-area table from integral_image()
+        size: odd window size (3 for 3x3, 5 for 5x5, ...)
+
+    Returns:
+        numpy array of shape (height, width) with the window sums
+    """
+    if size < 1 or size % 2 == 0:
+        raise ValueError(f"Window size must be a positive odd number, got {size}")
+
+    height, width = table.shape[0] - 1, table.shape[1] - 1
+    radius = size // 2
+
+    # Clipped window edges for every row and column
+    y_start = np.clip(np.arange(height) - radius, 0, height)
+    y_end = np.clip(np.arange(height) + radius + 1, 0, height)
+    x_start = np.clip(np.arange(width) - radius, 0, width)
+    x_end = np.clip(np.arange(width) + radius + 1, 0, width)
+
+    return (table[np.ix_(y_end, x_end)] -
+            table[np.ix_(y_start, x_end)] -
+            table[np.ix_(y_end, x_start)] +
+            table[np.ix_(y_start, x_start)])
+
+class NonWhiteCounter:
+    """
+    Count non-white pixels around every pixel of an RGB image.
+
+    A pixel is non-white unless all three channels are >= threshold.
+    """
+
+    def __init__(self, img_array, threshold=240):
+        self.threshold = threshold
+        self.non_white = ~np.all(img_array >= threshold, axis=2)
+        self.table = integral_image(self.non_white)
+        self._counts = {}
+
+    def counts(self, size):
+        """Non-white count in the size x size window around every pixel."""
+        if size not in self._counts:
+            self._counts[size] = window_sums(self.table, size)
+        return self._counts[size]
+
+def subject_mask(img_array, white_threshold, blue_threshold, window, min_count):
+    """
+    Subject pixels of an RGB image, the vectorized form of the removers' is_subject_pixel:
+    white pixels count as subject (white clothing) when more than min_count pixels in the
+    window x window neighbourhood are not white (< 240); other pixels are subject unless
+    they are blue text.
+
+    Args:
+        img_array: (height, width, 3) uint8 numpy array
+        white_threshold (int): All channels >= this is white
+        blue_threshold (int): Blue above both red and green by more than this is blue text
+        window (int): Odd neighbourhood size for the white clothing check
+        min_count (int): Non-white neighbours needed (exclusive) for white clothing
+
+    Returns:
+        2D bool numpy array
+    """
+    r, g, b = img_array[:, :, 0], img_array[:, :, 1], img_array[:, :, 2]
+    white = (r >= white_threshold) & (g >= white_threshold) & (b >= white_threshold)
+    # uint8 arithmetic on purpose, same as the per-pixel check
+    blue_text = (b > (r + blue_threshold)) & (b > (g + blue_threshold)) & (b > 100)
+    white_clothing = NonWhiteCounter(img_array, threshold=240).counts(window) > min_count
+    return np.where(white, white_clothing, ~blue_text)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+PHOTO PIPELINE CACHE
+Manifest-backed, content-addressed cache for the photo extraction scripts.
+Each output file is recorded with a key built from the source page hash, the algorithm name
+and its parameters, so re-runs only reprocess pages whose key changed.
+"""
+
+import os
+import json
+import hashlib
+
+MANIFEST_FILENAME = ".photo_cache.json"
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def pdf_page_digest(doc, page_number):
+    """
+    SHA-256 of a PDF page's content streams and the raw streams of its images.
+    Cheap to compute - nothing is rendered - and changes whenever the slide is edited.
+    """
+    page = doc[page_number - 1]
+    digest = hashlib.sha256()
+    digest.update(page.read_contents())
+    for img in page.get_images(full=True):
+        digest.update(doc.xref_stream_raw(img[0]) or b'')
+    return digest.hexdigest()
+
+def cache_key(source_digest, algorithm, params):
+    """Combine the source hash, algorithm name and parameters into one key."""
+    payload = json.dumps({'source': source_digest, 'algorithm': algorithm, 'params': params},
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class PhotoCache:
+    """
+    Manifest of output files and the cache key that produced each of them.
+    """
+
+    def __init__(self, output_dir, manifest_filename=MANIFEST_FILENAME):
+        self.output_dir = output_dir
+        self.manifest_path = os.path.join(output_dir, manifest_filename)
+        self.entries = {}
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring unreadable cache manifest {self.manifest_path}: {e}")
+
+    def is_fresh(self, output_path, key):
+        """True if output_path exists and was produced with this key."""
+        entry = self.entries.get(os.path.basename(output_path))
+        return entry is not None and entry['key'] == key and os.path.exists(output_path)
+
+    def record(self, output_path, key, source, algorithm, params):
+        """Remember that output_path was produced from source with this key."""
+        self.entries[os.path.basename(output_path)] = {
+            'key': key,
+            'source': source,
+            'algorithm': algorithm,
+            'params': params,
+        }
+
+    def forget(self, output_path):
+        """Drop the entry for output_path, e.g. after its write failed."""
+        self.entries.pop(os.path.basename(output_path), None)
+
+    def save(self):
+        """Write the manifest next to the outputs."""
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
@@ -10,6 +10,8 @@ import sys
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 from scipy import ndimage
+from feature_planes import FeaturePlanes
+from component_stats import largest_component_mask
 
 class PixelPerfectWhiteRemover:
     """
@@ -40,30 +42,20 @@ class PixelPerfectWhiteRemover:
         return (not self.is_white_pixel(rgb) and 
                 not self.is_blue_text_pixel(rgb))
     
-    def detect_edges_advanced(self, img_array):
+    def detect_edges_advanced(self, img_array, planes=None):
         """Advanced edge detection using multiple methods."""
-        gray = np.mean(img_array, axis=2)
+        planes = planes or FeaturePlanes(img_array)
         
-        # Sobel edge detection
-        sobel_x = ndimage.sobel(gray, axis=1)
-        sobel_y = ndimage.sobel(gray, axis=0)
-        sobel_magnitude = np.sqrt(sobel_x**2 + sobel_y**2)
-        
-        # Laplacian edge detection
-        laplacian = ndimage.laplace(gray)
-        
-        # Canny-like edge detection
-        gaussian = ndimage.gaussian_filter(gray, sigma=1.0)
-        edges = ndimage.sobel(gaussian)
-        
-        # Combine all edge detection methods
-        edge_threshold = np.percentile(sobel_magnitude, 80)
-        edge_mask = (sobel_magnitude > edge_threshold) | (np.abs(laplacian) > np.percentile(np.abs(laplacian), 75))
+        # Combine Sobel and Laplacian edge detection
+        edge_threshold = planes.percentile('sobel_magnitude', 80)
+        edge_mask = ((planes.sobel_magnitude > edge_threshold) |
+                     (planes.abs_laplacian > planes.percentile('abs_laplacian', 75)))
         
         return edge_mask
     
-    def detect_skin_tones(self, img_array):
+    def detect_skin_tones(self, img_array, planes=None):
         """Detect skin tone pixels."""
+        planes = planes or FeaturePlanes(img_array)
         r, g, b = img_array[:,:,0], img_array[:,:,1], img_array[:,:,2]
         
         # Enhanced skin tone detection
@@ -73,28 +65,29 @@ class PixelPerfectWhiteRemover:
             (b > 80) & (b < 200) &   # Blue range
             (r > g) & (g > b) &      # Red > Green > Blue
             (r - g > 15) & (g - b > 10) &  # Color differences
-            (np.std(img_array, axis=2) > 15)  # Some color variation
+            (planes.std > 15)  # Some color variation
         )
         
         return skin_mask
     
-    def detect_hair_and_clothing(self, img_array):
+    def detect_hair_and_clothing(self, img_array, planes=None):
         """Detect hair and clothing pixels."""
-        rgb_mean = np.mean(img_array, axis=2)
-        rgb_std = np.std(img_array, axis=2)
+        planes = planes or FeaturePlanes(img_array)
+        rgb_mean = planes.mean
+        rgb_std = planes.std
         
         # Hair detection (dark areas with texture)
         hair_mask = (
             (rgb_mean < 100) &  # Dark
             (rgb_std > 10) &    # Has texture
-            (ndimage.sobel(rgb_mean) > np.percentile(ndimage.sobel(rgb_mean), 60))
+            (planes.sobel_x > planes.percentile('sobel_x', 60))
         )
         
         # Clothing detection (non-white clothing)
         clothing_mask = (
             (rgb_mean < 200) &  # Not too bright
             (rgb_std > 20) &    # Has color variation
-            (ndimage.sobel(rgb_mean) > np.percentile(ndimage.sobel(rgb_mean), 50))
+            (planes.sobel_x > planes.percentile('sobel_x', 50))
         )
         
         return hair_mask | clothing_mask
@@ -103,8 +96,9 @@ class PixelPerfectWhiteRemover:
         """Create comprehensive content mask using all detection methods."""
         height, width = img_array.shape[:2]
         
-        # Initialize mask
+        # Initialize mask and the shared feature planes
         content_mask = np.zeros((height, width), dtype=bool)
+        planes = FeaturePlanes(img_array)
         
         # Method 1: Direct pixel scanning
         print("  - Scanning pixels for subject content...")
@@ -115,24 +109,23 @@ class PixelPerfectWhiteRemover:
         
         # Method 2: Edge detection
         print("  - Applying advanced edge detection...")
-        edge_mask = self.detect_edges_advanced(img_array)
+        edge_mask = self.detect_edges_advanced(img_array, planes)
         content_mask = content_mask | edge_mask
         
         # Method 3: Skin tone detection
         print("  - Detecting skin tones...")
-        skin_mask = self.detect_skin_tones(img_array)
+        skin_mask = self.detect_skin_tones(img_array, planes)
         content_mask = content_mask | skin_mask
         
         # Method 4: Hair and clothing detection
         print("  - Detecting hair and clothing...")
-        hair_clothing_mask = self.detect_hair_and_clothing(img_array)
+        hair_clothing_mask = self.detect_hair_and_clothing(img_array, planes)
         content_mask = content_mask | hair_clothing_mask
         
         # Method 5: Color variance analysis
         print("  - Analyzing color variance...")
-        local_variance = ndimage.generic_filter(np.mean(img_array, axis=2), np.var, size=15)
-        variance_threshold = np.percentile(local_variance, 30)
-        variance_mask = local_variance > variance_threshold
+        variance_threshold = planes.percentile('local_variance:15', 30)
+        variance_mask = planes.local_variance(15) > variance_threshold
         content_mask = content_mask | variance_mask
         
         return content_mask
@@ -151,11 +144,7 @@ class PixelPerfectWhiteRemover:
         mask = ndimage.binary_dilation(mask, iterations=2)
         
         # Find largest connected component
-        labeled_array, num_features = ndimage.label(mask)
-        if num_features > 0:
-            component_sizes = ndimage.sum(mask, labeled_array, range(1, num_features + 1))
-            largest_component = np.argmax(component_sizes) + 1
-            mask = (labeled_array == largest_component)
+        mask = largest_component_mask(mask)
         
         return mask
     
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+RESPONSIVE PLAYER ASSETS
+Build a size ladder (thumbnail, list, projector, original) of every player photo in WebP and AVIF,
+plus a JSON manifest of dimensions and paths, so the auction UI can load small images
+instead of the full-size PNGs.
+"""
+
+import os
+import sys
+import glob
+import json
+import argparse
+from PIL import Image, features
+
+PLAYERS_DIR = os.path.join("src", "assets", "players")
+RESPONSIVE_DIRNAME = "responsive"
+MANIFEST_FILENAME = "manifest.json"
+
+# Longest edge in pixels per rung; None keeps the original size
+SIZE_LADDER = {
+    'thumbnail': 160,
+    'list': 320,
+    'projector': 1280,
+    'original': None,
+}
+
+# Pillow format name, file extension and encoder options per output format
+LADDER_FORMATS = {
+    'webp': ('WEBP', '.webp', {'quality': 80, 'method': 6}),
+    'avif': ('AVIF', '.avif', {'quality': 60}),
+}
+
+def available_formats(formats):
+    """Keep the formats this Pillow build can encode, warning about the rest."""
+    supported = []
+    for output_format in formats:
+        if features.check(output_format):
+            supported.append(output_format)
+        else:
+            print(f"⚠️  Pillow was built without {output_format.upper()} support, skipping {output_format}")
+    return supported
+
+def ladder_size(size, longest_edge):
+    """Size scaled down so the longest edge is at most longest_edge (never scaled up)."""
+    width, height = size
+    if longest_edge is None or max(width, height) <= longest_edge:
+        return width, height
+    scale = longest_edge / max(width, height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+def _is_up_to_date(entry, source_path, output_dir, formats):
+    """True if a manifest entry has every output, all newer than the source."""
+    if not entry:
+        return False
+    source_mtime = os.path.getmtime(source_path)
+    for rung in SIZE_LADDER:
+        variant = entry['sizes'].get(rung, {})
+        for output_format in formats:
+            path = variant.get(output_format)
+            if not path:
+                return False
+            full_path = os.path.join(output_dir, path)
+            if not os.path.exists(full_path) or os.path.getmtime(full_path) < source_mtime:
+                return False
+    return True
+
+def generate_size_ladder(source_path, output_dir, formats=('webp', 'avif')):
+    """
+    Write every rung of the ladder for one photo.
+
+    Args:
+        source_path (str): Player photo (PNG)
+        output_dir (str): Directory for the ladder images
+        formats (tuple): Output formats ('webp', 'avif')
+
+    Returns:
+        dict: Manifest entry with the source name and, per rung, width, height,
+              one path per format (relative to output_dir) and the file sizes in bytes
+    """
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    entry = {'source': os.path.basename(source_path), 'sizes': {}}
+
+    with Image.open(source_path) as img:
+        img.load()
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+
+        for rung, longest_edge in SIZE_LADDER.items():
+            width, height = ladder_size(img.size, longest_edge)
+            resized = img if (width, height) == img.size else img.resize((width, height), Image.LANCZOS)
+            variant = {'width': width, 'height': height, 'bytes': {}}
+
+            for output_format in formats:
+                pil_format, extension, options = LADDER_FORMATS[output_format]
+                filename = f"{stem}-{rung}{extension}"
+                resized.save(os.path.join(output_dir, filename), pil_format, **options)
+                variant[output_format] = filename
+                variant['bytes'][output_format] = os.path.getsize(os.path.join(output_dir, filename))
+
+            entry['sizes'][rung] = variant
+
+    return entry
+
+def build_responsive_assets(players_dir=PLAYERS_DIR, output_dir=None, formats=('webp', 'avif'), force=False):
+    """
+    Generate the ladder for every PNG in players_dir and write the manifest.
+    Photos whose ladder is already newer than the PNG are skipped unless force is set.
+
+    Returns:
+        dict: The manifest, keyed by photo name without extension
+    """
+    output_dir = output_dir or os.path.join(players_dir, RESPONSIVE_DIRNAME)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILENAME)
+    formats = available_formats(formats)
+
+    previous = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('players', {})
+
+    photos = sorted(glob.glob(os.path.join(players_dir, "*.png")))
+    print(f"Found {len(photos)} player photos in {players_dir}")
+
+    players = {}
+    generated = 0
+    for i, source_path in enumerate(photos, 1):
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        if _is_up_to_date(previous.get(stem), source_path, output_dir, formats):
+            players[stem] = previous[stem]
+            continue
+        try:
+            players[stem] = generate_size_ladder(source_path, output_dir, formats)
+            generated += 1
+            thumbnail = players[stem]['sizes']['thumbnail']['bytes']
+            print(f"[{i:3d}/{len(photos)}] {stem}: thumbnail " +
+                  ", ".join(f"{fmt} {size/1024:.1f} KB" for fmt, size in thumbnail.items()))
+        except Exception as e:
+            print(f"❌ Error processing {os.path.basename(source_path)}: {e}")
+
+    manifest = {
+        'ladder': SIZE_LADDER,
+        'formats': formats,
+        'players': players,
+    }
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    print(f"✅ {generated} ladders generated, {len(players) - generated} unchanged")
+    print(f"Manifest written to: {manifest_path}")
+    return manifest
+
+def main():
+    """Main function for responsive asset generation."""
+    parser = argparse.ArgumentParser(description="Generate a WebP/AVIF size ladder and manifest for the player photos.")
+    parser.add_argument("--players-dir", default=PLAYERS_DIR,
+                        help=f"directory with the player PNGs (default: {PLAYERS_DIR})")
+    parser.add_argument("--output-dir",
+                        help=f"directory for the ladder and manifest (default: <players-dir>/{RESPONSIVE_DIRNAME})")
+    parser.add_argument("--formats", nargs="+", choices=sorted(LADDER_FORMATS), default=['webp', 'avif'],
+                        help="output formats (default: webp avif)")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every ladder, even if it is newer than its PNG")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.players_dir):
+        print(f"❌ Players directory not found: {args.players_dir}")
+        return 1
+
+    print("RESPONSIVE PLAYER ASSETS")
+    print("="*60)
+    build_responsive_assets(args.players_dir, args.output_dir, args.formats, args.force)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,16 +10,21 @@ import sys
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 from scipy import ndimage
+from integral_image import subject_mask
+from pyramid_bounds import coarse_to_fine_mask, mask_bbox
+from component_stats import ComponentStats, largest_component_mask
 
 class SafeMarginWhiteRemover:
     """
     Safe margin white space removal with 2px buffer from all sides.
     """
     
-    def __init__(self, white_threshold=225, blue_threshold=50, safety_margin=2):
+    def __init__(self, white_threshold=225, blue_threshold=50, safety_margin=2, pyramid_scale=None):
         self.white_threshold = white_threshold
         self.blue_threshold = blue_threshold
         self.safety_margin = safety_margin
+        # Split the content into components at 1/pyramid_scale first (e.g. 4 or 8); None for full resolution only
+        self.pyramid_scale = pyramid_scale
         
     def is_white_pixel(self, rgb):
         """Very aggressive white detection."""
@@ -74,64 +79,91 @@ class SafeMarginWhiteRemover:
         # Everything else is subject
         return True
     
+    def subject_mask(self, img_array):
+        """Vectorized is_subject_pixel over the whole image."""
+        return subject_mask(img_array, self.white_threshold, self.blue_threshold,
+                            window=5, min_count=4)
+    
     def detect_content_with_safety_margin(self, img_array):
         """Detect content and apply safety margin."""
-        height, width = img_array.shape[:2]
         
         print("  - Detecting content with safety margin...")
         
         # Create content mask
-        content_mask = np.zeros((height, width), dtype=bool)
+        content_mask = self.subject_mask(img_array)
         
-        # Scan every pixel
-        for y in range(height):
-            for x in range(width):
-                if self.is_subject_pixel(img_array[y, x], (y, x), img_array):
-                    content_mask[y, x] = True
+        if self.pyramid_scale:
+            return coarse_to_fine_mask(content_mask, self.pyramid_scale, self.clean_content_mask)
         
-        # Apply morphological operations
+        return self.refine_content_mask(content_mask)
+    
+    def detect_content_bounds(self, img_array):
+        """
+        Bounding box (y_min, y_max, x_min, x_max) and pixel count of the subject,
+        read from the component statistics without building the largest-component mask.
+        
+        Returns:
+            tuple: (bbox or None, subject pixel count)
+        """
+        if self.pyramid_scale:
+            content_mask = self.detect_content_with_safety_margin(img_array)
+            return mask_bbox(content_mask), int(np.count_nonzero(content_mask))
+        
+        print("  - Detecting content with safety margin...")
+        
+        content_mask = self.clean_content_mask(self.subject_mask(img_array))
+        stats = ComponentStats(content_mask)
+        index = stats.largest()
+        if index is None:
+            return None, 0
+        return stats.largest_bbox(), int(stats.area[index])
+    
+    def clean_content_mask(self, content_mask):
+        """Fill holes, then erode and dilate once."""
         content_mask = ndimage.binary_fill_holes(content_mask)
         content_mask = ndimage.binary_erosion(content_mask, iterations=1)
         content_mask = ndimage.binary_dilation(content_mask, iterations=1)
+        return content_mask
+    
+    def refine_content_mask(self, content_mask):
+        """Morphological clean-up and largest connected component of a raw subject mask."""
+        # Apply morphological operations
+        content_mask = self.clean_content_mask(content_mask)
         
         # Find largest connected component
-        labeled_array, num_features = ndimage.label(content_mask)
-        if num_features > 0:
-            component_sizes = ndimage.sum(content_mask, labeled_array, range(1, num_features + 1))
-            largest_component = np.argmax(component_sizes) + 1
-            content_mask = (labeled_array == largest_component)
-        
-        return content_mask
+        return largest_component_mask(content_mask)
     
     def find_content_bounds_with_safety_margin(self, mask):
         """Find content bounds and apply 2px safety margin from all sides."""
-        rows = np.any(mask, axis=1)
-        cols = np.any(mask, axis=0)
+        return self.apply_safety_margin(mask_bbox(mask), mask.shape)
+    
+    def apply_safety_margin(self, bbox, shape):
+        """
+        Shrink a (y_min, y_max, x_min, x_max) content box by the safety margin on all sides.
         
-        if not np.any(rows) or not np.any(cols):
+        Returns:
+            tuple: ((x_min, y_min), (x_max, y_max)), or None when bbox is None
+        """
+        if bbox is None:
             return None
         
-        y_min, y_max = np.where(rows)[0][[0, -1]]
-        x_min, x_max = np.where(cols)[0][[0, -1]]
+        y_min, y_max, x_min, x_max = bbox
         
         # Apply safety margin - remove 2px from all sides
-        height, width = mask.shape
+        height, width = shape
         
         # Add safety margin
-        x_min = max(0, x_min + self.safety_margin)
-        y_min = max(0, y_min + self.safety_margin)
-        x_max = min(width, x_max - self.safety_margin)
-        y_max = min(height, y_max - self.safety_margin)
+        safe_x_min = max(0, x_min + self.safety_margin)
+        safe_y_min = max(0, y_min + self.safety_margin)
+        safe_x_max = min(width, x_max - self.safety_margin)
+        safe_y_max = min(height, y_max - self.safety_margin)
         
         # Ensure we don't have negative dimensions
-        if x_max <= x_min or y_max <= y_min:
+        if safe_x_max <= safe_x_min or safe_y_max <= safe_y_min:
             print("Warning: Safety margin too large, using original bounds")
-            rows = np.any(mask, axis=1)
-            cols = np.any(mask, axis=0)
-            y_min, y_max = np.where(rows)[0][[0, -1]]
-            x_min, x_max = np.where(cols)[0][[0, -1]]
+            return (x_min, y_min), (x_max, y_max)
         
-        return (x_min, y_min), (x_max, y_max)
+        return (safe_x_min, safe_y_min), (safe_x_max, safe_y_max)
     
     def process_image(self, input_path, output_path):
         """Process image with safe margin white space removal."""
@@ -154,18 +186,17 @@ class SafeMarginWhiteRemover:
             print(f"Applying safe margin white space removal (2px from all sides)...")
             
             # Detect content
-            content_mask = self.detect_content_with_safety_margin(img_array)
+            bbox, subject_pixels = self.detect_content_bounds(img_array)
             
             # Count pixels
-            subject_pixels = np.sum(content_mask)
-            white_pixels = np.sum(~content_mask)
             total_pixels = height * width
+            white_pixels = total_pixels - subject_pixels
             
             print(f"Subject pixels: {subject_pixels:,} ({subject_pixels/total_pixels*100:.1f}%)")
             print(f"White pixels: {white_pixels:,} ({white_pixels/total_pixels*100:.1f}%)")
             
             # Find content bounds with safety margin
-            bounds = self.find_content_bounds_with_safety_margin(content_mask)
+            bounds = self.apply_safety_margin(bbox, (height, width))
             if bounds is None:
                 print("No content found!")
                 return False
@@ -7,6 +7,7 @@ import { useState, useEffect } from 'react'
 import { motion, AnimatePresence } from 'framer-motion'
 import { mockTeams } from '@/data/mockData'
 import { auctionPlayers } from '@/data/auctionPlayers'
+import { PlayerPhotoSizes } from '@/types'
 
 interface AuctionPlayer {
   id: string
@@ -20,6 +21,7 @@ interface AuctionPlayer {
   soldPrice?: number
   status: 'available' | 'sold' | 'unsold'
   photo: string
+  photoSizes?: PlayerPhotoSizes
   teamLogo?: string
   iconPlayer: string
 }
@@ -189,8 +191,8 @@ function PlayerProjector({
   }
 
   const getPlayerPhotoPath = (player: AuctionPlayer) => {
-    // Use the photo path from the player data, or generate fallback
-    return player.photo || `/src/assets/players/${player.mobile}-${player.name.replace(/[^\w\s-]/g, '').replace(/[-\s]+/g, '-').trim()}.png`
+    // Use the projector-size photo when available, then the photo path from the player data, or generate fallback
+    return player.photoSizes?.projector?.src || player.photo || `/src/assets/players/${player.mobile}-${player.name.replace(/[^\w\s-]/g, '').replace(/[-\s]+/g, '-').trim()}.png`
   }
 
   const handleEditMode = () => {
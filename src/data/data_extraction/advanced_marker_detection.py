@@ -9,8 +9,10 @@ import os
 import re
 from pathlib import Path
 import fitz  # PyMuPDF
-from PIL import Image, ImageOps, ImageFilter, ImageEnhance, ImageDraw
-import io
+from PIL import ImageOps, ImageFilter, ImageEnhance, ImageDraw
+from pixmap_images import page_image_sizes, load_pixmap, pixmap_to_image
+from image_asset_cache import ImageAssetCache
+from pdf_index import load_pdf_index
 import numpy as np
 import cv2
 
@@ -53,8 +55,14 @@ def advanced_marker_detection_extract_first_page():
         doc = fitz.open(pdf_path)
         print(f"📄 PDF has {doc.page_count} pages")
         
+        # Page and image metadata from the sidecar index (the PDF is only rescanned when it changes)
+        pdf_index = load_pdf_index(pdf_path)
+        
+        # Index the deck's images, so repeated slide assets are recognised
+        image_cache = ImageAssetCache(doc, pdf_index=pdf_index)
+        
         # Process first page (page 0)
-        success = extract_with_advanced_marker_detection(doc, 0, first_player, output_dir)
+        success = extract_with_advanced_marker_detection(doc, 0, first_player, output_dir, image_cache, pdf_index)
         
         doc.close()
         
@@ -69,14 +77,16 @@ def advanced_marker_detection_extract_first_page():
         print(f"❌ Error: {e}")
         return False, 0
 
-def extract_with_advanced_marker_detection(doc, page_num, player, output_dir):
-    """Extract image using advanced visual marker detection"""
+def extract_with_advanced_marker_detection(doc, page_num, player, output_dir, image_cache=None, pdf_index=None):
+    """
+    Extract image using advanced visual marker detection.
+    With an ImageAssetCache, images repeated across slides (backgrounds, logos) are skipped.
+    With a PdfIndex, image sizes come from the sidecar instead of the page.
+    """
     
     try:
-        page = doc[page_num]
-        
-        # Get images on the page
-        image_list = page.get_images(full=True)
+        # Get images on the page (sizes from the sidecar index or image metadata, nothing decoded yet)
+        image_list = pdf_index.page_image_sizes(page_num) if pdf_index else page_image_sizes(doc[page_num])
         
         if not image_list:
             print(f"   No images found on page {page_num + 1}")
@@ -85,32 +95,24 @@ def extract_with_advanced_marker_detection(doc, page_num, player, output_dir):
         print(f"   Found {len(image_list)} images on page {page_num + 1}")
         
         # Process each image on the page
-        for img_index, img in enumerate(image_list):
+        for img_index, xref, width, height in image_list:
             print(f"   Processing image {img_index + 1}/{len(image_list)}")
             
-            # Get image data
-            xref = img[0]
-            pix = fitz.Pixmap(doc, xref)
-            
             # Skip if image is too small
-            if pix.width < 100 or pix.height < 100:
-                print(f"   Skipping image {img_index + 1}: too small ({pix.width}x{pix.height})")
-                pix = None
+            if width < 100 or height < 100:
+                print(f"   Skipping image {img_index + 1}: too small ({width}x{height})")
                 continue
             
-            print(f"   Image {img_index + 1} size: {pix.width}x{pix.height}")
+            # Skip repeated slide assets (backgrounds, logos, decorations)
+            if image_cache and image_cache.is_decoration(xref):
+                print(f"   Skipping image {img_index + 1}: repeated slide asset")
+                continue
             
-            # Convert to PIL Image
-            if pix.n - pix.alpha < 4:  # GRAY or RGB
-                img_data = pix.tobytes("png")
-                pil_image = Image.open(io.BytesIO(img_data))
-            else:  # CMYK: convert to RGB first
-                pix1 = fitz.Pixmap(fitz.csRGB, pix)
-                img_data = pix1.tobytes("png")
-                pil_image = Image.open(io.BytesIO(img_data))
-                pix1 = None
+            print(f"   Image {img_index + 1} size: {width}x{height}")
             
-            pix = None
+            # Decode the image and copy its samples into a PIL image (no PNG round trip)
+            pix = image_cache.pixmap(xref) if image_cache else load_pixmap(doc, xref)
+            pil_image = pixmap_to_image(pix)
             
             # Save original image for debugging
             debug_path = f"/Users/chetan/Documents/CodeProjects/ReactProjects/bcl/debug_original_{img_index}.png"
@@ -6,9 +6,17 @@ Complete PDF extraction - check all 145 pages
 import json
 import re
 import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from slide_fields import extract_slide_records
 
-def complete_pdf_extraction():
-    """Extract data from all 145 pages of the PDF"""
+def complete_pdf_extraction(workers=1, rebuild_index=False):
+    """
+    Extract data from all 145 pages of the PDF.
+    With workers > 1, one pool of that many processes scans the pages into the sidecar index
+    (each with its own PDF handle and page range) and then extracts the players page range
+    by page range; the results match the serial run.
+    """
     
     print("📄 Complete PDF Data Extraction - All 145 Pages")
     print("=" * 60)
@@ -22,24 +30,32 @@ def complete_pdf_extraction():
     
     print(f"📁 PDF file: {os.path.basename(pdf_path)}")
     
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
     try:
-        import fitz
-        print("🔍 Using PyMuPDF for complete extraction...")
+        from pdf_index import load_pdf_index, page_ranges, map_page_ranges
+        print("🔍 Using the PDF sidecar index for complete extraction...")
         
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
+        # Page text comes from the sidecar index; the PDF is only parsed when it changes
+        pdf_index = load_pdf_index(pdf_path, rebuild=rebuild_index, workers=workers, executor=executor)
+        total_pages = pdf_index.page_count
         print(f"📄 Total pages: {total_pages}")
         
+        # Extract players from each page's words (one layout-aware pass per page)
+        if executor is not None:
+            page_players = []
+            for range_players in map_page_ranges(extract_page_range, page_ranges(total_pages, workers),
+                                                 pdf_path, executor=executor):
+                page_players.extend(range_players)
+        else:
+            page_players = [extract_players_from_page(pdf_index.page_words(page_num), page_num + 1)
+                            for page_num in range(total_pages)]
+        
         all_players = []
         pages_with_players = []
         pages_without_players = []
         
-        for page_num in range(total_pages):
-            page = doc[page_num]
-            text = page.get_text()
-            
-            # Extract players from this page
-            players = extract_players_from_page(text, page_num + 1)
+        for page_num, players in enumerate(page_players):
+            text = pdf_index.page_text(page_num)
             
             if players:
                 all_players.extend(players)
@@ -53,8 +69,6 @@ def complete_pdf_extraction():
                 if page_num < 10:  # Show first 10 empty pages
                     print(f"   Content preview: {text[:200]}...")
         
-        doc.close()
-        
         print(f"\n📊 Complete Extraction Results:")
         print(f"  Total pages processed: {total_pages}")
         print(f"  Pages with players: {len(pages_with_players)}")
@@ -92,103 +106,36 @@ def complete_pdf_extraction():
     except Exception as e:
         print(f"❌ Error: {e}")
         return []
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-def extract_players_from_page(text, page_num):
-    """Extract player data from a single page with improved patterns"""
-    
-    players = []
-    
-    # Split text into lines for better processing
-    lines = text.split('\n')
-    
-    # Look for various player data patterns
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Pattern 1: "Name:" at start of line
-        if line.startswith('Name:'):
-            player = extract_player_from_name_line(lines, i, page_num)
-            if player:
-                players.append(player)
-        
-        # Pattern 2: Look for name patterns without "Name:" prefix
-        elif re.match(r'^[A-Za-z][A-Za-z\s\.]+$', line) and len(line) > 2:
-            # Check if next lines contain category, age, phone
-            if is_likely_player_name(lines, i):
-                player = extract_player_from_name_line(lines, i, page_num, has_name_prefix=False)
-                if player:
-                    players.append(player)
-        
-        i += 1
-    
-    return players
+def extract_page_range(pdf_path, start, stop):
+    """
+    Extract the players of pages [start, stop) from the PDF's sidecar index
+    (safe to run in a worker process; the index must already be current).
 
-def is_likely_player_name(lines, start_idx):
-    """Check if a line is likely a player name by looking at following lines"""
-    
-    # Look at next 5 lines for category, age, phone patterns
-    for i in range(start_idx + 1, min(start_idx + 6, len(lines))):
-        line = lines[i].strip()
-        if (line.startswith('Category:') or 
-            line.startswith('Age:') or 
-            line.startswith('Ph:') or
-            'Batsman' in line or
-            'Bowler' in line or
-            'All Rounder' in line or
-            'Wicket Keeper' in line):
-            return True
-    return False
+    Returns:
+        list: players list per page, in page order
+    """
+    from pdf_index import load_pdf_index
+    pdf_index = load_pdf_index(pdf_path)
+    return [extract_players_from_page(pdf_index.page_words(page_num), page_num + 1)
+            for page_num in range(start, stop)]
 
-def extract_player_from_name_line(lines, start_idx, page_num, has_name_prefix=True):
-    """Extract player data starting from a name line"""
-    
-    player = {}
-    
-    # Extract name
-    name_line = lines[start_idx].strip()
-    if has_name_prefix:
-        name = name_line.replace('Name:', '').strip()
-    else:
-        name = name_line
+def extract_players_from_page(words, page_num):
+    """Extract player data from a single page, locating each field by its label on the slide"""
     
-    if not name or len(name) < 2:
-        return None
-    
-    player['name'] = name
-    player['page'] = page_num
-    
-    # Look for category, age, phone in following lines
-    j = start_idx + 1
-    while j < len(lines) and j < start_idx + 10:  # Look within next 10 lines
-        line = lines[j].strip()
-        
-        if line.startswith('Category:'):
-            category = line.replace('Category:', '').strip()
-            player['category'] = category
-        elif line.startswith('Age:'):
-            age_match = re.search(r'Age:\s*(\d+)', line)
-            if age_match:
-                player['age'] = age_match.group(1)
-        elif line.startswith('Ph:'):
-            phone_match = re.search(r'Ph:\s*(\d+)', line)
-            if phone_match:
-                player['mobile'] = phone_match.group(1)
-        elif 'ICON' in line.upper():
-            player['iconPlayer'] = 'Yes'
-        
-        j += 1
+    players = []
     
-    # Only return if we have essential data
-    if 'name' in player and 'category' in player and 'age' in player:
-        if 'mobile' not in player:
-            player['mobile'] = ''
-        if 'iconPlayer' not in player:
-            player['iconPlayer'] = 'No'
-        
-        return player
+    for player in extract_slide_records(words):
+        # Only keep records with the essential data
+        if 'category' in player and 'age' in player:
+            player.setdefault('mobile', '')
+            player['page'] = page_num
+            players.append(player)
     
-    return None
+    return players
 
 def process_extracted_players(raw_players):
     """Process and clean extracted player data"""
@@ -320,5 +267,16 @@ def save_complete_data(players, pages_with_players, pages_without_players):
     
     print(f"✅ Saved detailed summary: {summary_path}")
 
+def main():
+    """Main function for complete PDF extraction."""
+    parser = argparse.ArgumentParser(description="Extract player data from every page of the players PDF.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes scanning and extracting page ranges in parallel (default: 1, serial)")
+    parser.add_argument("--rebuild-index", action="store_true",
+                        help="rescan the PDF even if its sidecar index is current")
+    args = parser.parse_args()
+
+    complete_pdf_extraction(workers=args.workers, rebuild_index=args.rebuild_index)
+
 if __name__ == "__main__":
-    complete_pdf_extraction()
+    main()
@@ -5,8 +5,9 @@ Missing slides: 22, 32, 46, 84, 100
 """
 
 import json
-import re
 import os
+from slide_fields import extract_slide_records
+from player_grammar import parse_player_records
 
 def extract_missing_slides():
     """Extract data for the missing slide numbers"""
@@ -22,11 +23,12 @@ def extract_missing_slides():
         return
     
     try:
-        import fitz
+        from pdf_index import load_pdf_index
         print(f"🔍 Extracting data for missing slides: {missing_slides}")
         
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
+        # Page text comes from the sidecar index; the PDF is only parsed when it changes
+        pdf_index = load_pdf_index(pdf_path)
+        total_pages = pdf_index.page_count
         print(f"📄 Total pages in PDF: {total_pages}")
         
         extracted_players = []
@@ -37,15 +39,14 @@ def extract_missing_slides():
             if page_num < total_pages:
                 print(f"\n🔍 Processing slide {slide_num} (page {page_num + 1})...")
                 
-                page = doc[page_num]
-                text = page.get_text()
+                text = pdf_index.page_text(page_num)
                 
                 print(f"📄 Page content preview:")
                 print(text[:500] + "..." if len(text) > 500 else text)
                 print("-" * 50)
                 
                 # Extract player data from this page
-                players = extract_players_from_page(text, slide_num)
+                players = extract_players_from_page(pdf_index.page_words(page_num), text, slide_num)
                 
                 if players:
                     extracted_players.extend(players)
@@ -64,8 +65,6 @@ def extract_missing_slides():
             else:
                 print(f"❌ Slide {slide_num} is beyond PDF page range ({total_pages})")
         
-        doc.close()
-        
         print(f"\n📊 Extraction Results:")
         print(f"  Missing slides processed: {len(missing_slides)}")
         print(f"  Players found: {len(extracted_players)}")
@@ -98,154 +97,55 @@ def extract_missing_slides():
         print(f"❌ Error: {e}")
         return []
 
-def extract_players_from_page(text, slide_num):
-    """Extract player data from a single page with comprehensive patterns"""
+def extract_players_from_page(words, text, slide_num):
+    """Extract player data from a single page: labelled/layout fields, then structured rows"""
     
     players = []
-    lines = text.split('\n')
     
-    print(f"🔍 Analyzing {len(lines)} lines of text...")
+    print(f"🔍 Analyzing {len(words)} words...")
     
-    # Pattern 1: Look for explicit "Name:" patterns
-    for i, line in enumerate(lines):
-        line = line.strip()
-        
-        if line.startswith('Name:'):
-            player = extract_player_from_name_line(lines, i, slide_num)
-            if player:
-                players.append(player)
-                print(f"✅ Found player via Name: pattern - {player['name']}")
-        
-        # Pattern 2: Look for name-like patterns followed by category/age info
-        elif re.match(r'^[A-Za-z][A-Za-z\s\.\-]+$', line) and len(line) > 2 and len(line) < 50:
-            # Check if this looks like a player name
-            if is_likely_player_name(lines, i):
-                player = extract_player_from_name_line(lines, i, slide_num, has_name_prefix=False)
-                if player:
-                    players.append(player)
-                    print(f"✅ Found player via name pattern - {player['name']}")
+    # Pattern 1: fields located by their labels or layout on the slide
+    for player in extract_slide_records(words):
+        if len(player['name']) > 2:
+            # Set defaults for missing fields
+            player.setdefault('category', 'Unknown')
+            player.setdefault('age', '0')
+            player.setdefault('mobile', '')
+            player['slide_number'] = slide_num
+            players.append(player)
+            print(f"✅ Found player via slide fields - {player['name']}")
     
-    # Pattern 3: Look for structured data in tables or lists
+    # Pattern 2: Look for structured data in tables or lists
     structured_players = extract_structured_players(text, slide_num)
     players.extend(structured_players)
     
     return players
 
-def is_likely_player_name(lines, start_idx):
-    """Check if a line is likely a player name by analyzing context"""
-    
-    # Look at next 10 lines for category, age, phone patterns
-    for i in range(start_idx + 1, min(start_idx + 11, len(lines))):
-        line = lines[i].strip()
-        
-        # Check for category indicators
-        if (line.startswith('Category:') or 
-            line.startswith('Age:') or 
-            line.startswith('Ph:') or
-            'Batsman' in line or
-            'Bowler' in line or
-            'All Rounder' in line or
-            'Wicket Keeper' in line or
-            re.match(r'\d+\s*years?', line) or  # Age pattern
-            re.match(r'\d{10}', line)):  # Phone number pattern
-            return True
-    
-    return False
-
-def extract_player_from_name_line(lines, start_idx, slide_num, has_name_prefix=True):
-    """Extract player data starting from a name line"""
-    
-    player = {}
-    
-    # Extract name
-    name_line = lines[start_idx].strip()
-    if has_name_prefix:
-        name = name_line.replace('Name:', '').strip()
-    else:
-        name = name_line
-    
-    # Clean name
-    name = re.sub(r'\s+', ' ', name).strip()
-    
-    if not name or len(name) < 2:
-        return None
-    
-    player['name'] = name
-    player['slide_number'] = slide_num
-    
-    # Look for category, age, phone in following lines
-    j = start_idx + 1
-    while j < len(lines) and j < start_idx + 15:  # Look within next 15 lines
-        line = lines[j].strip()
-        
-        if line.startswith('Category:'):
-            category = line.replace('Category:', '').strip()
-            player['category'] = category
-        elif line.startswith('Age:'):
-            age_match = re.search(r'Age:\s*(\d+)', line)
-            if age_match:
-                player['age'] = age_match.group(1)
-        elif line.startswith('Ph:'):
-            phone_match = re.search(r'Ph:\s*(\d+)', line)
-            if phone_match:
-                player['mobile'] = phone_match.group(1)
-        elif 'ICON' in line.upper():
-            player['iconPlayer'] = 'Yes'
-        elif re.match(r'^\d+\s*years?$', line):  # Age without prefix
-            age_match = re.search(r'(\d+)', line)
-            if age_match:
-                player['age'] = age_match.group(1)
-        elif re.match(r'^\d{10}$', line):  # Phone without prefix
-            player['mobile'] = line
-        elif line in ['Batsman', 'Bowler', 'All Rounder', 'Wicket Keeper']:
-            player['category'] = line
-        
-        j += 1
-    
-    # Only return if we have essential data
-    if 'name' in player and len(player['name']) > 2:
-        # Set defaults for missing fields
-        if 'category' not in player:
-            player['category'] = 'Unknown'
-        if 'age' not in player:
-            player['age'] = '0'
-        if 'mobile' not in player:
-            player['mobile'] = ''
-        if 'iconPlayer' not in player:
-            player['iconPlayer'] = 'No'
-        
-        return player
-    
-    return None
-
 def extract_structured_players(text, slide_num):
     """Extract players from structured data (tables, lists)"""
     
     players = []
     
-    # Pattern for structured data like: Name | Category | Age | Phone
-    structured_pattern = r'([A-Za-z\s\.\-]+?)\s*\|\s*([A-Za-z\s]+?)\s*\|\s*(\d+)\s*\|\s*(\d+)'
-    matches = re.findall(structured_pattern, text)
-    
-    for match in matches:
-        if len(match) >= 4:
-            name = match[0].strip()
-            category = match[1].strip()
-            age = match[2].strip()
-            phone = match[3].strip()
-            
-            if len(name) > 2 and len(category) > 2:
-                player = {
-                    'slide_number': slide_num,
-                    'name': name,
-                    'category': category,
-                    'age': age,
-                    'mobile': phone,
-                    'iconPlayer': 'No',
-                    'source': 'PDF_STRUCTURED'
-                }
-                players.append(player)
-                print(f"✅ Found structured player - {name}")
+    # Rows like: Name | Category | Age | Phone
+    for record in parse_player_records(text):
+        if record['sources'].get('name') != 'row':
+            continue
+        
+        name = record['name']
+        category = record['category']
+        
+        if len(name) > 2 and len(category) > 2:
+            player = {
+                'slide_number': slide_num,
+                'name': name,
+                'category': category,
+                'age': record['age'],
+                'mobile': record['mobile'],
+                'iconPlayer': 'No',
+                'source': 'PDF_STRUCTURED'
+            }
+            players.append(player)
+            print(f"✅ Found structured player - {name}")
     
     return players
 
@@ -4,12 +4,18 @@ Extract player data from New-2025-BCL-Players.pptx.pdf
 """
 
 import json
-import re
 import os
+import time
+import argparse
 from pathlib import Path
+from player_grammar import parse_player_records
+from pdf_backends import BACKENDS, DEFAULT_BACKEND, is_available, backend_label, extract_page_texts
 
-def extract_pdf_data():
-    """Extract player data from the PDF file"""
+def extract_pdf_data(backend=DEFAULT_BACKEND, max_pages=5, compare=False):
+    """
+    Extract player data from the PDF file with one text backend.
+    With compare, every installed backend is run and timed instead, and their records are compared.
+    """
     
     print("📄 PDF Data Extraction - New-2025-BCL-Players.pptx.pdf")
     print("=" * 70)
@@ -24,84 +30,18 @@ def extract_pdf_data():
     print(f"📁 PDF file found: {os.path.basename(pdf_path)}")
     print(f"📊 File size: {os.path.getsize(pdf_path) / (1024*1024):.1f} MB")
     
-    # Try different PDF extraction methods
-    extracted_data = []
+    if compare:
+        return compare_backends(pdf_path, max_pages)
     
-    # Method 1: PyPDF2
-    try:
-        import PyPDF2
-        print("\n🔍 Method 1: PyPDF2")
-        print("-" * 30)
-        
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            total_pages = len(pdf_reader.pages)
-            print(f"📄 Total pages: {total_pages}")
-            
-            for page_num in range(min(5, total_pages)):  # First 5 pages
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                print(f"📄 Page {page_num + 1} preview:")
-                print(text[:200] + "..." if len(text) > 200 else text)
-                print()
-                
-                # Look for player data patterns
-                players = extract_players_from_text(text, page_num + 1)
-                extracted_data.extend(players)
+    # One configured engine, one text pass
+    print(f"\n🔍 Backend: {backend_label(backend)}")
+    print("-" * 30)
     
-    except Exception as e:
-        print(f"❌ PyPDF2 error: {e}")
-    
-    # Method 2: pdfplumber
     try:
-        import pdfplumber
-        print("\n🔍 Method 2: pdfplumber")
-        print("-" * 30)
-        
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            print(f"📄 Total pages: {total_pages}")
-            
-            for page_num in range(min(5, total_pages)):  # First 5 pages
-                page = pdf.pages[page_num]
-                text = page.extract_text()
-                if text:
-                    print(f"📄 Page {page_num + 1} preview:")
-                    print(text[:200] + "..." if len(text) > 200 else text)
-                    print()
-                    
-                    # Look for player data patterns
-                    players = extract_players_from_text(text, page_num + 1)
-                    extracted_data.extend(players)
-    
+        extracted_data = extract_players_with_backend(pdf_path, backend, max_pages, show_preview=True)
     except Exception as e:
-        print(f"❌ pdfplumber error: {e}")
-    
-    # Method 3: PyMuPDF
-    try:
-        import fitz
-        print("\n🔍 Method 3: PyMuPDF")
-        print("-" * 30)
-        
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
-        print(f"📄 Total pages: {total_pages}")
-        
-        for page_num in range(min(5, total_pages)):  # First 5 pages
-            page = doc[page_num]
-            text = page.get_text()
-            print(f"📄 Page {page_num + 1} preview:")
-            print(text[:200] + "..." if len(text) > 200 else text)
-            print()
-            
-            # Look for player data patterns
-            players = extract_players_from_text(text, page_num + 1)
-            extracted_data.extend(players)
-        
-        doc.close()
-    
-    except Exception as e:
-        print(f"❌ PyMuPDF error: {e}")
+        print(f"❌ {backend_label(backend)} error: {e}")
+        return []
     
     # Process and clean extracted data
     print(f"\n📊 Extraction Results:")
@@ -133,59 +73,100 @@ def extract_pdf_data():
         print("❌ No player data found in PDF")
         return []
 
+def extract_players_with_backend(pdf_path, backend, max_pages, show_preview=False):
+    """Extract the page texts with one backend and parse the players on each page"""
+    
+    texts = extract_page_texts(pdf_path, backend, max_pages)
+    print(f"📄 Pages extracted: {len(texts)}")
+    
+    players = []
+    for page_num, text in enumerate(texts):
+        if show_preview:
+            print(f"📄 Page {page_num + 1} preview:")
+            print(text[:200] + "..." if len(text) > 200 else text)
+            print()
+        
+        # Look for player data patterns
+        players.extend(extract_players_from_text(text, page_num + 1))
+    
+    return players
+
+def compare_backends(pdf_path, max_pages):
+    """Run every installed backend, reporting its time and how its records differ from the default"""
+    
+    print(f"\n🔍 Comparing backends (first {max_pages} pages)")
+    print("-" * 30)
+    
+    results = {}
+    for backend in BACKENDS:
+        if not is_available(backend):
+            print(f"⚠️  {backend_label(backend)}: not installed, skipped")
+            continue
+        try:
+            start = time.perf_counter()
+            players = extract_players_with_backend(pdf_path, backend, max_pages)
+            elapsed = time.perf_counter() - start
+        except Exception as e:
+            print(f"❌ {backend_label(backend)} error: {e}")
+            continue
+        results[backend] = {(p['slide_number'], p['name']): p for p in players}
+        print(f"⏱️  {backend_label(backend)}: {elapsed:.3f}s (import + extraction), {len(players)} players")
+    
+    if not results:
+        print("❌ No PDF backend available")
+        return []
+    
+    reference = DEFAULT_BACKEND if DEFAULT_BACKEND in results else next(iter(results))
+    print(f"\n📊 Record differences against {backend_label(reference)}:")
+    for backend, records in results.items():
+        if backend == reference:
+            continue
+        missing = sorted(set(results[reference]) - set(records))
+        extra = sorted(set(records) - set(results[reference]))
+        changed = sorted(key for key in set(records) & set(results[reference])
+                         if records[key] != results[reference][key])
+        print(f"  {backend_label(backend)}: {len(missing)} missing, {len(extra)} extra, {len(changed)} with different fields")
+        for slide_number, name in missing:
+            print(f"    - slide {slide_number}: {name}")
+        for slide_number, name in extra:
+            print(f"    + slide {slide_number}: {name}")
+        for key in changed:
+            fields = [field for field in records[key] if records[key][field] != results[reference][key].get(field)]
+            print(f"    ~ slide {key[0]}: {key[1]} ({', '.join(fields)})")
+    
+    return list(results[reference].values())
+
 def extract_players_from_text(text, page_num):
-    """Extract player information from text using regex patterns"""
+    """Extract player information from text with the compiled player grammar"""
     
     players = []
     
-    # Common patterns for player data
-    patterns = [
-        # Pattern 1: Name: PlayerName Category: Category Age: XX years Ph: XXXXXXXXXX
-        r'Name:\s*([^:]+?)\s*Category:\s*([^:]+?)\s*Age:\s*(\d+)\s*years?\s*Ph:\s*(\d+)',
+    for record in parse_player_records(text):
+        # Only complete records: name, category, age and phone
+        if not record['complete']:
+            continue
         
-        # Pattern 2: PlayerName Category: Category Age: XX years Ph: XXXXXXXXXX
-        r'^([^:]+?)\s*Category:\s*([^:]+?)\s*Age:\s*(\d+)\s*years?\s*Ph:\s*(\d+)',
+        name = record['name']
+        category = record['category']
+        age = record['age']
+        phone = record['mobile']
         
-        # Pattern 3: Name: PlayerName\nCategory: Category\nAge: XX years\nPh: XXXXXXXXXX
-        r'Name:\s*([^\n]+?)\nCategory:\s*([^\n]+?)\nAge:\s*(\d+)\s*years?\nPh:\s*(\d+)',
+        # Skip if data looks invalid
+        if (len(name) < 2 or len(category) < 2 or 
+            not age.isdigit() or len(phone) < 10):
+            continue
         
-        # Pattern 4: PlayerName\nCategory: Category\nAge: XX years\nPh: XXXXXXXXXX
-        r'^([^\n]+?)\nCategory:\s*([^\n]+?)\nAge:\s*(\d+)\s*years?\nPh:\s*(\d+)',
+        player = {
+            'slide_number': page_num,
+            'name': name,
+            'category': category,
+            'age': age,
+            'mobile': phone,
+            'iconPlayer': record['iconPlayer'],
+            'source': 'PDF'
+        }
         
-        # Pattern 5: More flexible pattern
-        r'([A-Za-z\s\.]+?)\s*Category:\s*([A-Za-z\s]+?)\s*Age:\s*(\d+)\s*years?\s*Ph:\s*(\d+)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.MULTILINE | re.IGNORECASE)
-        
-        for match in matches:
-            if len(match) >= 4:
-                name = match[0].strip()
-                category = match[1].strip()
-                age = match[2].strip()
-                phone = match[3].strip()
-                
-                # Clean up the data
-                name = re.sub(r'\s+', ' ', name).strip()
-                category = re.sub(r'\s+', ' ', category).strip()
-                
-                # Skip if data looks invalid
-                if (len(name) < 2 or len(category) < 2 or 
-                    not age.isdigit() or len(phone) < 10):
-                    continue
-                
-                player = {
-                    'slide_number': page_num,
-                    'name': name,
-                    'category': category,
-                    'age': age,
-                    'mobile': phone,
-                    'iconPlayer': 'No',  # Default, can be updated later
-                    'source': 'PDF'
-                }
-                
-                players.append(player)
+        players.append(player)
     
     return players
 
@@ -268,5 +249,18 @@ def save_extracted_data(players):
     
     print(f"✅ Saved summary: {summary_path}")
 
+def main():
+    """Main function for PDF data extraction."""
+    parser = argparse.ArgumentParser(description="Extract player data from the players PDF.")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default=DEFAULT_BACKEND,
+                        help=f"text extraction engine (default: {DEFAULT_BACKEND}, the fastest)")
+    parser.add_argument("--pages", type=int, default=5,
+                        help="number of pages to extract (default: 5)")
+    parser.add_argument("--compare", action="store_true",
+                        help="run every installed backend and report per-backend time and record differences")
+    args = parser.parse_args()
+
+    extract_pdf_data(backend=args.backend, max_pages=args.pages, compare=args.compare)
+
 if __name__ == "__main__":
-    extract_pdf_data()
+    main()
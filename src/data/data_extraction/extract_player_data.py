@@ -4,49 +4,10 @@ Script to extract player details from PowerPoint file and create structured data
 """
 
 import os
-import re
 import json
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
-
-def clean_text(text):
-    """Clean and normalize text content."""
-    if not text:
-        return ""
-    # Remove extra whitespace and normalize line breaks
-    text = re.sub(r'\s+', ' ', text.strip())
-    return text
-
-def extract_player_name(text):
-    """Extract player name from text."""
-    # Look for patterns like "Name: John Doe" or just "John Doe"
-    if 'Name:' in text or 'NAME:' in text:
-        name = text.split(':', 1)[1].strip()
-    else:
-        # If no "Name:" prefix, assume the first part is the name
-        name = text.split('\n')[0].strip()
-        name = name.split('Category:')[0].strip()
-    
-    return clean_text(name)
-
-def extract_age(text):
-    """Extract age from text."""
-    age_match = re.search(r'(\d+)', text)
-    return age_match.group(1) if age_match else ""
-
-def extract_category(text):
-    """Extract category from text."""
-    if 'Category:' in text or 'CATEGORY:' in text:
-        category = text.split(':', 1)[1].strip()
-        # Clean up category text
-        category = re.sub(r'[^\w\s-]', '', category).strip()
-        return category
-    return ""
-
-def extract_mobile(text):
-    """Extract mobile number from text."""
-    mobile_match = re.search(r'(\d{10,})', text)
-    return mobile_match.group(1) if mobile_match else ""
+from player_grammar import parse_player_records
 
 def extract_player_details(pptx_path):
     """Extract all player details from PowerPoint file."""
@@ -73,14 +34,16 @@ def extract_player_details(pptx_path):
             # Combine all text content
             full_text = ' '.join(text_content)
             
-            # Try to extract player information
-            if full_text and any(keyword in full_text.lower() for keyword in ['name', 'age', 'category', 'batsman', 'bowler', 'all rounder']):
+            # Parse the slide's text boxes (one per line) with the player grammar
+            records = parse_player_records('\n'.join(text_content)) if full_text else []
+            if records:
+                record = records[0]
                 player_info = {
                     'slide_number': slide_num,
-                    'name': extract_player_name(full_text),
-                    'age': extract_age(full_text),
-                    'category': extract_category(full_text),
-                    'mobile': extract_mobile(full_text),
+                    'name': record['name'],
+                    'age': record.get('age', ''),
+                    'category': record.get('category', ''),
+                    'mobile': record.get('mobile', ''),
                     'raw_text': full_text
                 }
                 
@@ -9,8 +9,10 @@ import os
 import re
 from pathlib import Path
 import fitz  # PyMuPDF
-from PIL import Image, ImageOps, ImageFilter, ImageEnhance
-import io
+from PIL import ImageOps, ImageFilter, ImageEnhance
+from pixmap_images import page_image_sizes, load_pixmap, pixmap_to_image
+from pdf_index import load_pdf_index
+from window_scoring import WindowScorer, best_window_box
 import numpy as np
 
 def face_focused_extract_player_photos():
@@ -47,6 +49,9 @@ def face_focused_extract_player_photos():
         total_pages = doc.page_count
         print(f"📄 PDF has {total_pages} pages")
         
+        # Page and image metadata from the sidecar index (the PDF is only rescanned when it changes)
+        pdf_index = load_pdf_index(pdf_path)
+        
         extracted_count = 0
         failed_count = 0
         
@@ -62,7 +67,7 @@ def face_focused_extract_player_photos():
             print(f"\\n🔍 Processing slide {slide_num} ({i+1}/{len(players_data)}): {player['name']}")
             
             # Extract image with face-focused cropping
-            success = extract_face_focused_photo(doc, page_num, player, output_dir)
+            success = extract_face_focused_photo(doc, page_num, player, output_dir, pdf_index)
             
             if success:
                 extracted_count += 1
@@ -85,41 +90,26 @@ def face_focused_extract_player_photos():
         print(f"❌ Error: {e}")
         return 0, 0
 
-def extract_face_focused_photo(doc, page_num, player, output_dir):
-    """Extract and crop focusing on facial features"""
+def extract_face_focused_photo(doc, page_num, player, output_dir, pdf_index=None):
+    """Extract and crop focusing on facial features (image sizes from the PdfIndex if given)"""
     
     try:
-        page = doc[page_num]
-        
-        # Get images on the page
-        image_list = page.get_images(full=True)
+        # Get images on the page (sizes from the sidecar index or image metadata, nothing decoded yet)
+        image_list = pdf_index.page_image_sizes(page_num) if pdf_index else page_image_sizes(doc[page_num])
         
         if not image_list:
             print(f"   No images found on page {page_num + 1}")
             return False
         
         # Process each image on the page
-        for img_index, img in enumerate(image_list):
-            # Get image data
-            xref = img[0]
-            pix = fitz.Pixmap(doc, xref)
-            
+        for img_index, xref, width, height in image_list:
             # Skip if image is too small
-            if pix.width < 100 or pix.height < 100:
-                pix = None
+            if width < 100 or height < 100:
                 continue
             
-            # Convert to PIL Image
-            if pix.n - pix.alpha < 4:  # GRAY or RGB
-                img_data = pix.tobytes("png")
-                pil_image = Image.open(io.BytesIO(img_data))
-            else:  # CMYK: convert to RGB first
-                pix1 = fitz.Pixmap(fitz.csRGB, pix)
-                img_data = pix1.tobytes("png")
-                pil_image = Image.open(io.BytesIO(img_data))
-                pix1 = None
-            
-            pix = None
+            # Decode the image and copy its samples into a PIL image (no PNG round trip)
+            pix = load_pixmap(doc, xref)
+            pil_image = pixmap_to_image(pix)
             
             # Apply face-focused cropping
             cropped_image = face_focused_crop(pil_image, page_num)
@@ -151,7 +141,7 @@ def face_focused_crop(image, page_num):
         img_array = np.array(image)
         
         # Strategy 1: Skin tone detection and face region finding
-        face_crop = detect_face_region(image, img_array)
+        face_crop = detect_face_region(image, img_array, FACE_WINDOW_SIZES)
         if face_crop:
             return face_crop
         
@@ -177,58 +167,64 @@ def face_focused_crop(image, page_num):
         print(f"   ⚠️  Face-focused crop error: {e}")
         return image
 
-def detect_face_region(image, img_array):
-    """Detect face region using skin tone and shape analysis"""
+# Skin window sizes for the face search, largest first (larger faces win ties)
+FACE_WINDOW_SIZES = (200, 150, 100)
+
+def skin_tone_mask(image):
+    """Skin-tone mask of an image: HSV hue 0-20, saturation 20-255, value 70-255"""
+    hsv = np.array(image.convert('HSV'))
+    return (hsv[:, :, 0] <= 20) & (hsv[:, :, 1] >= 20) & (hsv[:, :, 2] >= 70)
+
+def _face_box(x, y, max_size, width, height, limit_height):
+    """Expand a window corner at (x, y) to a face box; None if it would be under 100x100"""
+    face_size = min(max_size, width - x, limit_height - y)
+    left = max(0, x - face_size//4)
+    top = max(0, y - face_size//4)
+    right = min(width, left + face_size)
+    bottom = min(height, top + face_size)
+    
+    if right - left >= 100 and bottom - top >= 100:
+        return (left, top, right, bottom)
+    return None
+
+def detect_face_region(image, img_array, window_sizes=(100,)):
+    """
+    Detect face region using skin tone and shape analysis.
+    Every window (stride 20) of every size in window_sizes is scored at once from a
+    summed-area table of the skin mask, and the best window is expanded to a face box of
+    up to three times its size (300px for the original 100px window). With several sizes,
+    the size whose best window has the highest skin ratio wins; the earlier size on ties.
+    """
     
     try:
-        # Convert to HSV for better skin tone detection
-        hsv = np.array(image.convert('HSV'))
-        
-        # Define skin tone ranges in HSV
-        lower_skin = np.array([0, 20, 70], dtype=np.uint8)
-        upper_skin = np.array([20, 255, 255], dtype=np.uint8)
-        
-        # Create skin mask
-        skin_mask = np.zeros(hsv.shape[:2], dtype=np.uint8)
-        for i in range(hsv.shape[0]):
-            for j in range(hsv.shape[1]):
-                pixel = hsv[i, j]
-                if (lower_skin[0] <= pixel[0] <= upper_skin[0] and
-                    lower_skin[1] <= pixel[1] <= upper_skin[1] and
-                    lower_skin[2] <= pixel[2] <= upper_skin[2]):
-                    skin_mask[i, j] = 255
-        
-        # Find contours in skin mask
+        # Skin mask from the HSV skin tone ranges
+        skin_mask = skin_tone_mask(image)
         height, width = skin_mask.shape
+        scorer = WindowScorer(skin_mask)
+        
+        # Window corners as in the original 20px scan, stopping 50px before the edge
+        windows = [(region_size, 20, 50) for region_size in window_sizes]
+        skin_count_maps = scorer.score_maps(windows, stat='sum')
+        skin_share_maps = scorer.score_maps(windows, stat='mean')
         
         # Look for the largest skin region (likely face)
         best_region = None
-        best_size = 0
-        
-        # Scan for skin regions
-        for y in range(0, height - 50, 20):
-            for x in range(0, width - 50, 20):
-                # Check region around this point
-                region_size = 100
-                end_y = min(y + region_size, height)
-                end_x = min(x + region_size, width)
-                
-                skin_pixels = np.sum(skin_mask[y:end_y, x:end_x])
-                region_area = (end_y - y) * (end_x - x)
-                skin_ratio = skin_pixels / region_area if region_area > 0 else 0
-                
-                # If significant skin content, this might be a face
-                if skin_ratio > 0.1 and skin_pixels > best_size:
-                    best_size = skin_pixels
-                    # Expand region to capture full face
-                    face_size = min(300, width - x, height - y)
-                    left = max(0, x - face_size//4)
-                    top = max(0, y - face_size//4)
-                    right = min(width, left + face_size)
-                    bottom = min(height, top + face_size)
-                    
-                    if right - left >= 100 and bottom - top >= 100:
-                        best_region = (left, top, right, bottom)
+        best_ratio = 0
+        
+        for region_size in window_sizes:
+            ys, xs, skin_counts = skin_count_maps[(region_size, 20)]
+            _, _, skin_share = skin_share_maps[(region_size, 20)]
+            # The mask used to be 0/255, so the 0.1 ratio test is on the 255-scaled sum
+            skin_pixels = skin_counts * 255
+            skin_ratio = skin_share * 255
+            
+            # If significant skin content, this might be a face
+            scores = np.where(skin_ratio > 0.1, skin_pixels, 0)
+            region, index = best_window_box(
+                scores, ys, xs, lambda x, y: _face_box(x, y, 3 * region_size, width, height, height))
+            if region and skin_ratio.flat[index] > best_ratio:
+                best_ratio = skin_ratio.flat[index]
+                best_region = region
         
         if best_region:
             left, top, right, bottom = best_region
@@ -260,31 +256,10 @@ def detect_facial_features(image, img_array):
         # Focus on upper portion where faces typically are
         upper_height = int(height * 0.6)  # Focus on upper 60%
         
-        best_region = None
-        best_edge_density = 0
-        
-        # Scan upper portion for high edge density regions
-        for y in range(0, upper_height - 100, 30):
-            for x in range(0, width - 100, 30):
-                # Check region
-                region_size = 150
-                end_y = min(y + region_size, upper_height)
-                end_x = min(x + region_size, width)
-                
-                region_edges = edges[y:end_y, x:end_x]
-                edge_density = np.mean(region_edges)
-                
-                if edge_density > best_edge_density:
-                    best_edge_density = edge_density
-                    # Expand to capture full face
-                    face_size = min(250, width - x, upper_height - y)
-                    left = max(0, x - face_size//4)
-                    top = max(0, y - face_size//4)
-                    right = min(width, left + face_size)
-                    bottom = min(height, top + face_size)
-                    
-                    if right - left >= 100 and bottom - top >= 100:
-                        best_region = (left, top, right, bottom)
+        # Mean edge density of every 150px window (stride 30) in the upper portion
+        ys, xs, edge_density = WindowScorer(edges[:upper_height]).score_map(150, 30, margin=100, stat='mean')
+        best_region, _ = best_window_box(
+            edge_density, ys, xs, lambda x, y: _face_box(x, y, 250, width, height, upper_height))
         
         if best_region:
             left, top, right, bottom = best_region
@@ -344,36 +319,13 @@ def contrast_based_crop(image, img_array):
         
         height, width = gray_array.shape
         
-        # Calculate local contrast
-        best_region = None
-        best_contrast = 0
-        
         # Focus on upper portion
         upper_height = int(height * 0.7)
         
-        for y in range(0, upper_height - 100, 25):
-            for x in range(0, width - 100, 25):
-                # Check region
-                region_size = 120
-                end_y = min(y + region_size, upper_height)
-                end_x = min(x + region_size, width)
-                
-                region = gray_array[y:end_y, x:end_x]
-                
-                # Calculate contrast (standard deviation)
-                contrast = np.std(region)
-                
-                if contrast > best_contrast:
-                    best_contrast = contrast
-                    # Expand region
-                    face_size = min(200, width - x, upper_height - y)
-                    left = max(0, x - face_size//4)
-                    top = max(0, y - face_size//4)
-                    right = min(width, left + face_size)
-                    bottom = min(height, top + face_size)
-                    
-                    if right - left >= 100 and bottom - top >= 100:
-                        best_region = (left, top, right, bottom)
+        # Local contrast (standard deviation) of every 120px window (stride 25)
+        ys, xs, contrast = WindowScorer(gray_array[:upper_height]).score_map(120, 25, margin=100, stat='std')
+        best_region, _ = best_window_box(
+            contrast, ys, xs, lambda x, y: _face_box(x, y, 200, width, height, upper_height))
         
         if best_region:
             left, top, right, bottom = best_region
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Image Asset Cache
+Document-level index of the images embedded in a PDF, keyed by xref and content digest.
+Slides reuse the same background, logo and decoration images; an image whose content
+appears on several pages is classified as a decoration once, and later pages skip it
+with a dictionary lookup instead of decoding it and running crop strategies on it.
+Given a PdfIndex, the cache is built from the sidecar without reading the PDF's image streams.
+"""
+
+import hashlib
+from pixmap_images import load_pixmap
+
+class ImageAssetCache:
+    """
+    Size, digest, pages and classification ('decoration' or 'photo') of every image in a document.
+    """
+
+    def __init__(self, doc, min_repeats=2, pdf_index=None):
+        """
+        Args:
+            doc: open fitz.Document
+            min_repeats (int): Pages an image must appear on to count as a decoration
+            pdf_index (PdfIndex): Sidecar index of the same PDF (sizes and digests already known)
+        """
+        self.doc = doc
+        self.min_repeats = min_repeats
+        self.pdf_index = pdf_index
+        self.entries = {}       # xref -> entry
+        self.by_digest = {}     # content digest -> entry shared by identical images
+        self._indexed = False
+
+    def _page_images(self):
+        """(page_num, xref, width, height, digest) for every image placement, page by page."""
+        if self.pdf_index:
+            for page_num in range(self.pdf_index.page_count):
+                for img in self.pdf_index.page_images(page_num):
+                    yield page_num, img['xref'], img['width'], img['height'], img['digest']
+            return
+        digests = {}
+        for page_num in range(self.doc.page_count):
+            for img in self.doc[page_num].get_images(full=True):
+                xref = img[0]
+                if xref not in digests:
+                    digests[xref] = hashlib.sha1(self.doc.xref_stream_raw(xref)).hexdigest()
+                yield page_num, xref, img[2], img[3], digests[xref]
+
+    def _build_index(self):
+        """Walk the image metadata of every page once; no pixels are decoded."""
+        for page_num, xref, width, height, digest in self._page_images():
+            if xref not in self.entries:
+                # Identical images stored under different xrefs share one entry
+                entry = self.by_digest.setdefault(digest, {
+                    'digest': digest,
+                    'width': width,
+                    'height': height,
+                    'pages': set(),
+                    'xrefs': set(),
+                })
+                entry['xrefs'].add(xref)
+                self.entries[xref] = entry
+            self.entries[xref]['pages'].add(page_num)
+
+        for entry in self.by_digest.values():
+            entry['kind'] = 'decoration' if len(entry['pages']) >= self.min_repeats else 'photo'
+        self._indexed = True
+
+    def entry(self, xref):
+        """Cache entry of an image: digest, width, height, pages, xrefs and kind."""
+        if not self._indexed:
+            self._build_index()
+        return self.entries[xref]
+
+    def is_decoration(self, xref):
+        """True if the image is a repeated slide asset (background, logo, decoration)."""
+        return self.entry(xref)['kind'] == 'decoration'
+
+    def pixmap(self, xref):
+        """Decode an image (see load_pixmap) and remember its decoded size."""
+        pix = load_pixmap(self.doc, xref)
+        entry = self.entry(xref)
+        entry['width'], entry['height'] = pix.width, pix.height
+        return pix
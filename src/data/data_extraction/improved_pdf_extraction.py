@@ -7,6 +7,7 @@ import json
 import re
 import os
 from pathlib import Path
+from player_grammar import parse_player_records
 
 def improved_pdf_extraction():
     """Improved extraction with better pattern matching"""
@@ -23,20 +24,19 @@ def improved_pdf_extraction():
     
     print(f"📁 PDF file: {os.path.basename(pdf_path)}")
     
-    # Use PyMuPDF for better text extraction
+    # Use the PyMuPDF sidecar index for text extraction
     try:
-        import fitz
-        print("🔍 Using PyMuPDF for extraction...")
+        from pdf_index import load_pdf_index
+        print("🔍 Using the PDF sidecar index for extraction...")
         
-        doc = fitz.open(pdf_path)
-        total_pages = doc.page_count
+        pdf_index = load_pdf_index(pdf_path)
+        total_pages = pdf_index.page_count
         print(f"📄 Total pages: {total_pages}")
         
         all_players = []
         
         for page_num in range(total_pages):
-            page = doc[page_num]
-            text = page.get_text()
+            text = pdf_index.page_text(page_num)
             
             # Extract players from this page
             players = extract_players_from_page(text, page_num + 1)
@@ -47,8 +47,6 @@ def improved_pdf_extraction():
                 print("-" * 30)
                 print(text[:300] + "..." if len(text) > 300 else text)
         
-        doc.close()
-        
         # Process and clean data
         processed_players = process_extracted_players(all_players)
         
@@ -75,59 +73,23 @@ def improved_pdf_extraction():
         return []
 
 def extract_players_from_page(text, page_num):
-    """Extract player data from a single page"""
+    """Extract player data from a single page with the compiled player grammar"""
     
     players = []
     
-    # Split text into lines for better processing
-    lines = text.split('\n')
-    
-    # Look for player data patterns
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Look for "Name:" pattern
-        if line.startswith('Name:'):
-            player = {}
-            
-            # Extract name
-            name = line.replace('Name:', '').strip()
-            if name:
-                player['name'] = name
-                player['page'] = page_num
-                
-                # Look for next lines with category, age, phone
-                j = i + 1
-                while j < len(lines) and j < i + 10:  # Look within next 10 lines
-                    next_line = lines[j].strip()
-                    
-                    if next_line.startswith('Category:'):
-                        category = next_line.replace('Category:', '').strip()
-                        player['category'] = category
-                    elif next_line.startswith('Age:'):
-                        age_match = re.search(r'Age:\s*(\d+)', next_line)
-                        if age_match:
-                            player['age'] = age_match.group(1)
-                    elif next_line.startswith('Ph:'):
-                        phone_match = re.search(r'Ph:\s*(\d+)', next_line)
-                        if phone_match:
-                            player['mobile'] = phone_match.group(1)
-                    elif 'ICON' in next_line.upper():
-                        player['iconPlayer'] = 'Yes'
-                    
-                    j += 1
-                
-                # Only add if we have essential data
-                if 'name' in player and 'category' in player and 'age' in player:
-                    if 'mobile' not in player:
-                        player['mobile'] = ''
-                    if 'iconPlayer' not in player:
-                        player['iconPlayer'] = 'No'
-                    
-                    players.append(player)
-        
-        i += 1
+    for record in parse_player_records(text):
+        # Only labelled players ("Name:") with the essential data
+        if record['sources'].get('name') != 'label':
+            continue
+        if 'category' in record and 'age' in record:
+            players.append({
+                'name': record['name'],
+                'page': page_num,
+                'category': record['category'],
+                'age': record['age'],
+                'mobile': record.get('mobile', ''),
+                'iconPlayer': record['iconPlayer'],
+            })
     
     return players
 
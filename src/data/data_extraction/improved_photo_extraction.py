@@ -11,6 +11,7 @@ import fitz  # PyMuPDF
 from PIL import Image, ImageOps
 import io
 import numpy as np
+from window_scoring import WindowScorer, best_window_box
 
 def improved_extract_player_photos():
     """Extract player photos with improved cropping"""
@@ -288,33 +289,26 @@ def variance_based_crop(image, img_array):
     try:
         height, width = img_array.shape[:2]
         
-        # Calculate local variance
+        # Local colour variance of every 20x20 block (stride 20), averaged over the channels
         step = 20
-        best_region = None
-        best_variance = 0
+        planes = np.moveaxis(img_array, -1, 0) if img_array.ndim == 3 else [img_array]
+        maps = [WindowScorer(plane).score_map(step, step, stat='var') for plane in planes]
+        ys, xs = maps[0][:2]
+        variance = np.mean([scores for _, _, scores in maps], axis=0)
+        
+        def crop_box(x, y):
+            # Define crop region around this point
+            crop_size = min(400, width - x, height - y)
+            left = max(0, x - crop_size//2)
+            top = max(0, y - crop_size//2)
+            right = min(width, left + crop_size)
+            bottom = min(height, top + crop_size)
+            
+            if right - left >= 100 and bottom - top >= 100:
+                return (left, top, right, bottom)
+            return None
         
-        for y in range(0, height - step, step):
-            for x in range(0, width - step, step):
-                # Get region
-                region = img_array[y:y+step, x:x+step]
-                
-                # Calculate variance
-                if len(region.shape) == 3:  # RGB
-                    variance = np.var(region.reshape(-1, 3), axis=0).mean()
-                else:  # Grayscale
-                    variance = np.var(region)
-                
-                if variance > best_variance:
-                    best_variance = variance
-                    # Define crop region around this point
-                    crop_size = min(400, width - x, height - y)
-                    left = max(0, x - crop_size//2)
-                    top = max(0, y - crop_size//2)
-                    right = min(width, left + crop_size)
-                    bottom = min(height, top + crop_size)
-                    
-                    if right - left >= 100 and bottom - top >= 100:
-                        best_region = (left, top, right, bottom)
+        best_region, _ = best_window_box(variance, ys, xs, crop_box)
         
         if best_region:
             left, top, right, bottom = best_region
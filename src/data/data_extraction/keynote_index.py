@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Keynote Index
+Streaming text index of a Keynote (.key) archive.
+Zip members are classified once from their name and size (slide content, images,
+metadata, other); only the slide-content XML is read, through an incremental parser
+(iterparse), so images and metadata are never decompressed and large decks are read in
+bounded memory. The text runs (paragraphs) per slide are cached in a JSON sidecar keyed by the
+archive's size and modification time.
+"""
+
+import os
+import re
+import gzip
+import json
+import zipfile
+import xml.etree.ElementTree as ET
+
+INDEX_VERSION = 3
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.tif', '.tiff', '.heic', '.pdf', '.bmp')
+XML_EXTENSIONS = ('.xml', '.apxl', '.apxl.gz')
+
+# Elements holding text (local names: Keynote sf:text / sf:p, generic text, DrawingML a:t).
+# Each one starts a run (line); inline sf:span runs stay part of their paragraph.
+TEXT_ELEMENTS = {'p', 'text', 't'}
+SLIDE_ELEMENT = 'slide'
+SLIDE_NUMBER_PATTERN = re.compile(r'(\d+)')
+SPACES_PATTERN = re.compile(r'\s+')
+
+def index_path_for(keynote_path):
+    """Sidecar index path for a Keynote archive: <archive>.index.json next to it."""
+    return keynote_path + '.index.json'
+
+def _source_stamp(keynote_path):
+    stat = os.stat(keynote_path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+def classify_member(info):
+    """
+    Kind of a zip member from its name and size, without reading it:
+    'slide' (XML slide content), 'image', 'metadata' or 'other'.
+    """
+    name = info.filename.lower()
+    base = os.path.basename(name)
+    if info.is_dir() or info.file_size == 0:
+        return 'other'
+    if name.endswith(IMAGE_EXTENSIONS):
+        return 'image'
+    if name.startswith('metadata/') or name.endswith('.plist') or base in ('buildversionhistory.plist',):
+        return 'metadata'
+    if name.endswith(XML_EXTENSIONS) and ('slide' in name or base.startswith(('index.', 'presentation.'))):
+        return 'slide'
+    return 'other'
+
+def _local_name(tag):
+    """Element name without its namespace."""
+    return tag.rsplit('}', 1)[-1].lower()
+
+def _clean(text):
+    return SPACES_PATTERN.sub(' ', text).strip()
+
+def stream_slide_texts(stream, default_slide=None):
+    """
+    Pull the text runs out of one XML member with iterparse, clearing elements as they end.
+    Text is collected in document order, as itertext() walks it; every text element
+    (a paragraph) starts a new run, so paragraphs stay separate lines and a container's
+    loose text stays where it was written.
+
+    Args:
+        stream: binary file object of the member
+        default_slide (int): Slide number for members holding a single slide (from the member name)
+
+    Returns:
+        dict: slide number -> list of text runs, in document order
+    """
+    slides = {}
+    slide_count = 0
+    current = default_slide
+    path = []       # open elements, each with its last closed child: [elem, last_child]
+    buffers = []    # text collected for each open text element, innermost last
+
+    def collect(text):
+        if buffers and text:
+            buffers[-1].append(text)
+
+    def flush():
+        text = _clean(''.join(buffers[-1]))
+        buffers[-1] = []
+        if text and current is not None:
+            slides.setdefault(current, []).append(text)
+
+    # An element's text and its children's tails are only complete once the next
+    # element starts or the element ends, so they are collected at those events
+    for event, elem in ET.iterparse(stream, events=('start', 'end')):
+        name = _local_name(elem.tag)
+        if event == 'start':
+            if path:
+                parent, last_child = path[-1]
+                collect(parent.text if last_child is None else last_child.tail)
+            if name == SLIDE_ELEMENT:
+                slide_count += 1
+                current = slide_count
+            elif name in TEXT_ELEMENTS:
+                if buffers:
+                    flush()
+                buffers.append([])
+            path.append([elem, None])
+            continue
+
+        _, last_child = path.pop()
+        collect(elem.text if last_child is None else last_child.tail)
+        if name in TEXT_ELEMENTS:
+            flush()
+            buffers.pop()
+        if path:
+            path[-1][1] = elem
+        if not buffers:
+            elem.clear()
+    return slides
+
+def _member_slide_number(filename):
+    match = SLIDE_NUMBER_PATTERN.search(os.path.basename(filename))
+    return int(match.group(1)) if match else None
+
+def scan_keynote(keynote_path):
+    """
+    Classify every member of the archive and stream the slide-content members.
+
+    Returns:
+        dict: Index with the version, source stamp, member counts per kind and
+              'slides' (slide number as a string -> text runs)
+    """
+    members = {}
+    slides = {}
+
+    with zipfile.ZipFile(keynote_path, 'r') as zip_file:
+        infos = zip_file.infolist()
+        for info in infos:
+            kind = classify_member(info)
+            members[kind] = members.get(kind, 0) + 1
+            if kind != 'slide':
+                continue
+            try:
+                with zip_file.open(info) as member:
+                    stream = gzip.GzipFile(fileobj=member) if info.filename.endswith('.gz') else member
+                    member_slides = stream_slide_texts(stream, _member_slide_number(info.filename))
+            except (ET.ParseError, OSError) as e:
+                print(f"⚠️  Skipping {info.filename}: {e}")
+                continue
+            for slide_num, texts in member_slides.items():
+                slides.setdefault(str(slide_num), []).extend(texts)
+
+    return {
+        'version': INDEX_VERSION,
+        'source': dict(_source_stamp(keynote_path), name=os.path.basename(keynote_path)),
+        'members': members,
+        'slides': slides,
+    }
+
+def load_keynote_index(keynote_path, index_path=None, rebuild=False):
+    """
+    Slide texts of a Keynote archive, from the sidecar cache when the archive's
+    size and modification time are unchanged, otherwise rescanned and cached.
+
+    Returns:
+        dict: See scan_keynote()
+    """
+    index_path = index_path or index_path_for(keynote_path)
+
+    if not rebuild and os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            source = data.get('source', {})
+            stamp = _source_stamp(keynote_path)
+            if (data.get('version') == INDEX_VERSION and source.get('size') == stamp['size']
+                    and source.get('mtime') == stamp['mtime']):
+                return data
+        except (OSError, ValueError):
+            pass  # unreadable cache: rescan below
+
+    data = scan_keynote(keynote_path)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, index_path)
+    return data
+
+def slide_texts(index):
+    """slide number (int) -> text runs, from a loaded index."""
+    return {int(slide_num): texts for slide_num, texts in index['slides'].items()}
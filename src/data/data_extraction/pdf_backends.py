@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+PDF Backends
+Pluggable text extraction engines for the players PDF (PyMuPDF, pdfplumber, PyPDF2).
+Each engine imports its library only when it runs, so a normal extraction pays for one
+library import and one text pass; the others are only loaded for comparisons.
+"""
+
+import importlib.util
+
+DEFAULT_BACKEND = 'pymupdf'
+
+def _pymupdf_texts(pdf_path, max_pages):
+    import fitz
+    doc = fitz.open(pdf_path)
+    try:
+        page_count = doc.page_count if max_pages is None else min(doc.page_count, max_pages)
+        return [doc[page_num].get_text() for page_num in range(page_count)]
+    finally:
+        doc.close()
+
+def _pdfplumber_texts(pdf_path, max_pages):
+    import pdfplumber
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages[:max_pages]]
+
+def _pypdf2_texts(pdf_path, max_pages):
+    import PyPDF2
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [page.extract_text() or '' for page in pdf_reader.pages[:max_pages]]
+
+# Backend name -> (display name, module to import, page text function); fastest first
+BACKENDS = {
+    'pymupdf': ('PyMuPDF', 'fitz', _pymupdf_texts),
+    'pdfplumber': ('pdfplumber', 'pdfplumber', _pdfplumber_texts),
+    'pypdf2': ('PyPDF2', 'PyPDF2', _pypdf2_texts),
+}
+
+def backend_label(backend):
+    """Display name of a backend."""
+    return BACKENDS[backend][0]
+
+def is_available(backend):
+    """True if the backend's library is installed (checked without importing it)."""
+    return importlib.util.find_spec(BACKENDS[backend][1]) is not None
+
+def available_backends():
+    """Installed backends, fastest first."""
+    return [backend for backend in BACKENDS if is_available(backend)]
+
+def extract_page_texts(pdf_path, backend=DEFAULT_BACKEND, max_pages=None):
+    """
+    Extract the text of each page with one engine.
+
+    Args:
+        pdf_path (str): PDF file
+        backend (str): 'pymupdf', 'pdfplumber' or 'pypdf2'
+        max_pages (int): Only the first max_pages pages (None: all)
+
+    Returns:
+        list: Text per page, in page order
+
+    Raises:
+        ValueError: Unknown backend
+        ImportError: The backend's library is not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend {backend!r}, expected one of {sorted(BACKENDS)}")
+    texts = BACKENDS[backend][2]
+    return texts(pdf_path, max_pages)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+PDF Index
+Single-pass scanner for the players PDF.
+Every page is visited once to collect its geometry, text (plain, and per block and word
+with bounding boxes) and embedded-image metadata (xref, size, placement bbox, content digest).
+The result is kept in a compact JSON sidecar next to the PDF, so the text and photo
+extractors read page data from the sidecar instead of re-parsing the PDF each run.
+Large decks can be scanned by several processes, each with its own document handle
+and page range; the pages are merged back in page order.
+"""
+
+import os
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import fitz  # PyMuPDF
+
+INDEX_VERSION = 2
+
+def index_path_for(pdf_path):
+    """Sidecar index path for a PDF: <pdf>.index.json next to it."""
+    return pdf_path + '.index.json'
+
+def _source_stamp(pdf_path):
+    """Size and modification time, used to tell whether a sidecar is stale."""
+    stat = os.stat(pdf_path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+def _rounded(bbox):
+    return [round(value, 2) for value in bbox]
+
+def scan_page(doc, page, digests):
+    """
+    Collect everything the extractors need from one page.
+
+    Args:
+        doc: open fitz.Document
+        page: fitz.Page
+        digests (dict): xref -> content digest, shared across pages so each image is hashed once
+
+    Returns:
+        dict: number (1-based), width, height, rotation, text, blocks, words and images
+    """
+    placements = {}
+    for info in page.get_image_info(xrefs=True):
+        placements.setdefault(info['xref'], []).append(_rounded(info['bbox']))
+
+    images = []
+    for img in page.get_images(full=True):
+        xref = img[0]
+        if xref not in digests:
+            digests[xref] = hashlib.sha1(doc.xref_stream_raw(xref)).hexdigest()
+        images.append({
+            'xref': xref,
+            'width': img[2],
+            'height': img[3],
+            'bbox': placements.get(xref, []),
+            'digest': digests[xref],
+        })
+
+    # Text blocks only (block type 0): [x0, y0, x1, y1, text]
+    blocks = [_rounded(block[:4]) + [block[4]]
+              for block in page.get_text("blocks") if block[6] == 0]
+
+    # Words: [x0, y0, x1, y1, text, block_no, line_no]
+    words = [_rounded(word[:4]) + list(word[4:7]) for word in page.get_text("words")]
+
+    return {
+        'number': page.number + 1,
+        'width': round(page.rect.width, 2),
+        'height': round(page.rect.height, 2),
+        'rotation': page.rotation,
+        'text': page.get_text(),
+        'blocks': blocks,
+        'words': words,
+        'images': images,
+    }
+
+def page_ranges(page_count, parts):
+    """Split range(page_count) into at most `parts` contiguous (start, stop) ranges of near-equal size."""
+    parts = max(1, min(parts, page_count))
+    bounds = [page_count * part // parts for part in range(parts + 1)]
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+def scan_page_range(pdf_path, start, stop):
+    """Scan pages [start, stop) with a document handle of its own (safe to run in a worker process)."""
+    doc = fitz.open(pdf_path)
+    try:
+        digests = {}
+        return [scan_page(doc, doc[page_num], digests) for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+def map_page_ranges(func, ranges, *args, executor=None):
+    """
+    Run func(*args, start, stop) for every (start, stop) range in worker processes.
+
+    Args:
+        func: picklable (top-level) function
+        ranges (list): (start, stop) page ranges, see page_ranges()
+        executor: ProcessPoolExecutor to use (default: a new one with a process per range)
+
+    Returns:
+        list: func's result per range, in range order
+    """
+    if executor is not None:
+        futures = [executor.submit(func, *args, start, stop) for start, stop in ranges]
+        return [future.result() for future in futures]
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(func, *args, start, stop) for start, stop in ranges]
+        return [future.result() for future in futures]
+
+def scan_document(pdf_path, workers=1, executor=None):
+    """
+    Visit every page of a PDF once.
+
+    Args:
+        pdf_path (str): PDF file
+        workers (int): Processes scanning page ranges in parallel (1: serial)
+        executor: ProcessPoolExecutor to run the page ranges on (default: a new one of workers processes)
+
+    Returns:
+        dict: Index with the format version, source stamp, page count and per-page data
+              (the same for any number of workers)
+    """
+    doc = fitz.open(pdf_path)
+    page_count = doc.page_count
+    doc.close()
+
+    ranges = page_ranges(page_count, workers)
+    if len(ranges) > 1:
+        pages = []
+        for range_pages in map_page_ranges(scan_page_range, ranges, pdf_path, executor=executor):
+            pages.extend(range_pages)
+        # Merge deterministically by page number
+        pages.sort(key=lambda page: page['number'])
+    else:
+        pages = scan_page_range(pdf_path, 0, page_count)
+
+    return {
+        'version': INDEX_VERSION,
+        'source': dict(_source_stamp(pdf_path), name=os.path.basename(pdf_path)),
+        'page_count': len(pages),
+        'pages': pages,
+    }
+
+def write_index(data, index_path):
+    """Write an index as compact JSON (atomically, via a temporary file)."""
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, index_path)
+
+def _is_current(data, pdf_path):
+    if data.get('version') != INDEX_VERSION:
+        return False
+    stamp = _source_stamp(pdf_path)
+    source = data.get('source', {})
+    return source.get('size') == stamp['size'] and source.get('mtime') == stamp['mtime']
+
+def load_pdf_index(pdf_path, index_path=None, rebuild=False, workers=1, executor=None):
+    """
+    Load the sidecar index of a PDF, scanning the PDF first if the sidecar is
+    missing, from an older index version, or older than the PDF.
+
+    Args:
+        pdf_path (str): PDF file
+        index_path (str): Sidecar location (default: index_path_for(pdf_path))
+        rebuild (bool): Always rescan the PDF
+        workers (int): Processes used if the PDF has to be scanned
+        executor: ProcessPoolExecutor for that scan (default: a new one of workers processes)
+
+    Returns:
+        PdfIndex
+    """
+    index_path = index_path or index_path_for(pdf_path)
+
+    if not rebuild and os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if _is_current(data, pdf_path):
+                return PdfIndex(data)
+        except (OSError, ValueError):
+            pass  # unreadable sidecar: rescan below
+
+    print(f"🔍 Scanning {os.path.basename(pdf_path)} into {os.path.basename(index_path)}...")
+    data = scan_document(pdf_path, workers, executor)
+    write_index(data, index_path)
+    return PdfIndex(data)
+
+class PdfIndex:
+    """
+    Read-only view of a scanned PDF. Page numbers are 0-based, like doc[page_num].
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.pages = data['pages']
+
+    @property
+    def page_count(self):
+        return self.data['page_count']
+
+    def page(self, page_num):
+        """Everything recorded for one page."""
+        return self.pages[page_num]
+
+    def page_text(self, page_num):
+        """Plain text of a page, as page.get_text() returns it."""
+        return self.pages[page_num]['text']
+
+    def page_blocks(self, page_num):
+        """Text blocks of a page: [x0, y0, x1, y1, text] in reading order."""
+        return self.pages[page_num]['blocks']
+
+    def page_words(self, page_num):
+        """Words of a page: [x0, y0, x1, y1, text, block_no, line_no], as page.get_text("words")."""
+        return self.pages[page_num]['words']
+
+    def page_images(self, page_num):
+        """Embedded images of a page: xref, width, height, bbox (placements) and digest."""
+        return self.pages[page_num]['images']
+
+    def page_image_sizes(self, page_num, min_width=0, min_height=0, min_area=0):
+        """
+        Same result as pixmap_images.page_image_sizes, without touching the PDF.
+
+        Returns:
+            list: (img_index, xref, width, height) per image, in page order
+        """
+        sizes = []
+        for img_index, img in enumerate(self.pages[page_num]['images']):
+            width, height = img['width'], img['height']
+            if width < min_width or height < min_height or width * height < min_area:
+                continue
+            sizes.append((img_index, img['xref'], width, height))
+        return sizes
+
+def main():
+    """Build (or rebuild) the sidecar index of a PDF."""
+    parser = argparse.ArgumentParser(description="Scan a PDF once into a sidecar index for the extractors.")
+    parser.add_argument("pdf_path", help="PDF to index")
+    parser.add_argument("--index", help="sidecar path (default: <pdf>.index.json)")
+    parser.add_argument("--rebuild", action="store_true", help="rescan even if the sidecar is current")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes scanning page ranges in parallel (default: 1, serial)")
+    args = parser.parse_args()
+
+    pdf_index = load_pdf_index(args.pdf_path, args.index, args.rebuild, args.workers)
+    images = sum(len(page['images']) for page in pdf_index.pages)
+    print(f"✅ {pdf_index.page_count} pages, {images} image placements indexed")
+
+if __name__ == "__main__":
+    main()
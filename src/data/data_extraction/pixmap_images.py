@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Pixmap Images
+Direct access to the images embedded in a PDF page.
+Sizes come from the page's image metadata, so small images are skipped before any
+pixels are decoded, and decoded pixmaps are wrapped as NumPy arrays (zero-copy) or
+PIL images without a PNG encode/decode round trip.
+"""
+
+import fitz  # PyMuPDF
+from PIL import Image
+import numpy as np
+
+# PIL modes for pixmaps with 1-4 components (gray, gray+alpha, RGB, RGB+alpha)
+PIXMAP_MODES = {1: 'L', 2: 'LA', 3: 'RGB', 4: 'RGBA'}
+
+def page_image_sizes(page, min_width=0, min_height=0, min_area=0):
+    """
+    List the embedded images of a page with their size, from the image metadata only.
+
+    Args:
+        page: fitz.Page
+        min_width, min_height, min_area: drop images smaller than this
+
+    Returns:
+        list: (img_index, xref, width, height) per image, in page order
+    """
+    sizes = []
+    for img_index, img in enumerate(page.get_images(full=True)):
+        xref, width, height = img[0], img[2], img[3]
+        if width < min_width or height < min_height or width * height < min_area:
+            continue
+        sizes.append((img_index, xref, width, height))
+    return sizes
+
+def load_pixmap(doc, xref):
+    """
+    Decode an embedded image as a gray or RGB pixmap (alpha kept).
+    CMYK and other colorspaces with 4+ components are converted to RGB.
+    """
+    pix = fitz.Pixmap(doc, xref)
+    if pix.n - pix.alpha >= 4:  # CMYK: convert to RGB first
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    return pix
+
+def pixmap_to_array(pix):
+    """
+    Wrap a pixmap's samples as a (height, width, n) uint8 numpy array without copying.
+
+    The array is a view of the pixmap memory, so keep the pixmap alive while using it.
+    """
+    return np.ndarray((pix.height, pix.width, pix.n), dtype=np.uint8,
+                      buffer=pix.samples_mv, strides=(pix.stride, pix.n, 1))
+
+def pixmap_to_image(pix):
+    """
+    Turn a gray/RGB pixmap (with or without alpha) into a PIL image without re-encoding.
+
+    The samples are copied once into the image. A frombuffer view would pin the pixmap's
+    samples buffer, and PyMuPDF cannot release a pixmap while that view is alive.
+    """
+    mode = PIXMAP_MODES[pix.n]
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples_mv,
+                           'raw', mode, pix.stride, 1)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Player Grammar
+Compiled, single-pass grammar for the player slide text format, shared by the PDF, PPTX
+and Keynote extractors.
+One tokenizer regex finds the field labels (Name:, Category:, Age:, Ph:), ICON markers and
+line breaks; the text between tokens is a labelled value or a bare line (name, category,
+age, phone or a "name | category | age | phone" row). Tokens are folded into player records
+as they are produced, so each page is scanned once.
+"""
+
+import re
+
+CATEGORIES = ('Batsman', 'Bowler', 'All Rounder', 'Wicket Keeper')
+
+TOKEN_PATTERN = re.compile(r'''
+      (?P<label>\b(?:Name|Category|Age|Ph)[ \t]*:)       # field label
+    | (?P<icon>\bICON\b(?:[ \t]+PLAYER\b)?)             # ICON player marker
+    | (?P<newline>\n)
+''', re.VERBOSE | re.IGNORECASE)
+
+ROW_PATTERN = re.compile(
+    r'(?P<name>[A-Za-z\s\.\-]+?)\s*\|\s*(?P<category>[A-Za-z\s]+?)\s*\|\s*(?P<age>\d+)\s*\|\s*(?P<mobile>\d+)')
+NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z\s\.\-]+$')
+AGE_PATTERN = re.compile(r'^(?P<age>\d+)\s*years?$', re.IGNORECASE)
+PHONE_PATTERN = re.compile(r'^\d{10}$')
+DIGITS_PATTERN = re.compile(r'\d+')
+SPACES_PATTERN = re.compile(r'\s+')
+
+LABEL_FIELDS = {'name': 'name', 'category': 'category', 'age': 'age', 'ph': 'mobile'}
+RECORD_FIELDS = ('name', 'category', 'age', 'mobile')
+
+def field_value(field, text):
+    """Typed value of a labelled field (digits for age and phone, collapsed spaces otherwise); None if empty."""
+    if field in ('age', 'mobile'):
+        match = DIGITS_PATTERN.search(text)
+        return match.group(0) if match else None
+    text = SPACES_PATTERN.sub(' ', text).strip()
+    return text or None
+
+def classify_line(text):
+    """
+    Classify unlabelled text.
+
+    Returns:
+        tuple: ('category' | 'age' | 'mobile' | 'candidate', value), or None
+               ('candidate' is a name-like line; it names a player only if a field follows)
+    """
+    if text in CATEGORIES:
+        return 'category', text
+    match = AGE_PATTERN.match(text)
+    if match:
+        return 'age', match.group('age')
+    if PHONE_PATTERN.match(text):
+        return 'mobile', text
+    if 2 < len(text) < 50 and NAME_PATTERN.match(text) and 'ICON' not in text.upper():
+        return 'candidate', text
+    return None
+
+def tokenize(text):
+    """
+    Yield (field, value, source) tokens in text order.
+    field is a record field, 'icon', 'candidate' or 'row' (value: the row's field dict);
+    source is 'label', 'layout' or 'row'.
+    """
+    pending = None          # field of the last label, waiting for its value
+    pending_lines = 0       # line breaks seen since that label
+    position = 0
+
+    for match in TOKEN_PATTERN.finditer(text + '\n'):
+        segment = text[position:match.start()].strip()
+        position = match.end()
+
+        if segment:
+            if pending:
+                value = field_value(pending, segment)
+                if value:
+                    yield pending, value, 'label'
+                pending = None
+            else:
+                rows = list(ROW_PATTERN.finditer(segment))
+                if rows:
+                    for row in rows:
+                        yield 'row', {field: SPACES_PATTERN.sub(' ', row.group(field)).strip()
+                                      for field in RECORD_FIELDS}, 'row'
+                else:
+                    classified = classify_line(segment)
+                    if classified:
+                        yield classified[0], classified[1], 'layout'
+
+        if match.lastgroup == 'label':
+            pending = LABEL_FIELDS[match.group('label')[:-1].strip().lower()]
+            pending_lines = 0
+        elif match.lastgroup == 'icon':
+            yield 'icon', 'Yes', 'layout'
+        elif pending:
+            # A label alone on its line takes its value from the next line
+            pending_lines += 1
+            if pending_lines > 1:
+                pending = None
+
+def parse_player_records(text):
+    """
+    Parse the players in one page/slide of text.
+
+    Returns:
+        list: One dict per player with the fields found (name, category, age, mobile as
+              strings), iconPlayer ('Yes'/'No'), 'sources' (field -> 'label', 'layout' or 'row')
+              and 'complete' (True if name, category, age and mobile were all found)
+    """
+    records = []
+    current = None
+    candidate = None
+
+    for field, value, source in tokenize(text):
+        if field == 'candidate':
+            candidate = value
+            continue
+        if field == 'row':
+            current = dict(value, iconPlayer='No', sources={f: 'row' for f in RECORD_FIELDS})
+            records.append(current)
+            candidate = None
+            continue
+        if field in ('category', 'age', 'mobile') and candidate:
+            # A bare name line directly followed by a field starts a record
+            current = {'name': candidate, 'iconPlayer': 'No', 'sources': {'name': 'layout'}}
+            records.append(current)
+        candidate = None
+
+        if field == 'name':
+            current = {'name': value, 'iconPlayer': 'No', 'sources': {'name': source}}
+            records.append(current)
+        elif current is not None:
+            if field == 'icon':
+                current['iconPlayer'] = 'Yes'
+            else:
+                current[field] = value
+                current['sources'][field] = source
+
+    for record in records:
+        record['complete'] = all(field in record for field in RECORD_FIELDS)
+    return records
@@ -10,7 +10,9 @@ import re
 from pathlib import Path
 import fitz  # PyMuPDF
 from PIL import Image, ImageOps
-import io
+from pixmap_images import page_image_sizes, load_pixmap, pixmap_to_image
+from image_asset_cache import ImageAssetCache
+from pdf_index import load_pdf_index
 
 def simple_extract_player_photos():
     """Extract player photos from each PDF page"""
@@ -39,6 +41,12 @@ def simple_extract_player_photos():
         total_pages = doc.page_count
         print(f"📄 PDF has {total_pages} pages")
         
+        # Page and image metadata from the sidecar index (the PDF is only rescanned when it changes)
+        pdf_index = load_pdf_index(pdf_path)
+        
+        # Shared index of the deck's images, so repeated slide assets are recognised once
+        image_cache = ImageAssetCache(doc, pdf_index=pdf_index)
+        
         extracted_count = 0
         failed_count = 0
         
@@ -54,7 +62,7 @@ def simple_extract_player_photos():
             print(f"\\n🔍 Processing slide {slide_num} ({i+1}/{len(players_data)}): {player['name']}")
             
             # Extract the main image from page
-            success = extract_main_image_from_page(doc, page_num, player, output_dir)
+            success = extract_main_image_from_page(doc, page_num, player, output_dir, image_cache, pdf_index)
             
             if success:
                 extracted_count += 1
@@ -77,58 +85,52 @@ def simple_extract_player_photos():
         print(f"❌ Error: {e}")
         return 0, 0
 
-def extract_main_image_from_page(doc, page_num, player, output_dir):
-    """Extract the main/largest image from a PDF page"""
+def extract_main_image_from_page(doc, page_num, player, output_dir, image_cache=None, pdf_index=None):
+    """
+    Extract the main/largest image from a PDF page.
+    With an ImageAssetCache, images repeated across slides (backgrounds, logos) are skipped.
+    With a PdfIndex, image sizes come from the sidecar instead of the page.
+    """
     
     try:
-        page = doc[page_num]
-        
-        # Get all images on the page
-        image_list = page.get_images(full=True)
+        # Get all images on the page (sizes from the sidecar index or image metadata, nothing decoded yet)
+        image_sizes = pdf_index.page_image_sizes(page_num) if pdf_index else page_image_sizes(doc[page_num])
         
-        if not image_list:
+        if not image_sizes:
             print(f"   No images found on page {page_num + 1}")
             return False
         
-        print(f"   Found {len(image_list)} image(s) on page {page_num + 1}")
+        print(f"   Found {len(image_sizes)} image(s) on page {page_num + 1}")
         
         # Find the largest image (likely the main player photo)
-        largest_image = None
+        largest_xref = None
         largest_area = 0
         
-        for img_index, img in enumerate(image_list):
-            # Get image data
-            xref = img[0]
-            pix = fitz.Pixmap(doc, xref)
-            
+        for img_index, xref, width, height in image_sizes:
             # Calculate area
-            area = pix.width * pix.height
+            area = width * height
             
-            print(f"   Image {img_index + 1}: {pix.width}x{pix.height} (area: {area})")
+            print(f"   Image {img_index + 1}: {width}x{height} (area: {area})")
             
             # Skip very small images (likely icons or decorative elements)
             if area < 10000:  # Less than 100x100 pixels
-                pix = None
+                continue
+            
+            # Skip repeated slide assets (backgrounds, logos, decorations)
+            if image_cache and image_cache.is_decoration(xref):
+                print(f"   Image {img_index + 1}: repeated slide asset, skipped")
                 continue
             
             # Keep track of the largest image
             if area > largest_area:
-                if largest_image:
-                    largest_image.close()  # Close previous image
-                
-                # Convert to PIL Image
-                if pix.n - pix.alpha < 4:  # GRAY or RGB
-                    img_data = pix.tobytes("png")
-                    largest_image = Image.open(io.BytesIO(img_data))
-                else:  # CMYK: convert to RGB first
-                    pix1 = fitz.Pixmap(fitz.csRGB, pix)
-                    img_data = pix1.tobytes("png")
-                    largest_image = Image.open(io.BytesIO(img_data))
-                    pix1 = None
-                
+                largest_xref = xref
                 largest_area = area
-            
-            pix = None
+        
+        # Decode only the largest image, straight from the pixmap samples
+        largest_image = None
+        if largest_xref is not None:
+            pix = image_cache.pixmap(largest_xref) if image_cache else load_pixmap(doc, largest_xref)
+            largest_image = pixmap_to_image(pix)
         
         if largest_image:
             # Apply smart cropping to focus on the player
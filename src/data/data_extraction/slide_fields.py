@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Slide Fields
+Layout-aware extraction of player records from a slide's words (page.get_text("words")).
+Each field is located by its label anchor ("Name:", "Category:", "Age:", "Ph:"); the value is
+the rest of the label's line, or the nearest text to the right of the label on the same
+baseline when the value sits in its own text box. Slides without labels are read from their
+layout: a name line followed by category, age or phone lines.
+One pass over the page's lines, no look-ahead windows or retries; values are typed and
+bare lines classified by the shared player grammar.
+"""
+
+from player_grammar import field_value, classify_line
+
+# Label word -> record field
+FIELD_LABELS = {
+    'Name:': 'name',
+    'Category:': 'category',
+    'Age:': 'age',
+    'Ph:': 'mobile',
+}
+
+def word_lines(words):
+    """
+    Group words into text lines, in PyMuPDF's reading order.
+
+    Args:
+        words: page.get_text("words") tuples (x0, y0, x1, y1, text, block_no, line_no, ...)
+
+    Returns:
+        list: dicts with 'bbox' [x0, y0, x1, y1] and 'words' [(x0, y0, x1, y1, text), ...]
+    """
+    lines = {}
+    for word in words:
+        x0, y0, x1, y1, text, block_no, line_no = word[:7]
+        line = lines.get((block_no, line_no))
+        if line is None:
+            line = lines[(block_no, line_no)] = {'bbox': [x0, y0, x1, y1], 'words': []}
+        else:
+            bbox = line['bbox']
+            bbox[0], bbox[1] = min(bbox[0], x0), min(bbox[1], y0)
+            bbox[2], bbox[3] = max(bbox[2], x1), max(bbox[3], y1)
+        line['words'].append((x0, y0, x1, y1, text))
+    return list(lines.values())
+
+def _line_text(words):
+    return ' '.join(word[4] for word in words)
+
+def _label_of(line):
+    """(field, label word, value words) if the line starts with a field label, else None."""
+    first = line['words'][0]
+    for label, field in FIELD_LABELS.items():
+        if first[4].startswith(label):
+            # "Name:Value" written without a space keeps its value in the label word
+            rest = first[4][len(label):]
+            value = ([(first[0], first[1], first[2], first[3], rest)] if rest else []) + line['words'][1:]
+            return field, first, value
+    return None
+
+def baseline_buckets(lines):
+    """
+    Index lines by the rounded y of their vertical centre.
+
+    Returns:
+        dict: rounded centre y -> line indices, in reading order
+    """
+    buckets = {}
+    for index, line in enumerate(lines):
+        _, by0, _, by1 = line['bbox']
+        buckets.setdefault(round((by0 + by1) / 2), []).append(index)
+    return buckets
+
+def _value_to_the_right(lines, buckets, index, label_word, used):
+    """Nearest unused line right of a label whose vertical centre falls within the label's height."""
+    _, y0, x1, y1, _ = label_word
+    best = None
+    # round() is monotonic, so every centre within [y0, y1] sits in one of these buckets
+    for key in range(round(y0), round(y1) + 1):
+        for other in buckets.get(key, ()):
+            if other == index or other in used:
+                continue
+            bx0, by0, _, by1 = lines[other]['bbox']
+            centre = (by0 + by1) / 2
+            if bx0 >= x1 and y0 <= centre <= y1 and (best is None or (bx0, other) < (lines[best]['bbox'][0], best)):
+                best = other
+    return best
+
+def extract_slide_records(words):
+    """
+    Extract the player records on one slide.
+
+    Args:
+        words: page.get_text("words") tuples (or the sidecar index's copy of them)
+
+    Returns:
+        list: One dict per player with the fields found: name, category, age, mobile
+              (strings) and iconPlayer ('Yes' if an ICON marker follows the name)
+    """
+    lines = word_lines(words)
+    buckets = baseline_buckets(lines)
+    fields = []     # (line index, field, value) in reading order
+    used = set()    # lines consumed as a value to the right of a label
+
+    for index, line in enumerate(lines):
+        if index in used:
+            continue
+        labelled = _label_of(line)
+        if labelled:
+            field, label_word, value_words = labelled
+            if not value_words:
+                right = _value_to_the_right(lines, buckets, index, label_word, used)
+                if right is not None:
+                    used.add(right)
+                    value_words = lines[right]['words']
+            value = field_value(field, _line_text(value_words))
+            if value:
+                fields.append((index, field, value))
+            continue
+
+        text = _line_text(line['words'])
+        if 'ICON' in text.upper():
+            fields.append((index, 'icon', 'Yes'))
+            continue
+        classified = classify_line(text)
+        if classified:
+            fields.append((index, *classified))
+
+    # A bare name line starts a record only when a field follows it directly
+    records = []
+    current = None
+    for position, (index, field, value) in enumerate(fields):
+        if field == 'candidate':
+            following = fields[position + 1][1] if position + 1 < len(fields) else None
+            if following not in ('category', 'age', 'mobile'):
+                continue
+            field = 'name'
+        if field == 'name':
+            current = {'name': value, 'iconPlayer': 'No'}
+            records.append(current)
+        elif current is not None:
+            if field == 'icon':
+                current['iconPlayer'] = 'Yes'
+            else:
+                current[field] = value
+    return records
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Window Scoring
+Score every sliding window of a crop heuristic at once from a summed-area table,
+instead of slicing and summing each window in a Python loop.
+A heuristic is a per-pixel score plane, window sizes/strides and a statistic
+(sum, mean, variance or standard deviation per window).
+"""
+
+import numpy as np
+
+def summed_area_table(plane):
+    """
+    Zero-padded summed-area table: [y, x] is the sum of plane[:y, :x].
+    Integer planes are summed exactly in int64, everything else in float64.
+    """
+    dtype = np.int64 if np.issubdtype(plane.dtype, np.integer) or plane.dtype == bool else np.float64
+    height, width = plane.shape
+    table = np.zeros((height + 1, width + 1), dtype=dtype)
+    np.cumsum(plane, axis=0, dtype=dtype, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+    return table
+
+def window_starts(length, margin, stride):
+    """Window start positions range(0, length - margin, stride), as an array."""
+    return np.arange(0, length - margin, stride)
+
+def window_sums(table, ys, xs, size):
+    """
+    Sum of the plane over every window [y:y+size, x:x+size], clipped at the plane edge.
+
+    Args:
+        table: summed-area table from summed_area_table()
+        ys, xs: window start rows and columns
+        size: window size
+
+    Returns:
+        tuple: (sums, areas), each of shape (len(ys), len(xs))
+    """
+    height, width = table.shape[0] - 1, table.shape[1] - 1
+    y_end = np.minimum(ys + size, height)
+    x_end = np.minimum(xs + size, width)
+    sums = (table[np.ix_(y_end, x_end)] - table[np.ix_(ys, x_end)] -
+            table[np.ix_(y_end, xs)] + table[np.ix_(ys, xs)])
+    areas = np.outer(y_end - ys, x_end - xs)
+    return sums, areas
+
+def record_windows(scores, initial=0):
+    """
+    Flat indices (in raster order) of the windows that set a new best score,
+    i.e. where a loop doing `if score > best: best = score` would update.
+    NaN scores never set a record.
+    """
+    flat = np.where(np.isnan(scores), -np.inf, scores).ravel() if scores.dtype.kind == 'f' else scores.ravel()
+    if flat.size == 0:
+        return flat.astype(np.intp)
+    running = np.maximum.accumulate(np.maximum(flat, initial))
+    previous = np.concatenate([[initial], running[:-1]])
+    return np.flatnonzero(flat > previous)
+
+def best_window_box(scores, ys, xs, make_box):
+    """
+    Crop box of the best-scoring window, picked like the original scan loops:
+    the last window that set a new best score and for which make_box(x, y) gives a box.
+
+    Returns:
+        tuple: (box, flat window index), or (None, None)
+    """
+    for index in record_windows(scores)[::-1]:
+        y, x = ys[index // len(xs)], xs[index % len(xs)]
+        box = make_box(int(x), int(y))
+        if box:
+            return box, index
+    return None, None
+
+class WindowScorer:
+    """
+    Dense window score maps of one per-pixel score plane.
+    The summed-area tables are built once and shared by every window size and statistic.
+    """
+
+    STATS = ('sum', 'mean', 'var', 'std')
+
+    def __init__(self, plane):
+        self.plane = plane
+        self.exact = np.issubdtype(plane.dtype, np.integer) or plane.dtype == bool
+        self._table = None
+        self._squares_table = None
+
+    @property
+    def table(self):
+        """Summed-area table of the plane."""
+        if self._table is None:
+            self._table = summed_area_table(self.plane)
+        return self._table
+
+    @property
+    def squares_table(self):
+        """Summed-area table of the squared plane (for variance and std)."""
+        if self._squares_table is None:
+            plane = self.plane.astype(np.int64 if self.exact else np.float64)
+            self._squares_table = summed_area_table(plane * plane)
+        return self._squares_table
+
+    def score_map(self, size, stride, margin=None, stat='mean'):
+        """
+        Score every window [y:y+size, x:x+size] (clipped at the plane edge) with
+        y in range(0, height - margin, stride) and x in range(0, width - margin, stride).
+
+        Args:
+            size: window size
+            stride: step between window starts
+            margin: stop this far before the far edge (default: size)
+            stat: 'sum', 'mean', 'var' or 'std' of the plane over each window
+
+        Returns:
+            tuple: (ys, xs, scores) with scores of shape (len(ys), len(xs))
+        """
+        if stat not in self.STATS:
+            raise ValueError(f"Unknown window statistic {stat!r}, expected one of {self.STATS}")
+        margin = size if margin is None else margin
+        height, width = self.plane.shape
+        ys = window_starts(height, margin, stride)
+        xs = window_starts(width, margin, stride)
+
+        sums, areas = window_sums(self.table, ys, xs, size)
+        if stat == 'sum':
+            return ys, xs, sums
+        if stat == 'mean':
+            return ys, xs, sums / areas
+
+        squares, _ = window_sums(self.squares_table, ys, xs, size)
+        if self.exact:
+            # Integer numerator, so equal windows get exactly equal variances
+            variance = (squares * areas - sums * sums) / (areas * areas)
+        else:
+            variance = np.maximum(squares / areas - (sums / areas) ** 2, 0)
+        return ys, xs, variance if stat == 'var' else np.sqrt(variance)
+
+    def score_maps(self, windows, stat='mean'):
+        """
+        Score maps for several window sizes at once.
+
+        Args:
+            windows: iterable of (size, stride) or (size, stride, margin)
+            stat: window statistic, see score_map()
+
+        Returns:
+            dict: (size, stride) -> (ys, xs, scores)
+        """
+        return {tuple(window[:2]): self.score_map(*window, stat=stat) for window in windows}
@@ -2,6 +2,8 @@ import { useState, useEffect } from 'react'
 import { motion, AnimatePresence } from 'framer-motion'
 import { mockTeams } from '@/data/mockData'
 import { players as playersData } from '@/data/players_data'
+import { auctionPlayers } from '@/data/auctionPlayers'
+import { PlayerPhotoSizes } from '@/types'
 import PlayerProjector from '@/components/auction/PlayerProjector'
 
 interface AuctionPlayer {
@@ -16,6 +18,7 @@ interface AuctionPlayer {
   soldPrice?: number
   status: 'available' | 'sold' | 'unsold'
   photo: string
+  photoSizes?: PlayerPhotoSizes
   teamLogo?: string
   iconPlayer: string
 }
@@ -39,6 +42,14 @@ const teamLogos = {
   'royal-challengers-bellandur': '/src/assets/images/team_logos/royal-challengers-bellandur.jpeg'
 }
 
+// Responsive photo sizes from the generated auction data, by mobile number
+const photoSizesByMobile = new Map(auctionPlayers.map(player => [player.mobile, player.photoSizes]))
+
+const getListPhotoPath = (player: AuctionPlayer) => {
+  // Use the thumbnail or list-size photo when available, else the full-size PNG
+  return player.photoSizes?.thumbnail?.src || player.photoSizes?.list?.src || player.photo
+}
+
 function AuctionPage() {
   const [selectedPlayer, setSelectedPlayer] = useState<AuctionPlayer | null>(null)
   const [bidAmount, setBidAmount] = useState<number>(0)
@@ -61,6 +72,7 @@ function AuctionPage() {
       currentBid: 0,
       status: 'available' as const,
       photo: `/src/assets/players/${player.mobile}-${player.name.replace(/[^\w\s-]/g, '').replace(/[-\s]+/g, '-').trim()}.png`,
+      photoSizes: photoSizesByMobile.get(player.mobile),
       iconPlayer: player.iconPlayer,
       teamLogo: undefined
     }))
@@ -242,7 +254,7 @@ function AuctionPage() {
                   <div className="flex items-start space-x-4">
                     <div className="w-16 h-16 rounded-full overflow-hidden bg-gray-100">
                       <img
-                        src={player.photo}
+                        src={getListPhotoPath(player)}
                         alt={player.name}
                         className="w-full h-full object-cover"
                         onError={(e) => {
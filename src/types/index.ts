@@ -193,6 +193,15 @@ export interface Sponsor {
 }
 
 // Auction Types
+export interface PlayerPhotoVariant {
+  src: string; // WebP
+  avif?: string;
+  width: number;
+  height: number;
+}
+
+export type PlayerPhotoSizes = Partial<Record<'thumbnail' | 'list' | 'projector' | 'original', PlayerPhotoVariant>>;
+
 export interface AuctionPlayer {
   id: string;
   name: string;
@@ -203,6 +212,7 @@ export interface AuctionPlayer {
   currentBid: number;
   status: 'available' | 'sold' | 'unsold';
   photo: string;
+  photoSizes?: PlayerPhotoSizes; // Responsive size ladder, see responsive_assets.py
   iconPlayer: 'Yes' | 'No';
   soldTo?: string; // Team ID
   soldPrice?: number;
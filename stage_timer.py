@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+STAGE TIMER
+Per-stage timing for the extraction pipeline (render, load, convert, mask, morphology, labelling, bounds, crop, save).
+Events can be exported as JSON Lines or in Chrome trace format (chrome://tracing, Perfetto).
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+class StageTimer:
+    """
+    Collects timed stage events, optionally tagged with the page they belong to.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.events = []
+        # Page that stages are attributed to when stage() is not given one
+        self.page = None
+        # Shared origin so events from several processes line up on one timeline
+        self.origin = time.time()
+
+    @contextmanager
+    def stage(self, name, page=None):
+        """Time the enclosed block as one stage event."""
+        if not self.enabled:
+            yield
+            return
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.events.append({
+                'stage': name,
+                'page': page if page is not None else self.page,
+                'start': start,
+                'duration': time.time() - start,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+            })
+
+    def __getstate__(self):
+        # Workers get a copy of the timer; start them with no events so nothing is double-counted
+        state = self.__dict__.copy()
+        state['events'] = []
+        return state
+
+    def take_events(self):
+        """Return the collected events and start a new list (used to ship events out of workers)."""
+        events, self.events = self.events, []
+        return events
+
+    def extend(self, events):
+        """Add events collected elsewhere, e.g. in a worker process."""
+        self.events.extend(events)
+
+    def summary(self):
+        """Total, count and mean seconds per stage, in first-seen order."""
+        totals = {}
+        for event in self.events:
+            total = totals.setdefault(event['stage'], {'total': 0.0, 'count': 0})
+            total['total'] += event['duration']
+            total['count'] += 1
+        for total in totals.values():
+            total['mean'] = total['total'] / total['count']
+        return totals
+
+    def print_summary(self):
+        """Print where the time went, largest stage first."""
+        totals = self.summary()
+        if not totals:
+            return
+        overall = sum(total['total'] for total in totals.values())
+        print("STAGE TIMINGS")
+        print("-" * 60)
+        for name, total in sorted(totals.items(), key=lambda item: -item[1]['total']):
+            print(f"{name:12s} {total['total']:8.2f}s total  {total['mean']*1000:8.1f}ms/page  "
+                  f"{total['total']/overall*100:5.1f}%")
+        print("-" * 60)
+
+    def write_jsonl(self, path):
+        """Write one JSON object per event."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for event in self.events:
+                f.write(json.dumps(dict(event, start=event['start'] - self.origin)) + "\n")
+
+    def write_chrome_trace(self, path):
+        """Write events as complete ('X') events in Chrome trace format."""
+        trace_events = []
+        for event in self.events:
+            trace_events.append({
+                'name': event['stage'],
+                'cat': 'extract',
+                'ph': 'X',
+                'ts': (event['start'] - self.origin) * 1e6,
+                'dur': event['duration'] * 1e6,
+                'pid': event['pid'],
+                'tid': event['tid'],
+                'args': {'page': event['page']},
+            })
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, f)
+
+    def write_trace(self, path):
+        """Write a .jsonl file as JSON Lines, anything else as a Chrome trace."""
+        if path.endswith('.jsonl'):
+            self.write_jsonl(path)
+        else:
+            self.write_chrome_trace(path)
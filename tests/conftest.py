@@ -0,0 +1,9 @@
+"""Make the root scripts and the data_extraction modules importable by their bare names, as the scripts import each other."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, 'src', 'data', 'data_extraction')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,18 @@
+"""Tests for the benchmark regression gate."""
+
+from benchmark_extractors import find_regressions
+
+BASE = {'seconds_per_page': 0.1, 'pages_per_second': 10.0, 'megapixels_per_second': 5.0, 'peak_mb': 8.0}
+
+def test_failure_with_a_timed_baseline_is_a_regression():
+    regressions = find_regressions({'batch': {'error': 'boom'}}, {'batch': BASE}, 0.25)
+    assert len(regressions) == 1 and 'failed (boom)' in regressions[0]
+
+def test_skipped_strategy_and_missing_entry_are_not_regressions():
+    results = {'batch': {'skipped': 'missing dependency: cv2'}, 'new': dict(BASE)}
+    assert find_regressions(results, {'batch': BASE}, 0.25) == []
+
+def test_slowdown_beyond_tolerance_is_a_regression():
+    slow = dict(BASE, seconds_per_page=0.2, pages_per_second=5.0)
+    assert find_regressions({'batch': slow}, {'batch': BASE}, 0.25)
+    assert find_regressions({'batch': BASE}, {'batch': BASE}, 0.25) == []
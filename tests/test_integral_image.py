@@ -0,0 +1,51 @@
+"""Tests for the shared vectorized subject mask of the white removers."""
+
+import numpy as np
+import pytest
+
+from integral_image import subject_mask
+from batch_extract_all_players import BatchPlayerExtractor
+from final_single_pixel_removal import FinalSinglePixelRemover
+from safe_margin_white_removal import SafeMarginWhiteRemover
+from ultra_aggressive_white_removal import UltraAggressiveWhiteRemover
+
+def _sample_image(seed=0, height=24, width=20):
+    """White page with patches of content, blue text, near-white pixels and uint8 wraparound cases."""
+    rng = np.random.default_rng(seed)
+    img = np.full((height, width, 3), 255, dtype=np.uint8)
+    img[4:14, 3:12] = rng.integers(0, 256, (10, 9, 3), dtype=np.uint8)
+    img[6:9, 5:8] = 250                              # white clothing inside the subject
+    img[16:19, 2:16] = (20, 30, 200)                 # blue text
+    img[20, :] = rng.integers(225, 256, (width, 3), dtype=np.uint8)
+    img[2, 15:19] = (230, 230, 255)                  # r + blue_threshold wraps around
+    noise = rng.random((height, width)) < 0.05
+    img[noise] = rng.integers(0, 256, (int(noise.sum()), 3), dtype=np.uint8)
+    return img
+
+def _baseline_mask(remover, img):
+    height, width = img.shape[:2]
+    mask = np.zeros((height, width), dtype=bool)
+    with np.errstate(over='ignore'):
+        for y in range(height):
+            for x in range(width):
+                mask[y, x] = remover.is_subject_pixel(img[y, x], (y, x), img)
+    return mask
+
+@pytest.mark.parametrize('remover', [
+    BatchPlayerExtractor(),
+    FinalSinglePixelRemover(),
+    SafeMarginWhiteRemover(),
+    UltraAggressiveWhiteRemover(),
+], ids=lambda remover: type(remover).__name__)
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_subject_mask_matches_per_pixel_loop(remover, seed):
+    img = _sample_image(seed)
+    expected = _baseline_mask(remover, img)
+    assert np.array_equal(remover.subject_mask(img), expected)
+
+def test_window_and_count_are_parameters():
+    img = np.full((7, 7, 3), 255, dtype=np.uint8)
+    img[1:4, 1:4] = 0   # the white pixel (4, 2) has 6 dark neighbours in its 5x5 window, 3 in its 3x3
+    assert subject_mask(img, 225, 50, window=5, min_count=4)[4, 2]
+    assert not subject_mask(img, 225, 50, window=3, min_count=4)[4, 2]
+    assert subject_mask(img, 225, 50, window=3, min_count=2)[4, 2]
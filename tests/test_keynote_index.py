@@ -0,0 +1,70 @@
+"""Tests for the streaming Keynote text index."""
+
+import io
+import xml.etree.ElementTree as ET
+
+from keynote_index import TEXT_ELEMENTS, _local_name, stream_slide_texts
+from player_grammar import parse_player_records
+
+APXL = b'''<?xml version="1.0"?>
+<key:presentation xmlns:key="http://developer.apple.com/namespaces/keynote2"
+                  xmlns:sf="http://developer.apple.com/namespaces/sf">
+  <key:slide-list>
+    <key:slide>
+      <sf:text><sf:text-storage><sf:text-body>
+        <sf:p>Name: <sf:span>John</sf:span> Doe</sf:p>
+        <sf:p>Category: Batsman</sf:p>
+        <sf:p>Age: 25 years</sf:p>
+        <sf:p>Ph: 9876543210</sf:p>
+      </sf:text-body></sf:text-storage></sf:text>
+    </key:slide>
+    <key:slide>
+      <sf:text>Loose title<sf:p>ICON PLAYER</sf:p>after the marker</sf:text>
+    </key:slide>
+  </key:slide-list>
+</key:presentation>
+'''
+
+def _itertext_slides(data):
+    """Reference: the whole-tree walk, one run per outermost text element via itertext()."""
+    slides = {}
+    def walk(elem, slide):
+        name = _local_name(elem.tag)
+        if name == 'slide':
+            slide = len(slides) + 1
+            slides[slide] = []
+        if name in TEXT_ELEMENTS:
+            text = ' '.join(''.join(elem.itertext()).split())
+            if text:
+                slides[slide].append(text)
+            return
+        for child in elem:
+            walk(child, slide)
+    walk(ET.fromstring(data), None)
+    return slides
+
+def test_paragraphs_are_separate_runs():
+    slides = stream_slide_texts(io.BytesIO(APXL))
+    assert slides[1] == ['Name: John Doe', 'Category: Batsman', 'Age: 25 years', 'Ph: 9876543210']
+    assert slides[2] == ['Loose title', 'ICON PLAYER', 'after the marker']
+
+def test_runs_follow_the_itertext_document_order():
+    streamed = stream_slide_texts(io.BytesIO(APXL))
+    reference = _itertext_slides(APXL)
+    assert streamed.keys() == reference.keys()
+    for slide, runs in reference.items():
+        # Same characters in the same order; only split into more runs (one per paragraph)
+        assert ''.join(''.join(streamed[slide]).split()) == ''.join(''.join(runs).split())
+
+def test_slide_runs_parse_as_a_complete_record():
+    slides = stream_slide_texts(io.BytesIO(APXL))
+    records = parse_player_records('\n'.join(slides[1]))
+    assert len(records) == 1
+    record = records[0]
+    assert (record['name'], record['category'], record['age'], record['mobile']) == \
+        ('John Doe', 'Batsman', '25', '9876543210')
+    assert record['complete']
+
+def test_single_slide_member_uses_default_slide_number():
+    xml = b'<root><text>Rahul Kumar</text><text>Bowler</text></root>'
+    assert stream_slide_texts(io.BytesIO(xml), default_slide=3) == {3: ['Rahul Kumar', 'Bowler']}
@@ -0,0 +1,22 @@
+"""Tests for the box-filter local moments against the generic_filter(np.var) they replace."""
+
+import numpy as np
+import pytest
+from scipy import ndimage
+
+from local_moments import local_moments, local_variance
+
+@pytest.mark.parametrize('size', [3, 15])
+def test_variance_matches_generic_filter(size):
+    rng = np.random.default_rng(size)
+    gray = rng.integers(0, 256, (40, 37)).astype(np.float64)
+    expected = ndimage.generic_filter(gray, np.var, size=size)
+    assert np.allclose(local_variance(gray, size=size), expected, rtol=1e-4, atol=1e-2)
+
+def test_moments_are_consistent():
+    rng = np.random.default_rng(0)
+    gray = rng.integers(0, 256, (30, 30)).astype(np.float64)
+    mean, variance, std = local_moments(gray, size=5)
+    assert np.allclose(mean, ndimage.generic_filter(gray, np.mean, size=5), atol=1e-3)
+    assert np.allclose(std, np.sqrt(variance))
+    assert mean.dtype == variance.dtype == std.dtype == np.float32
@@ -0,0 +1,50 @@
+"""Tests for the coarse-to-fine subject search: it must give the full-resolution result."""
+
+import numpy as np
+import pytest
+
+from benchmark_extractors import make_synthetic_page
+from batch_extract_all_players import BatchPlayerExtractor
+from safe_margin_white_removal import SafeMarginWhiteRemover
+from component_stats import largest_component_mask
+from pyramid_bounds import coarse_to_fine_mask
+
+def _left_half(seed, dpi=72):
+    page = np.asarray(make_synthetic_page(dpi=dpi, seed=seed).convert('RGB'))
+    return page[:, :page.shape[1] // 2]
+
+@pytest.mark.parametrize('scale', [4, 8])
+@pytest.mark.parametrize('seed', range(12))
+def test_batch_pyramid_bbox_matches_full_resolution(seed, scale):
+    img_array = _left_half(seed)
+    expected = BatchPlayerExtractor().detect_content_bounds(img_array)
+    assert BatchPlayerExtractor(pyramid_scale=scale).detect_content_bounds(img_array) == expected
+
+@pytest.mark.parametrize('scale', [4, 8])
+@pytest.mark.parametrize('seed', [0, 7, 8])
+def test_safe_margin_pyramid_bbox_matches_full_resolution(seed, scale):
+    img_array = _left_half(seed)
+    expected = SafeMarginWhiteRemover().detect_content_bounds(img_array)
+    assert SafeMarginWhiteRemover(pyramid_scale=scale).detect_content_bounds(img_array) == expected
+
+@pytest.mark.parametrize('scale', [4, 8])
+def test_subject_off_the_coarse_grid_is_found(scale):
+    # A lattice of 3 pixel bars that avoids every 4th/8th row and column, next to a small block
+    img_array = np.full((240, 240, 3), 255, dtype=np.uint8)
+    img_array[8:32, 200:224] = 0
+    offsets = np.arange(240) % 8
+    bars = (offsets >= 1) & (offsets <= 3)
+    img_array[64:233, 0:161][bars[64:233, None] | bars[None, 0:161]] = 0
+    expected = BatchPlayerExtractor().detect_content_bounds(img_array)
+    assert expected == (63, 233, 0, 161)
+    assert BatchPlayerExtractor(pyramid_scale=scale).detect_content_bounds(img_array) == expected
+
+@pytest.mark.parametrize('factor', [2, 4, 8])
+def test_random_masks_match_full_resolution(factor):
+    clean = BatchPlayerExtractor().clean_content_mask
+    rng = np.random.default_rng(factor)
+    for _ in range(100):
+        height, width = rng.integers(5, 60, size=2)
+        raw = rng.random((height, width)) < rng.uniform(0.05, 0.7)
+        expected = largest_component_mask(clean(raw))
+        assert np.array_equal(coarse_to_fine_mask(raw, factor, clean), expected)
@@ -0,0 +1,46 @@
+"""Tests for the baseline-bucketed lookup of values to the right of a label."""
+
+import random
+
+import pytest
+
+from slide_fields import word_lines, baseline_buckets, _value_to_the_right
+
+def _scan_all_lines(lines, index, label_word, used):
+    """The full scan over every line that the buckets replace."""
+    _, y0, x1, y1, _ = label_word
+    best = None
+    for other, line in enumerate(lines):
+        if other == index or other in used:
+            continue
+        bx0, by0, _, by1 = line['bbox']
+        centre = (by0 + by1) / 2
+        if bx0 >= x1 and y0 <= centre <= y1 and (best is None or bx0 < lines[best]['bbox'][0]):
+            best = other
+    return best
+
+def test_value_on_the_same_baseline():
+    words = [
+        (10, 20, 40, 32, 'Age:', 0, 0),
+        (200, 21, 220, 31, '35', 2, 0),
+        (60, 20.5, 80, 31.5, '29', 1, 0),
+        (60, 40, 80, 52, '41', 3, 0),
+    ]
+    lines = word_lines(words)
+    assert _value_to_the_right(lines, baseline_buckets(lines), 0, lines[0]['words'][0], set()) == 2
+
+@pytest.mark.parametrize('seed', range(20))
+def test_matches_full_scan(seed):
+    rng = random.Random(seed)
+    words = []
+    for block in range(30):
+        x0 = rng.choice([10, 60, 60.5, 200])
+        y0 = rng.choice([20, 20.5, 21.5, 40]) + rng.random() * 4
+        words.append((x0, y0, x0 + 30, y0 + rng.choice([6, 12]), 'w', block, 0))
+    lines = word_lines(words)
+    buckets = baseline_buckets(lines)
+    used = set(rng.sample(range(len(lines)), 5))
+    for index, line in enumerate(lines):
+        label_word = line['words'][0]
+        assert (_value_to_the_right(lines, buckets, index, label_word, used)
+                == _scan_all_lines(lines, index, label_word, used))
@@ -10,6 +10,8 @@ import sys
 from PIL import Image, ImageOps, ImageFilter, ImageEnhance
 import numpy as np
 from scipy import ndimage
+from integral_image import subject_mask
+from feature_planes import FeaturePlanes
 
 class UltraAggressiveWhiteRemover:
     """
@@ -77,39 +79,31 @@ class UltraAggressiveWhiteRemover:
         # Everything else is subject
         return True
     
-    def detect_edges_ultra_precise(self, img_array):
+    def subject_mask(self, img_array):
+        """Vectorized is_subject_pixel over the whole image."""
+        return subject_mask(img_array, self.white_threshold, self.blue_threshold,
+                            window=3, min_count=2)
+    
+    def detect_edges_ultra_precise(self, img_array, planes=None):
         """Ultra-precise edge detection for white space trimming."""
-        gray = np.mean(img_array, axis=2)
-        
-        # Multiple edge detection methods
-        sobel_x = ndimage.sobel(gray, axis=1)
-        sobel_y = ndimage.sobel(gray, axis=0)
-        sobel_magnitude = np.sqrt(sobel_x**2 + sobel_y**2)
-        
-        # Laplacian
-        laplacian = ndimage.laplace(gray)
+        planes = planes or FeaturePlanes(img_array)
         
-        # Prewitt
-        prewitt_x = ndimage.prewitt(gray, axis=1)
-        prewitt_y = ndimage.prewitt(gray, axis=0)
-        prewitt_magnitude = np.sqrt(prewitt_x**2 + prewitt_y**2)
-        
-        # Combine all methods
-        edge_threshold = np.percentile(sobel_magnitude, 70)  # More aggressive
+        # Combine Sobel, Laplacian and Prewitt
+        edge_threshold = planes.percentile('sobel_magnitude', 70)  # More aggressive
         edge_mask = (
-            (sobel_magnitude > edge_threshold) |
-            (np.abs(laplacian) > np.percentile(np.abs(laplacian), 60)) |
-            (prewitt_magnitude > np.percentile(prewitt_magnitude, 70))
+            (planes.sobel_magnitude > edge_threshold) |
+            (planes.abs_laplacian > planes.percentile('abs_laplacian', 60)) |
+            (planes.prewitt_magnitude > planes.percentile('prewitt_magnitude', 70))
         )
         
         return edge_mask
     
-    def trim_white_edges_aggressive(self, img_array, content_mask):
+    def trim_white_edges_aggressive(self, img_array, content_mask, planes=None):
         """Aggressively trim white edges using edge detection."""
         height, width = img_array.shape[:2]
         
         # Find edges
-        edge_mask = self.detect_edges_ultra_precise(img_array)
+        edge_mask = self.detect_edges_ultra_precise(img_array, planes)
         
         # Combine content mask with edge mask
         combined_mask = content_mask | edge_mask
@@ -128,13 +122,7 @@ class UltraAggressiveWhiteRemover:
         print("  - Performing ultra-aggressive white space removal...")
         
         # Create initial content mask
-        content_mask = np.zeros((height, width), dtype=bool)
-        
-        # Scan every pixel
-        for y in range(height):
-            for x in range(width):
-                if self.is_subject_pixel(img_array[y, x], (y, x), img_array):
-                    content_mask[y, x] = True
+        content_mask = self.subject_mask(img_array)
         
         # Apply edge-based trimming
         content_mask = self.trim_white_edges_aggressive(img_array, content_mask)